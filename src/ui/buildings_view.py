@@ -22,13 +22,23 @@ Key Functions:
 """
 
 import configparser
+import copy
+import functools
+import heapq
 import json
 import logging
+import marshal
+import math
+import os
 import shutil
+import time
 import xml.etree.ElementTree as ET
+from tkinter import EventType, ttk
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
 import customtkinter as ctk
 from PIL import Image, ImageDraw
@@ -38,8 +48,21 @@ from src.config import (
     get_default_changesecrets_dir,
 )
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Application icon for dialogs, resolved once at import as a plain string for Tk
+_APP_ICON = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "assets", "icons", "application icons", "app_icon.ico",
+)
+_HAS_APP_ICON = os.path.isfile(_APP_ICON)
+
 
 # =============================================================================
 # JSON TYPE CONSTANTS
@@ -141,6 +164,89 @@ FIELD_DESCRIPTIONS = {
 # UI HELPER CLASSES
 # =============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _font(size: Optional[int] = None, weight: Optional[str] = None) -> ctk.CTkFont:
+    """Return a shared CTkFont for the given size/weight (theme defaults when None)."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+@dataclass(slots=True)
+class _FormHeaderRefs:
+    """Widgets of the fixed form header (built on first use)."""
+
+    frame: ctk.CTkFrame
+    title: ctk.CTkLabel
+    author: ctk.CTkLabel
+    description: ctk.CTkLabel
+    eye_btn: ctk.CTkLabel
+
+
+@dataclass(slots=True)
+class _FormFooterRefs:
+    """Widgets of the fixed form footer (built on first use)."""
+
+    frame: ctk.CTkFrame
+    revert_btn: ctk.CTkButton
+    save_btn: ctk.CTkButton
+
+
+@dataclass(slots=True)
+class _SecretsRowRefs:
+    """Widgets of one Secrets list row (pooled and reused across repopulates)."""
+
+    frame: ctk.CTkFrame
+    checkbox: ctk.CTkCheckBox
+    label: ctk.CTkLabel
+    eye: ctk.CTkLabel
+
+
+@dataclass(slots=True)
+class _FormFieldRefs:
+    """Widgets of one label + entry form row (pooled and reused across renders)."""
+
+    frame: ctk.CTkFrame
+    label: ctk.CTkLabel
+    entry: ctk.CTkEntry
+    tooltip: "FieldTooltip"
+    var: ctk.StringVar
+    style: tuple[int, bool]  # (width, readonly) the entry is configured for
+
+
+@dataclass(slots=True)
+class _SectionHeaderRefs:
+    """Widgets of one form section header (pooled and reused across renders)."""
+
+    frame: ctk.CTkFrame
+    label: ctk.CTkLabel
+    separator: ctk.CTkFrame
+
+
+@dataclass(slots=True)
+class _CollapsibleSection:
+    """State of one form subsection whose fields are built on first expand."""
+
+    title: str
+    builder: Callable[[], None]
+    toggle: ctk.CTkButton | None = None
+    # (widget, pack options) in display order, once the builder has run
+    packed: list[tuple] | None = None
+    expanded: bool = False
+
+
+class _LazyFormVars(dict):
+    """Form variable dict that creates a Tk variable on first lookup of a missing name.
+
+    Boolean-style property names (bOnWall, bAllowRefunds, ...) get a BooleanVar,
+    everything else a StringVar. Membership tests and .get() do not create anything.
+    """
+
+    def __missing__(self, name: str):
+        is_bool = len(name) > 1 and name[0] == "b" and name[1].isupper()
+        var = ctk.BooleanVar() if is_bool else ctk.StringVar()
+        self[name] = var
+        return var
+
+
 class FieldTooltip:
     """Hover tooltip for form field labels.
 
@@ -165,9 +271,15 @@ class FieldTooltip:
         widget.bind("<Leave>", self._on_leave)
 
     def _on_enter(self, _event):
+        if not self.text:
+            return
         self.scheduled_id = self.widget.after(self.delay, self._show_tooltip)
 
     def _on_leave(self, _event):
+        self.cancel()
+
+    def cancel(self):
+        """Cancel a pending tooltip and hide one that is showing."""
         if self.scheduled_id:
             self.widget.after_cancel(self.scheduled_id)
             self.scheduled_id = None
@@ -193,7 +305,7 @@ class FieldTooltip:
         label = ctk.CTkLabel(
             frame,
             text=self.text,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=("#333333", "#e0e0e0"),
             wraplength=300,
             justify="left"
@@ -214,67 +326,264 @@ class FieldTooltip:
 # extended by scanning existing .def files and DT_ConstructionRecipes.json
 # to include all values found in the game data.
 
-DEFAULT_BUILD_PROCESS = ["EBuildProcess::DualMode", "EBuildProcess::SingleMode"]
-DEFAULT_LOCATION = [
+DEFAULT_BUILD_PROCESS = ("EBuildProcess::DualMode", "EBuildProcess::SingleMode")
+DEFAULT_LOCATION = (
     "EConstructionLocation::Base",
     "EConstructionLocation::Anywhere",
     "EConstructionLocation::Underground",
-]
-DEFAULT_PLACEMENT = ["EPlacementType::SnapGrid", "EPlacementType::FreePlacement"]
-DEFAULT_FOUNDATION_RULE = ["EFoundationRule::Never", "EFoundationRule::Always", "EFoundationRule::Optional"]
-DEFAULT_MONUMENT_TYPE = ["EMonumentType::None", "EMonumentType::Small", "EMonumentType::Medium", "EMonumentType::Large"]
-DEFAULT_ENABLED_STATE = ["ERowEnabledState::Live", "ERowEnabledState::Disabled", "ERowEnabledState::Testing"]
-DEFAULT_UNLOCK_TYPE = [
+)
+DEFAULT_PLACEMENT = ("EPlacementType::SnapGrid", "EPlacementType::FreePlacement")
+DEFAULT_FOUNDATION_RULE = ("EFoundationRule::Never", "EFoundationRule::Always", "EFoundationRule::Optional")
+DEFAULT_MONUMENT_TYPE = ("EMonumentType::None", "EMonumentType::Small", "EMonumentType::Medium", "EMonumentType::Large")
+DEFAULT_ENABLED_STATE = ("ERowEnabledState::Live", "ERowEnabledState::Disabled", "ERowEnabledState::Testing")
+DEFAULT_PORTABILITY = (
+    "EItemPortability::Storable",
+    "EItemPortability::NotStorable",
+    "EItemPortability::Holdable",
+)
+DEFAULT_FLORA_TYPE = (
+    "EMorFarmingFloraType::Flora",
+    "EMorFarmingFloraType::Fungus",
+    "EMorFarmingFloraType::Tree",
+    "EMorFarmingFloraType::Crop",
+)
+DEFAULT_FLORA_GROWTH_RATE = (
+    "EMorFarmingFloraGrowthRate::None",
+    "EMorFarmingFloraGrowthRate::Slow",
+    "EMorFarmingFloraGrowthRate::Medium",
+    "EMorFarmingFloraGrowthRate::Fast",
+)
+DEFAULT_UNLOCK_TYPE = (
     "EMorRecipeUnlockType::Manual",
     "EMorRecipeUnlockType::DiscoverDependencies",
     "EMorRecipeUnlockType::Automatic",
     "EMorRecipeUnlockType::Never",
-]
+)
+
+# Construction recipe placement checkboxes, one tuple per form row
+_PLACEMENT_BOOL_ROWS = (
+    ("bOnWall", "bOnFloor", "bPlaceOnWater", "bOverrideRotation"),
+    ("bAllowRefunds", "bAutoFoundation", "bInheritAutoFoundationStability", "bOnlyOnVoxel"),
+    ("bIsBlockedByNearbySettlementStones", "bIsBlockedByNearbyRavenConstructions"),
+)
+
+# (form_vars key, label) for the inventory row shared by the item-type forms
+_INVENTORY_STAT_SPECS = (
+    ("MaxStackSize", "Max Stack"),
+    ("SlotSize", "Slot Size"),
+    ("BaseTradeValue", "Trade Value"),
+)
+
+# Flora "Growth Timing" text fields: (form_vars key, label)
+_FLORA_GROWTH_TIMING_FIELDS = (
+    ("NumToGrowPerCycle", "Grow Per Cycle"),
+    ("RegrowthSleepCount", "Regrowth Sleep Count"),
+    ("TimeUntilGrowingStage", "Time Until Growing"),
+    ("TimeUntilReadyStage", "Time Until Ready"),
+    ("TimeUntilSpoiledStage", "Time Until Spoiled"),
+    ("MinVariableGrowthTime", "Min Variable Growth"),
+    ("MaxVariableGrowthTime", "Max Variable Growth"),
+)
+_FLORA_BOOL_FIELDS = ("bPrefersInShade", "bCanSpoil", "IsPlantable", "IsFungus")
+
+# Form fields whose comma-separated values feed the autocomplete index: (field, key)
+_AUTOCOMPLETE_FIELD_KEYS = (
+    ("ResultConstructionHandle", "ResultConstructions"),
+    ("ResultItemHandle", "AllValues"),
+    ("DefaultRequiredConstructions", "Constructions"),
+    ("SandboxRequiredConstructions", "Constructions"),
+    ("Actor", "Actors"),
+    ("BackwardCompatibilityActors", "Actors"),
+    ("ReceptacleActorToSpawn", "Actors"),
+    ("DamageType", "DamageTypes"),
+    ("ItemRowHandle", "AllValues"),
+    ("OverrideItemDropHandle", "AllValues"),
+    ("ItemHandle", "AllValues"),
+    ("RequiredTags", "LootTags"),
+)
+
+# Shared CTkButton color presets (fonts are passed separately: CTkFont needs a Tk root)
+_RED_BTN = {"fg_color": "#F44336", "hover_color": "#D32F2F", "text_color": "white"}
+_GREEN_BTN = {"fg_color": "#4CAF50", "hover_color": "#388E3C", "text_color": "white"}
+_BLUE_BTN = {"fg_color": "#2196F3", "hover_color": "#1976D2", "text_color": "white"}
+# Form "add"/save buttons keep the theme's default text color
+_FORM_GREEN_BTN = {"fg_color": "#4CAF50", "hover_color": "#45a049"}
+# Light/dark color pairs shared by widgets created once per form row
+_MATERIAL_ROW_BG = ("gray85", "gray20")
+# Text entry state and text color, indexed by the field's readonly flag
+_ENTRY_STATES = ("normal", "disabled")
+_ENTRY_TEXT_COLORS = (("gray10", "gray90"), ("gray50", "gray60"))
+# Placeholder values for a dropdown with no options (shared: never modify it)
+_NO_OPTIONS = ["(none)"]
+
+# Left-pane category buttons, one tuple per row: (text, fg_color, hover_color, loader method)
+_CATEGORY_BUTTON_ROWS = (
+    (
+        ("Buildings", "#2196F3", "#1976D2", "_load_secrets_buildings"),
+        ("Weapons", "#9C27B0", "#7B1FA2", "_load_secrets_weapons"),
+        ("Armor", "#FF9800", "#F57C00", "_load_secrets_armor"),
+    ),
+    (
+        ("Tools", "#00897B", "#00695C", "_load_secrets_tools"),
+        ("Flora", "#43A047", "#2E7D32", "_load_secrets_flora"),
+    ),
+    (
+        ("Loot", "#E53935", "#C62828", "_load_secrets_loot"),
+        ("Items", "#5C6BC0", "#3949AB", "_load_secrets_items"),
+    ),
+)
+
+# Delay after the last keystroke before the definitions list is filtered
+SEARCH_DEBOUNCE_MS = 120
+
+# Delay used to coalesce bursts of list refresh requests into one rescan
+REFRESH_DEBOUNCE_MS = 75
+
+# Tk bind tags shared by every Secrets list row (bound once via bind_class)
+SECRETS_ROW_TAG = "MoriaSecretsRow"
+SECRETS_LABEL_TAG = "MoriaSecretsLabel"
+
+# Default text color of a Secrets list label (not hovered or selected)
+SECRETS_LABEL_COLOR = ("gray10", "#E8E8E8")
 
 # Cache filename for storing scanned dropdown options
 CACHE_FILENAME = "buildings_cache.ini"
 
+# INI section holding the source mtimes the cached options were built from
+CACHE_SIGNATURE_SECTION = "__signature__"
+
+# Single background worker for blocking file scans (keeps the Tk loop responsive)
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="buildings-io")
+
+# Cached table file names per view mode (flora and loot have no recipes)
+_CACHE_RECIPES_FILES = {
+    'buildings': 'DT_ConstructionRecipes.json',
+    'weapons': 'DT_ItemRecipes.json',
+    'armor': 'DT_ItemRecipes.json',
+    'tools': 'DT_ItemRecipes.json',
+    'items': 'DT_ItemRecipes.json',
+}
+_CACHE_DEFS_FILES = {
+    'buildings': 'DT_Constructions.json',
+    'weapons': 'DT_Weapons.json',
+    'armor': 'DT_Armor.json',
+    'tools': 'DT_Tools.json',
+    'items': 'DT_Items.json',
+    'flora': 'DT_Moria_Flora.json',
+    'loot': 'DT_Loot.json',
+}
+
+# Pauses (seconds) between os.replace attempts while a file is held open by
+# another reader; the last attempt after them raises
+_REPLACE_RETRY_DELAYS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.4)
+
+# Characters not allowed in a change secrets prefix (used as a directory name)
+_INVALID_PREFIX_CHARS = frozenset('<>:"/\\|?*')
+
+# Change secrets prefix listings keyed by directory, validated against st_mtime_ns
+_prefix_cache: dict[Path, tuple[int, list[str]]] = {}
+
+# Parsed DataTable JSON files keyed by path and validated against
+# (st_mtime_ns, st_size), with each document's row Name -> Table.Data index.
+# Bounded so switching between view modes does not keep every table alive.
+_TABLE_DOCS_CACHE_SIZE = 4
+_table_docs_cache: dict[Path, tuple[tuple[int, int], dict, dict[str, int]]] = {}
+
+
+def _table_rows(data: dict) -> list:
+    """Return the Table.Data rows of a parsed DataTable document."""
+    exports = data.get('Exports', [])
+    if not exports:
+        return []
+    return exports[0].get('Table', {}).get('Data', [])
+
+
+def _remember_table_doc(json_path: Path, data: dict, row_index: dict[str, int]):
+    """Keep a parsed DataTable document for the file as it is now on disk."""
+    stat = os.stat(json_path)
+    _table_docs_cache.pop(json_path, None)
+    _table_docs_cache[json_path] = ((stat.st_mtime_ns, stat.st_size), data, row_index)
+    while len(_table_docs_cache) > _TABLE_DOCS_CACHE_SIZE:
+        del _table_docs_cache[next(iter(_table_docs_cache))]
+
+
+def _load_table_doc(json_path: Path) -> tuple[dict, dict[str, int]]:
+    """Parse a DataTable JSON file, reusing the last parse while it is unchanged.
+
+    The returned document is shared with later callers, so it must not be
+    modified unless it is written back to json_path right away.
+
+    Args:
+        json_path: Path to the JSON file
+
+    Returns:
+        Tuple of (document, row Name -> Table.Data index). The first row
+        wins for a duplicated Name.
+    """
+    stat = os.stat(json_path)
+    cached = _table_docs_cache.get(json_path)
+    if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        _, data, row_index = cached
+    else:
+        data = _load_json_file(json_path)
+        row_index = {}
+        for i, row in enumerate(_table_rows(data)):
+            row_index.setdefault(row.get('Name'), i)
+    _remember_table_doc(json_path, data, row_index)
+    return data, row_index
+
+
+def _save_table_doc(json_path: Path, data: dict, row_index: dict[str, int]):
+    """Write a document from _load_table_doc back to json_path and keep it.
+
+    Every writer of a cache table goes through here, so the kept document
+    never falls behind the file even when its (mtime, size) would not change.
+    """
+    try:
+        _write_if_changed(json_path, _dump_json_indented(data))
+    except OSError:
+        # The kept document no longer matches the file
+        _table_docs_cache.pop(json_path, None)
+        raise
+    _remember_table_doc(json_path, data, row_index)
+
 
 # =============================================================================
 # JSON SCANNING AND CACHING FUNCTIONS
 # =============================================================================
 
 
+def _game_construction_json_paths() -> list[Path]:
+    """Return the DT_ConstructionRecipes/DT_Constructions JSON paths that feed the option scan.
+
+    Recipes come first, then constructions, each from output/jsondata and
+    Secrets Source/jsondata.
+    """
+    building_subpath = Path('Moria') / 'Content' / 'Tech' / 'Data' / 'Building'
+    roots = (get_appdata_dir() / 'output' / 'jsondata', get_appdata_dir() / 'Secrets Source' / 'jsondata')
+    return [
+        root / building_subpath / filename
+        for filename in ('DT_ConstructionRecipes.json', 'DT_Constructions.json')
+        for root in roots
+    ]
+
+
 def _scan_construction_recipes_json() -> dict:
     """Scan DT_ConstructionRecipes.json for construction names and other values.
 
-    Scans both output/jsondata and Secrets Source/jsondata paths.
+    Scans both output/jsondata and Secrets Source/jsondata paths, plus
+    DT_Constructions.json for Actors.
     Returns a dict with categories -> set of values.
     """
     collected = defaultdict(set)
 
-    # Check both output and Secrets Source paths
-    building_subpath = Path('Moria') / 'Content' / 'Tech' / 'Data' / 'Building'
-    candidate_paths = [
-        get_appdata_dir() / 'output' / 'jsondata' / building_subpath / 'DT_ConstructionRecipes.json',
-        get_appdata_dir() / 'Secrets Source' / 'jsondata' / building_subpath / 'DT_ConstructionRecipes.json',
-    ]
-
-    for recipes_path in candidate_paths:
-        if not recipes_path.exists():
-            continue
-        try:
-            _scan_namemap_from_json(recipes_path, collected)
-        except (json.JSONDecodeError, OSError, KeyError) as e:
-            logger.error("Error scanning %s: %s", recipes_path.name, e)
-
-    # Also scan DT_Constructions.json for Actors
-    constructions_paths = [
-        get_appdata_dir() / 'output' / 'jsondata' / building_subpath / 'DT_Constructions.json',
-        get_appdata_dir() / 'Secrets Source' / 'jsondata' / building_subpath / 'DT_Constructions.json',
-    ]
-    for constr_path in constructions_paths:
-        if not constr_path.exists():
+    for json_path in _game_construction_json_paths():
+        if not json_path.exists():
             continue
         try:
-            _scan_namemap_from_json(constr_path, collected)
+            _scan_namemap_from_json(json_path, collected)
         except (json.JSONDecodeError, OSError, KeyError) as e:
-            logger.error("Error scanning %s: %s", constr_path.name, e)
+            logger.error("Error scanning %s: %s", json_path.name, e)
 
     if collected:
         logger.info("Scanned JSON files: found %s values", sum(len(v) for v in collected.values()))
@@ -282,6 +591,20 @@ def _scan_construction_recipes_json() -> dict:
     return {k: sorted(v) for k, v in collected.items()}
 
 
+def _options_source_signature(buildings_dir: Path) -> str:
+    """Build a cache key from the mtimes of every source the option scan reads.
+
+    Missing sources contribute 0, so creating or deleting one also changes the key.
+    """
+    mtimes = []
+    for path in (buildings_dir, *_game_construction_json_paths()):
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return ":".join(str(m) for m in mtimes)
+
+
 def _scan_namemap_from_json(json_path: Path, collected: dict):
     """Extract categorized values from a JSON file's NameMap.
 
@@ -289,8 +612,7 @@ def _scan_namemap_from_json(json_path: Path, collected: dict):
         json_path: Path to the JSON file
         collected: defaultdict(set) to add values to
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = _load_json_file(json_path)
 
     name_map = data.get('NameMap', [])
 
@@ -346,6 +668,522 @@ def _scan_namemap_from_json(json_path: Path, collected: dict):
                 collected['Constructions'].add(name)
 
 
+def _merge_sorted_unique(existing: list[str], values: list[str]) -> list[str]:
+    """Merge two sorted option lists into one sorted list without duplicates.
+
+    Both inputs must already be sorted (every scanner and the INI cache sort
+    their values), so this is a linear heapq.merge instead of a set + sort.
+    """
+    merged = []
+    for value in heapq.merge(existing, values):
+        if not merged or merged[-1] != value:
+            merged.append(value)
+    return merged
+
+
+# Property kinds for the row diff, checked in order against a UAssetAPI $type
+_PROPERTY_KIND_TOKENS = (
+    ('BoolPropertyData', 'scalar'),
+    ('IntPropertyData', 'scalar'),
+    ('FloatPropertyData', 'scalar'),
+    ('EnumPropertyData', 'scalar'),
+    ('NamePropertyData', 'scalar'),
+    ('TextPropertyData', 'text'),
+    ('SoftObjectPropertyData', 'softobj'),
+    ('StructPropertyData', 'struct'),
+    ('ArrayPropertyData', 'array'),
+)
+_PROPERTY_KINDS = dict(_PROPERTY_KIND_TOKENS)
+
+
+class _NonFiniteFloat(float):
+    """A NaN or Infinity value read from (or bound for) a JSON file.
+
+    orjson writes non-finite floats as null but refuses float subclasses, so
+    documents holding these values are serialized by json, which keeps the
+    NaN / Infinity / -Infinity literals.
+    """
+
+    __slots__ = ()
+
+
+def _parse_form_float(text: str) -> float:
+    """Convert a form entry to a float, marking NaN/Infinity as _NonFiniteFloat."""
+    value = float(text)
+    return value if math.isfinite(value) else _NonFiniteFloat(value)
+
+
+# Form value conversion per scalar property class (None keeps the var's value)
+_FORM_VALUE_CONVERTERS = {
+    'BoolPropertyData': None,
+    'EnumPropertyData': None,
+    'TextPropertyData': None,
+    'FloatPropertyData': _parse_form_float,
+    'IntPropertyData': int,
+    'BytePropertyData': int,
+}
+
+# Definition properties saved from something other than the form field of
+# the same name (Def_EnabledState, the material rows)
+_FORMLESS_DEFINITION_PROPS = frozenset({"EnabledState", "InitialRepairCost"})
+
+
+@functools.lru_cache(maxsize=None)
+def _property_class(prop_type: str) -> str:
+    """Return the class name of a UAssetAPI $type string.
+
+    "UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI" gives
+    "BoolPropertyData". Tables only use a handful of distinct $type strings,
+    so each is split once.
+    """
+    return prop_type.split(',', 1)[0].rsplit('.', 1)[-1]
+
+
+@functools.lru_cache(maxsize=None)
+def _property_kind(prop_type: str) -> str:
+    """Classify a property $type string for the row diff ('other' if unknown).
+
+    "UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI" is looked up
+    by its class name; anything else falls back to scanning for the tokens.
+    Tables only use a handful of distinct $type strings, so each is classified once.
+    """
+    kind = _PROPERTY_KINDS.get(_property_class(prop_type))
+    if kind is not None:
+        return kind
+    for token, kind in _PROPERTY_KIND_TOKENS:
+        if token in prop_type:
+            return kind
+    return 'other'
+
+
+def _deep_eq(a, b) -> bool:
+    """Structurally compare two JSON-compatible values.
+
+    Matches what comparing key-sorted json.dumps output would decide (so 1,
+    1.0 and True stay distinct). Identical containers are settled in C by
+    comparing their marshal encodings; only a mismatch (a real change or just
+    a different key order) falls back to the Python walk.
+    """
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (dict, list)):
+        if len(a) != len(b):
+            return False
+        # Version 2 has no back-references, so equal values encode identically
+        try:
+            if marshal.dumps(a, 2) == marshal.dumps(b, 2):
+                return True
+        except ValueError:
+            pass  # holds a _NonFiniteFloat, which marshal cannot encode
+        return _deep_eq_walk(a, b)
+    return a == b or (a != a and b != b)
+
+
+def _deep_eq_walk(a, b) -> bool:
+    """Recursive, type-strict comparison behind _deep_eq."""
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        if len(a) != len(b):
+            return False
+        for key, value in a.items():
+            if key not in b or not _deep_eq_walk(value, b[key]):
+                return False
+        return True
+    if isinstance(a, list):
+        if len(a) != len(b):
+            return False
+        return all(_deep_eq_walk(x, y) for x, y in zip(a, b))
+    # NaN == NaN is False, yet both serialize to the same NaN literal
+    return a == b or (a != a and b != b)
+
+
+def _encode_lines(lines: list[str]) -> bytes:
+    """Join text lines and encode them exactly as a text-mode UTF-8 write would.
+
+    Newlines (including any inside a line) become os.linesep, so callers can
+    write the result with a single binary write instead of via TextIOWrapper.
+    """
+    text = '\n'.join(lines)
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode('utf-8')
+
+
+def _collect_icon_imports(
+    rows: list, construction_names: frozenset[str] | set[str] | list[str], all_imports: list
+) -> list[dict]:
+    """Collect the Import entries referenced by the Icon of the named rows.
+
+    A negative Icon value is a 1-based index into Imports for the texture;
+    the entry just before it is the texture's package, which is needed too.
+
+    Args:
+        rows: Table rows from a DataTable export
+        construction_names: Row names to collect icons for
+        all_imports: The file's Imports array
+
+    Returns:
+        Import entries in first-use order, deduplicated by ObjectName
+    """
+    # Hash lookups per row instead of scanning a list of names per row
+    if not isinstance(construction_names, (set, frozenset)):
+        construction_names = frozenset(construction_names)
+
+    needed_imports = []
+    seen = set()
+    import_count = len(all_imports)
+
+    for row in rows:
+        if row.get('Name') not in construction_names:
+            continue
+
+        # Find the Icon property; a row has at most one, so stop at the first
+        for prop in row.get('Value', []):
+            if prop.get('Name') == 'Icon':
+                break
+        else:
+            continue
+
+        icon_idx = prop.get('Value')
+        if not isinstance(icon_idx, int) or icon_idx >= 0:
+            continue
+
+        # Negative index: -2 means Imports[1], also need Imports[0].
+        # The texture index is never negative; the package index is
+        # -1 for an Icon of -1, which has no package entry.
+        texture_idx = -icon_idx - 1
+        package_idx = texture_idx - 1
+        if 0 <= package_idx < import_count:
+            package = all_imports[package_idx]
+            obj_name = package.get('ObjectName', '')
+            if obj_name and obj_name not in seen:
+                seen.add(obj_name)
+                needed_imports.append(package)
+        if texture_idx < import_count:
+            texture = all_imports[texture_idx]
+            obj_name = texture.get('ObjectName', '')
+            if obj_name and obj_name not in seen:
+                seen.add(obj_name)
+                needed_imports.append(texture)
+
+    return needed_imports
+
+
+def _iter_combined_def(
+    pack_name: str,
+    recipe_rows: list,
+    construction_rows: list,
+    merged_imports: list,
+):
+    """Yield the text of a combined construction pack .def file piece by piece.
+
+    Every piece ends with a newline except the closing </definition> tag, so
+    ''.join() of the output matches the old '\n'.join() of the line list.
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<definition>\n'
+    escape = _escape_xml
+    yield f'  <title>{escape(pack_name)}</title>\n'
+    yield '  <author>Moria MOD Creator</author>\n'
+    yield (f'  <description>Combined construction pack with {len(recipe_rows)} recipes '
+           f'and {len(construction_rows)} constructions</description>\n')
+    yield '\n'  # Empty line after header
+
+    # DT_ConstructionRecipes mod section (each row goes out as one chunk)
+    if recipe_rows:
+        yield '  <mod file="Moria\\Content\\Tech\\Data\\Building\\DT_ConstructionRecipes.json">\n\n'
+        yield from (
+            f'    <add_row name="{escape(row_name)}">\n      <![CDATA[{row_json}]]>\n    </add_row>\n\n'
+            for row_name, row_json in recipe_rows
+        )
+        yield '  </mod>\n\n'
+
+    # DT_Constructions mod section
+    if construction_rows or merged_imports:
+        yield '  <mod file="Moria\\Content\\Tech\\Data\\Building\\DT_Constructions.json">\n\n'
+        if merged_imports:
+            yield f'    <add_imports><![CDATA[{_dump_json_compact(merged_imports)}]]></add_imports>\n\n'
+        yield from (
+            f'    <add_row name="{escape(row_name)}">\n      <![CDATA[{row_json}]]>\n    </add_row>\n\n'
+            for row_name, row_json in construction_rows
+        )
+        yield '  </mod>\n'
+
+    yield '</definition>'
+
+
+def _write_combined_def(
+    output_file: Path,
+    pack_name: str,
+    recipe_rows: list,
+    construction_rows: list,
+    all_imports: list,
+):
+    """Write a combined .def file with all recipes and constructions (no Tk access).
+
+    Args:
+        output_file: Path to write the .def file
+        pack_name: Name of the construction pack
+        recipe_rows: List of (name, json_text) tuples for recipes
+        construction_rows: List of (name, json_text) tuples for constructions
+        all_imports: List of parsed Import entries (dicts)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    # Merge all imports into one array (deduplicated); serialized once below
+    merged_imports = []
+    seen_imports = set()
+    for imp in all_imports:
+        obj_name = imp.get('ObjectName', '')
+        if obj_name and obj_name not in seen_imports:
+            seen_imports.add(obj_name)
+            merged_imports.append(imp)
+
+    # Stream the XML straight to disk rather than joining one large string.
+    # The text layer encodes in C as it buffers: a hand-encoded binary
+    # stream measured no faster, and one joined bytes write was slower.
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(_iter_combined_def(
+            pack_name, recipe_rows, construction_rows, merged_imports
+        ))
+
+    logger.info("Wrote combined .def file: %s", output_file)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly those bytes.
+
+    The data goes to a sibling temp file that then replaces path, so a
+    failed write (e.g. a full disk) never leaves a truncated table or .def.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        _replace_with_retry(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _replace_with_retry(src: Path, dst: Path):
+    """os.replace src over dst, retrying briefly while dst is open elsewhere.
+
+    On Windows Python opens files without FILE_SHARE_DELETE, so replacing a
+    cache table that _build_changes_worker is reading on _IO_POOL fails with
+    PermissionError until that read finishes.
+    """
+    for delay in _REPLACE_RETRY_DELAYS:
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            time.sleep(delay)
+    os.replace(src, dst)
+
+
+def _parse_json(raw):
+    """Parse JSON text or bytes, using orjson when it is installed.
+
+    orjson rejects a few things the stdlib accepts (e.g. NaN literals), so
+    input it cannot parse is retried with json before the error is raised.
+    NaN and Infinity literals come back as _NonFiniteFloat.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw, parse_constant=_NonFiniteFloat)
+
+
+def _dump_json_compact(obj) -> str:
+    """Serialize to compact JSON text, using orjson when it is installed.
+
+    Falls back to json for values orjson refuses (e.g. integers over 64 bits
+    or _NonFiniteFloat).
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _dump_json_indented(obj) -> bytes:
+    """Serialize to UTF-8 JSON indented by two spaces, as json.dump(indent=2) does.
+
+    orjson's OPT_INDENT_2 output has the same layout as json.dumps(indent=2,
+    ensure_ascii=False), but some floats are spelled differently (0.00001
+    for 1e-05, 1e16 for 1e+16) and non-finite floats would become null.
+    Those parse as _NonFiniteFloat, which orjson refuses, so such documents
+    and anything else orjson cannot encode go through json.
+
+    Newlines become os.linesep, as a text-mode json.dump would write them
+    (JSON strings never hold a raw newline, so only the layout changes).
+    """
+    data = None
+    if HAS_ORJSON:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    if data is None:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    if os.linesep != '\n':
+        data = data.replace(b'\n', os.linesep.encode('ascii'))
+    return data
+
+
+def _load_json_file(json_path: Path):
+    """Parse a JSON file, using orjson when it is installed (see _parse_json).
+
+    NaN and Infinity values load as _NonFiniteFloat, so a document read here
+    and saved with _dump_json_indented keeps them.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    return _parse_json(json_path.read_bytes())
+
+
+def _diff_nested(
+    row_name: str, root_path: str, orig_root: list, cache_root: list, root_kind: str
+) -> list[tuple[str, str, str]]:
+    """Diff a struct's inner properties or an array's elements without recursion.
+
+    A struct ('struct') is a list of named property dicts; nested structs are
+    diffed in place. An array ('array') is compared index by index; elements
+    that are structs are diffed as structs.
+
+    Work items are kept on a stack; each node's results (changes or nested
+    nodes) are pushed in reverse, so changes come out in the same depth-first
+    order as the previous recursive implementation.
+
+    Returns:
+        List of (item_name, property_path, new_value_str) tuples
+    """
+    changes = []
+    stack = [(root_kind, root_path, orig_root, cache_root)]
+    while stack:
+        kind, path, orig, cache = stack.pop()
+        if kind == 'change':
+            changes.append(orig)
+            continue
+
+        items = []
+        if kind == 'struct':
+            # Guard: if list contains non-dict items (e.g. strings), skip struct diff
+            if not all(isinstance(p, dict) for p in orig) or \
+               not all(isinstance(p, dict) for p in cache):
+                continue
+            orig_map = {name: p for p in orig if (name := p.get('Name'))}
+            cache_map = {name: p for p in cache if (name := p.get('Name'))}
+
+            for inner_name, cache_inner in cache_map.items():
+                orig_inner = orig_map.get(inner_name)
+                if orig_inner is None or _deep_eq(orig_inner, cache_inner):
+                    continue
+
+                inner_val = cache_inner.get('Value')
+                orig_inner_val = orig_inner.get('Value')
+                inner_path = f"{path}.{inner_name}"
+
+                # Simple scalar inner value
+                if not isinstance(inner_val, (list, dict)):
+                    if inner_val != orig_inner_val:
+                        items.append(('change', None, (row_name, inner_path, str(inner_val)), None))
+                # Nested struct
+                elif isinstance(inner_val, list) and isinstance(orig_inner_val, list):
+                    items.append(('struct', inner_path, orig_inner_val, inner_val))
+        else:
+            # Compare element by element for matching indices
+            for i, (orig_elem, cache_elem) in enumerate(zip(orig, cache)):
+                if _deep_eq(orig_elem, cache_elem):
+                    continue
+                elem_path = f"{path}[{i}]"
+
+                # If elements are structs with Value arrays, diff their inner properties
+                if (isinstance(orig_elem, dict) and isinstance(cache_elem, dict)
+                        and 'Value' in orig_elem and 'Value' in cache_elem
+                        and isinstance(orig_elem['Value'], list)):
+                    items.append(('struct', elem_path, orig_elem['Value'], cache_elem['Value']))
+                elif isinstance(orig_elem, dict) and isinstance(cache_elem, dict):
+                    # Simple dict element - compare Value field
+                    orig_v = orig_elem.get('Value', '')
+                    cache_v = cache_elem.get('Value', '')
+                    if orig_v != cache_v:
+                        items.append(('change', None, (row_name, elem_path, str(cache_v)), None))
+                else:
+                    items.append(('change', None, (row_name, elem_path, str(cache_elem)), None))
+
+        stack.extend(reversed(items))
+    return changes
+
+
+def _iter_change_lines(changes: list[tuple]):
+    """Yield a .def <change> element line for each (item, property, value).
+
+    Diffs arrive grouped by row, so the escaped item name is reused until the
+    item changes instead of being escaped again for every property.
+    """
+    escape = _escape_xml
+    last_item = None
+    item_attr = ''
+    for item, prop, value in changes:
+        if item != last_item:
+            last_item = item
+            item_attr = escape(item)
+        yield (f'    <change item="{item_attr}" property="{escape(prop)}" '
+               f'value="{escape(str(value))}" />')
+
+
+def _escape_xml(text: str) -> str:
+    """Escape special XML characters in text.
+
+    A chain of str.replace beats str.translate here, and most names contain
+    nothing to escape, so those are returned after five cheap membership
+    tests without entering the replace chain at all.
+    """
+    if ('&' not in text and '<' not in text and '>' not in text
+            and '"' not in text and "'" not in text):
+        return text
+    return (text
+            .replace('&', '&amp;')
+            .replace('<', '&lt;')
+            .replace('>', '&gt;')
+            .replace('"', '&quot;')
+            .replace("'", '&apos;'))
+
+
+def _split_comma_list(text: str) -> list[str]:
+    """Split a comma-separated form value into its stripped, non-empty items.
+
+    Each item is stripped once; filter(None, ...) drops the empty ones.
+    """
+    return list(filter(None, map(str.strip, text.split(","))))
+
+
 def _load_cached_options(cache_path: Path) -> dict:
     """Load cached dropdown options from INI file."""
     options = {}
@@ -353,15 +1191,35 @@ def _load_cached_options(cache_path: Path) -> dict:
         config = configparser.ConfigParser()
         config.read(cache_path, encoding="utf-8")
         for section in config.sections():
-            options[section] = [v.strip() for v in config.get(section, "values", fallback="").split("|") if v.strip()]
+            if section == CACHE_SIGNATURE_SECTION:
+                continue
+            values = config.get(section, "values", fallback="")
+            options[section] = list(filter(None, map(str.strip, values.split("|"))))
     return options
 
 
-def _save_cached_options(cache_path: Path, options: dict):
-    """Save dropdown options to INI file."""
+def _load_cache_signature(cache_path: Path) -> str:
+    """Read the source signature stored with the options cache ('' if absent)."""
+    if not cache_path.exists():
+        return ""
+    config = configparser.ConfigParser()
+    config.read(cache_path, encoding="utf-8")
+    return config.get(CACHE_SIGNATURE_SECTION, "value", fallback="")
+
+
+def _save_cached_options(cache_path: Path, options: dict, signature: str = ""):
+    """Save dropdown options to INI file.
+
+    Args:
+        cache_path: INI file to write
+        options: Option category -> list of values
+        signature: Source signature from _options_source_signature (omitted if empty)
+    """
     config = configparser.ConfigParser()
     for section, values in sorted(options.items()):
         config[section] = {"values": "|".join(sorted(values))}
+    if signature:
+        config[CACHE_SIGNATURE_SECTION] = {"value": signature}
     with open(cache_path, "w", encoding="utf-8") as f:
         config.write(f)
 
@@ -592,7 +1450,7 @@ def parse_def_file(file_path: Path) -> dict:
             add_row = mod.find("add_row")
             if add_row is not None and add_row.text:
                 try:
-                    result["recipe_json"] = json.loads(add_row.text)
+                    result["recipe_json"] = _parse_json(add_row.text)
                 except json.JSONDecodeError as e:
                     logger.error("Failed to parse recipe JSON: %s", e)
 
@@ -601,14 +1459,14 @@ def parse_def_file(file_path: Path) -> dict:
             add_row = mod.find("add_row")
             if add_row is not None and add_row.text:
                 try:
-                    result["construction_json"] = json.loads(add_row.text)
+                    result["construction_json"] = _parse_json(add_row.text)
                 except json.JSONDecodeError as e:
                     logger.error("Failed to parse construction JSON: %s", e)
 
             add_imports = mod.find("add_imports")
             if add_imports is not None and add_imports.text:
                 try:
-                    result["imports_json"] = json.loads(add_imports.text)
+                    result["imports_json"] = _parse_json(add_imports.text)
                 except json.JSONDecodeError as e:
                     logger.error("Failed to parse imports JSON: %s", e)
 
@@ -1536,21 +2394,19 @@ class _ConfirmSecretsDeleteDialog(ctk.CTkToplevel):
         super().__init__(parent)
 
         self.title("Confirm Delete")
-        self.geometry("380x150")
+        # Center on screen with a single geometry call (screen size needs no layout pass)
+        width, height = 380, 150
+        x = (self.winfo_screenwidth() - width) // 2
+        y = (self.winfo_screenheight() - height) // 2
+        self.geometry(f"{width}x{height}+{x}+{y}")
         self.resizable(False, False)
         self.result = False
 
         self.transient(parent)
         self.grab_set()
 
-        icon_path = Path(__file__).parent.parent.parent / "assets" / "icons" / "application icons" / "app_icon.ico"
-        if icon_path.exists():
-            self.after(10, lambda: self.iconbitmap(str(icon_path)))
-
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - 380) // 2
-        y = (self.winfo_screenheight() - 150) // 2
-        self.geometry(f"380x150+{x}+{y}")
+        if _HAS_APP_ICON:
+            self.after(10, lambda: self.iconbitmap(_APP_ICON))
 
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
 
@@ -1560,7 +2416,7 @@ class _ConfirmSecretsDeleteDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             main_frame,
             text=f"Delete change set '{prefix_name}' and all its files?",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             wraplength=340
         ).pack(pady=(0, 20))
 
@@ -1569,16 +2425,14 @@ class _ConfirmSecretsDeleteDialog(ctk.CTkToplevel):
 
         ctk.CTkButton(
             btn_frame, text="Cancel",
-            fg_color="#F44336", hover_color="#D32F2F",
-            text_color="white", font=ctk.CTkFont(weight="bold"),
-            width=100, command=self._on_cancel
+            font=_font(weight="bold"), width=100, **_RED_BTN,
+            command=self._on_cancel
         ).pack(side="left")
 
         ctk.CTkButton(
             btn_frame, text="OK",
-            fg_color="#4CAF50", hover_color="#388E3C",
-            text_color="white", font=ctk.CTkFont(weight="bold"),
-            width=100, command=self._on_ok
+            font=_font(weight="bold"), width=100, **_GREEN_BTN,
+            command=self._on_ok
         ).pack(side="right")
 
     def _on_cancel(self):
@@ -1597,7 +2451,11 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
         super().__init__(parent)
 
         self.title("Change Secrets")
-        self.geometry("450x420")
+        # Center on screen with a single geometry call (screen size needs no layout pass)
+        width, height = 450, 420
+        x = (self.winfo_screenwidth() - width) // 2
+        y = (self.winfo_screenheight() - height) // 2
+        self.geometry(f"{width}x{height}+{x}+{y}")
         self.resizable(False, False)
 
         self.result = None
@@ -1605,14 +2463,8 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
         self.transient(parent)
         self.grab_set()
 
-        icon_path = Path(__file__).parent.parent.parent / "assets" / "icons" / "application icons" / "app_icon.ico"
-        if icon_path.exists():
-            self.after(10, lambda: self.iconbitmap(str(icon_path)))
-
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - 450) // 2
-        y = (self.winfo_screenheight() - 420) // 2
-        self.geometry(f"450x420+{x}+{y}")
+        if _HAS_APP_ICON:
+            self.after(10, lambda: self.iconbitmap(_APP_ICON))
 
         self._current_prefix = current_prefix
         self._create_widgets()
@@ -1622,9 +2474,18 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
     def _get_existing_prefixes(self) -> list[str]:
         """Get list of existing change secrets directories."""
         secrets_dir = get_default_changesecrets_dir()
-        if not secrets_dir.exists():
+        try:
+            mtime_ns = os.stat(secrets_dir).st_mtime_ns
+            cached = _prefix_cache.get(secrets_dir)
+            if cached is not None and cached[0] == mtime_ns:
+                return list(cached[1])
+            with os.scandir(secrets_dir) as entries:
+                prefixes = sorted(entry.name for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            _prefix_cache.pop(secrets_dir, None)
             return []
-        return sorted(item.name for item in secrets_dir.iterdir() if item.is_dir())
+        _prefix_cache[secrets_dir] = (mtime_ns, prefixes)
+        return list(prefixes)
 
     def _create_widgets(self):
         """Create the dialog widgets."""
@@ -1638,14 +2499,17 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             main_frame,
             text="Change Secrets:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, weight="bold"),
             anchor="w"
         ).grid(row=0, column=0, sticky="w", pady=(0, 5))
 
         self.prefix_list_frame = ctk.CTkScrollableFrame(main_frame, height=150)
         self.prefix_list_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 10))
 
-        self._refresh_prefix_list()
+        # Row widgets are reused across refreshes; populate once the dialog is mapped
+        self._prefix_rows: list[tuple[ctk.CTkFrame, ctk.CTkButton, ctk.CTkButton]] = []
+        self._empty_label: Optional[ctk.CTkLabel] = None
+        self.after_idle(self._refresh_prefix_list)
 
         # Prefix name section
         prefix_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -1655,14 +2519,14 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             prefix_frame,
             text="Change Secret Prefix:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, weight="bold")
         ).grid(row=0, column=0, sticky="w", padx=(0, 10))
 
         self.prefix_var = ctk.StringVar(value=self._current_prefix)
         self.prefix_entry = ctk.CTkEntry(
             prefix_frame,
             textvariable=self.prefix_var,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             placeholder_text="Enter prefix name..."
         )
         self.prefix_entry.grid(row=0, column=1, sticky="ew")
@@ -1673,56 +2537,74 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
 
         ctk.CTkButton(
             btn_frame, text="Cancel",
-            fg_color="#F44336", hover_color="#D32F2F",
-            text_color="white", font=ctk.CTkFont(weight="bold"),
-            width=100, command=self._on_cancel
+            font=_font(weight="bold"), width=100, **_RED_BTN,
+            command=self._on_cancel
         ).pack(side="left")
 
         ctk.CTkButton(
             btn_frame, text="Apply",
-            fg_color="#4CAF50", hover_color="#388E3C",
-            text_color="white", font=ctk.CTkFont(weight="bold"),
-            width=100, command=self._on_apply
+            font=_font(weight="bold"), width=100, **_GREEN_BTN,
+            command=self._on_apply
         ).pack(side="right")
 
         self.prefix_entry.bind("<Return>", lambda e: self._on_apply())
 
     def _refresh_prefix_list(self):
-        """Refresh the prefix list display."""
-        for widget in self.prefix_list_frame.winfo_children():
-            widget.destroy()
+        """Refresh the prefix list display, reusing existing row widgets."""
+        if not self.winfo_exists():
+            return
 
         prefixes = self._get_existing_prefixes()
-        if prefixes:
-            for prefix_name in prefixes:
+
+        for i, prefix_name in enumerate(prefixes):
+            if i < len(self._prefix_rows):
+                row, select_btn, delete_btn = self._prefix_rows[i]
+                select_btn.configure(
+                    text=prefix_name,
+                    command=functools.partial(self._select_prefix, prefix_name)
+                )
+                delete_btn.configure(command=functools.partial(self._confirm_delete_prefix, prefix_name))
+            else:
                 row = ctk.CTkFrame(self.prefix_list_frame, fg_color="transparent")
-                row.pack(fill="x", pady=2)
 
-                ctk.CTkButton(
+                select_btn = ctk.CTkButton(
                     row,
                     text=prefix_name,
                     fg_color="transparent",
                     hover_color=("gray75", "gray25"),
                     text_color=("gray10", "gray90"),
                     anchor="w",
-                    command=lambda p=prefix_name: self._select_prefix(p)
-                ).pack(side="left", fill="x", expand=True)
+                    command=functools.partial(self._select_prefix, prefix_name)
+                )
+                select_btn.pack(side="left", fill="x", expand=True)
 
-                ctk.CTkButton(
+                delete_btn = ctk.CTkButton(
                     row,
                     text="\U0001F5D1",
                     width=28, height=28,
-                    fg_color="#F44336", hover_color="#D32F2F",
-                    text_color="white",
-                    font=ctk.CTkFont(size=14),
-                    command=lambda p=prefix_name: self._confirm_delete_prefix(p)
-                ).pack(side="right", padx=(5, 0))
+                    font=_font(14),
+                    **_RED_BTN,
+                    command=functools.partial(self._confirm_delete_prefix, prefix_name)
+                )
+                delete_btn.pack(side="right", padx=(5, 0))
+                self._prefix_rows.append((row, select_btn, delete_btn))
+            row.pack(fill="x", pady=2)
+
+        # Hide pooled rows that are no longer needed
+        for row, _, _ in self._prefix_rows[len(prefixes):]:
+            row.pack_forget()
+
+        if prefixes:
+            if self._empty_label is not None:
+                self._empty_label.pack_forget()
         else:
-            ctk.CTkLabel(
-                self.prefix_list_frame,
-                text="No existing change sets found",
-                text_color="gray"
-            ).pack(pady=10)
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(
+                    self.prefix_list_frame,
+                    text="No existing change sets found",
+                    text_color="gray"
+                )
+            self._empty_label.pack(pady=10)
 
     def _select_prefix(self, prefix_name: str):
         """Select an existing prefix from the list."""
@@ -1735,8 +2617,8 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
         confirm.wait_window()
         if confirm.result:
             prefix_dir = get_default_changesecrets_dir() / prefix_name
-            if prefix_dir.exists():
-                shutil.rmtree(prefix_dir)
+            shutil.rmtree(prefix_dir, ignore_errors=True)
+            _prefix_cache.pop(prefix_dir.parent, None)
             if self.prefix_var.get() == prefix_name:
                 self.prefix_var.set("")
             self._refresh_prefix_list()
@@ -1751,8 +2633,7 @@ class _ChangeSecretsDialog(ctk.CTkToplevel):
             self.prefix_entry.configure(border_color="red")
             return
 
-        invalid_chars = '<>:"/\\|?*'
-        if any(c in prefix_name for c in invalid_chars):
+        if not _INVALID_PREFIX_CHARS.isdisjoint(prefix_name):
             self.prefix_entry.configure(border_color="red")
             return
 
@@ -1813,11 +2694,18 @@ class BuildingsView(ctk.CTkFrame):
         self.material_rows: list[dict] = []
         self.sandbox_material_rows: list[dict] = []
 
-        # Cached dropdown options (populated from file scans)
+        # Cached dropdown options (populated from file scans) and the source
+        # signature they were built from
         self.cached_options: dict = {}
+        # Formatted Materials combobox values: (options list, string table,
+        # option set, formatted list), rebuilt when either source is replaced
+        self._material_display_memo: tuple | None = None
+        # Merged option lists by (key, defaults), each with the cached list it was built from
+        self._merged_options: dict[tuple, tuple[list, list[str]]] = {}
+        self._options_signature = ""
 
         # Form field tkinter variables for data binding
-        self.form_vars = {}
+        self.form_vars = _LazyFormVars()
 
         # Widget references for form manipulation
         self.building_list = None
@@ -1828,12 +2716,38 @@ class BuildingsView(ctk.CTkFrame):
         self.materials_frame = None
         self.sandbox_materials_frame = None
 
-        # Building list item references for selection highlighting
-        self.building_list_items = {}  # {file_path: (row_frame, file_label)}
-
-        # Checkbox tracking for bulk construction operations
-        self.construction_checkboxes: dict[Path, ctk.CTkCheckBox] = {}
-        self.construction_check_vars: dict[Path, ctk.BooleanVar] = {}
+        # Building list item references for selection highlighting (Secrets lists)
+        self.building_list_items = {}  # {recipe_name: (row_frame, file_label, label_text, search_blob)}
+        # Secrets row widgets, reused in order by _populate_secrets_list
+        self._secrets_row_pool: list[_SecretsRowRefs] = []
+        # Form rows kept across renders: free refs per kind, refs shown by the
+        # current render, and the top-level widgets _clear_form_content keeps
+        self._form_pool: dict[str, list] = {'field': [], 'section': [], 'subsection': []}
+        self._form_pool_in_use: list[tuple[str, object]] = []
+        self._form_pooled_widgets: set = set()
+
+        # .def list: a single Treeview (item id = str(path)) with a label per file,
+        # the currently filtered paths, and plain-bool checkbox state
+        self.def_tree: Optional[ttk.Treeview] = None
+        self._def_tree_frame = None
+        self._def_labels: dict[Path, str] = {}
+        self._def_visible_paths: list[Path] = []
+        self._row_visible: dict[Path, bool] = {}
+        self._row_search_blob: dict[Path, str] = {}
+        # Filter text that produced _def_visible_paths (None = list changed since)
+        self._def_filter_text: Optional[str] = None
+        # Buildings dir mtime when def_files was last enumerated (None = never)
+        self._buildings_dir_mtime: Optional[int] = None
+        # Whether each checked_items.ini (per mode and change set) has any checks,
+        # recorded whenever one is read or written this session
+        self._has_checks: dict[Path, bool] = {}
+        # (cache dir, recipes JSON, definitions JSON) per (view mode, prefix)
+        self._cache_paths: dict[tuple[str, str], tuple[Path, Optional[Path], Path]] = {}
+        self.construction_checked: dict[Path, bool] = {}
+
+        # Secrets list checkbox tracking (keyed by recipe name)
+        self.construction_checkboxes: dict[str, ctk.CTkCheckBox] = {}
+        self.secrets_checked: dict[str, bool] = {}
         self.select_all_var = None
         self.select_all_checkbox = None
 
@@ -1844,6 +2758,11 @@ class BuildingsView(ctk.CTkFrame):
 
         # Search filter for construction definitions
         self.def_search_var = None
+        self._search_after_id = None
+        self._refresh_after_id = None
+
+        # Running background build (None when idle)
+        self._build_future: Optional[Future] = None
 
         # Current construction pack name and tracking
         self.current_construction_pack = None
@@ -1861,31 +2780,22 @@ class BuildingsView(ctk.CTkFrame):
 
         # String table for game name lookups {internal_name: display_name}
         self.string_table = {}
+        # List label per internal name; cleared whenever string_table is replaced
+        self._name_lookup_cache: dict[str, str] = {}
 
         # Button and widget refs created in _create_left_pane_buttons
         self.include_secrets_var = None
         self.include_secrets_cb = None
-        self.tools_btn = None
-        self.flora_btn = None
-        self.loot_btn = None
-        self.items_btn = None
+        self._category_buttons: dict[str, ctk.CTkButton] = {}
         self.secrets_prefix_var = None
-        self.secrets_prefix_entry = None
+        self.secrets_prefix_label = None
 
         # Widget references created in _create_widgets helper methods
-        self.buildings_btn = None
-        self.weapons_btn = None
-        self.armor_btn = None
         self.def_search_entry = None
         self.count_label = None
         self.form_container = None
-        self.form_header = None
-        self.header_title = None
-        self.header_author = None
-        self.header_description = None
-        self.form_footer = None
-        self.footer_save_btn = None
-        self.footer_revert_btn = None
+        self.form_header: Optional[_FormHeaderRefs] = None
+        self.form_footer: Optional[_FormFooterRefs] = None
 
         self._create_widgets()
         # Load persisted secrets prefix
@@ -1904,48 +2814,90 @@ class BuildingsView(ctk.CTkFrame):
         This method populates the cached_options dictionary with unique values
         found in existing .def files and the game's construction recipes JSON.
         These values are used to populate autocomplete dropdowns in the form.
-        """
-        buildings_dir = get_buildings_dir()
-        cache_path = buildings_dir / CACHE_FILENAME
 
-        # Scan .def files for all unique values (categories, materials, etc.)
+        The file I/O runs on a background worker; results are applied on the
+        Tk thread by _poll_scan_result.
+        """
         self._set_status("Scanning building definitions...")
-        self.cached_options = _scan_def_files_for_options(buildings_dir)
+        future = _IO_POOL.submit(self._scan_options_worker, get_buildings_dir())
+        self.after(50, self._poll_scan_result, future)
 
-        # Scan DT_ConstructionRecipes.json for official game values
-        self._set_status("Scanning game construction recipes...")
-        game_options = _scan_construction_recipes_json()
+    def _scan_options_worker(self, buildings_dir: Path) -> tuple[dict, dict, str]:
+        """Scan option sources and string tables (background thread, no Tk access).
+
+        The rescan is skipped when the INI cache was written from sources with
+        the same mtimes as now.
+
+        Args:
+            buildings_dir: Directory containing the .def files and INI cache
+
+        Returns:
+            Tuple of (cached_options, string_table, source signature)
+        """
+        cache_path = buildings_dir / CACHE_FILENAME
+        signature = _options_source_signature(buildings_dir)
+        if _load_cache_signature(cache_path) == signature:
+            cached_options = _load_cached_options(cache_path)
+            if cached_options:
+                return cached_options, self._load_string_table(), signature
+
+        # Scan .def files for all unique values (categories, materials, etc.)
+        cached_options = _scan_def_files_for_options(buildings_dir)
+
+        # Scan DT_ConstructionRecipes.json for official game values
+        game_options = _scan_construction_recipes_json()
 
         # Merge game options into cached options, deduplicating values
         for key, values in game_options.items():
-            if key in self.cached_options:
-                existing = set(self.cached_options[key])
-                for v in values:
-                    existing.add(v)
-                self.cached_options[key] = sorted(existing)
-            else:
-                self.cached_options[key] = values
+            cached_options[key] = _merge_sorted_unique(cached_options.get(key, []), values)
 
         # Build combined "AllValues" key for unrestricted autocomplete fields
-        all_values = set()
-        for values in self.cached_options.values():
-            all_values.update(values)
-        self.cached_options["AllValues"] = sorted(all_values)
+        cached_options["AllValues"] = sorted(set().union(*cached_options.values()))
 
         # Persist to INI cache for faster startup
-        _save_cached_options(cache_path, self.cached_options)
+        cache_existed = cache_path.exists()
+        _save_cached_options(cache_path, cached_options, signature)
+        if not cache_existed:
+            # Creating the cache file changed buildings_dir's mtime; re-key it
+            signature = _options_source_signature(buildings_dir)
+            _save_cached_options(cache_path, cached_options, signature)
 
         # Load string tables for display name resolution
-        self.string_table = self._load_string_table()
+        return cached_options, self._load_string_table(), signature
+
+    def _poll_scan_result(self, future: Future):
+        """Wait for the background scan to finish, then apply it on the Tk thread."""
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(50, self._poll_scan_result, future)
+            return
+
+        try:
+            cached_options, string_table, self._options_signature = future.result()
+        except (OSError, ValueError, configparser.Error) as e:
+            logger.error("Error scanning building definitions: %s", e)
+            self._set_status(f"Error scanning definitions: {e}", is_error=True)
+            return
+
+        # Keep any values added by saves while the scan was running
+        for key, values in self.cached_options.items():
+            cached_options[key] = _merge_sorted_unique(cached_options.get(key, []), values)
+        self.cached_options = cached_options
+        if string_table != self.string_table:
+            self.string_table = string_table
+            self._name_lookup_cache.clear()
 
-        # Refresh the building list to show scanned files
-        self._refresh_building_list()
+        # Refresh the building list to show scanned files, unless the user has
+        # already switched to a Secrets category while the scan was running
+        if self.view_mode == 'definitions':
+            self._schedule_refresh()
 
         # Report scan results to status bar
         total_items = sum(len(v) for v in self.cached_options.values())
         self._set_status(f"Scanned {len(self.def_files)} definitions, found {total_items} unique values")
 
-    def _get_options(self, key: str, defaults: list[str] | None = None) -> list[str]:
+    def _get_options(self, key: str, defaults: Sequence[str] | None = None) -> list[str]:
         """
         Get dropdown options for a field, merging cached values with defaults.
 
@@ -1954,17 +2906,23 @@ class BuildingsView(ctk.CTkFrame):
             defaults: Default values to include if not already present
 
         Returns:
-            List of unique option strings for the dropdown
+            List of unique option strings for the dropdown. The list may be
+            shared between calls, so callers must not modify it.
         """
-        cached = self.cached_options.get(key, [])
-        if defaults:
-            # Merge cached and defaults, preserving order and deduplicating
-            merged = list(cached)
-            for d in defaults:
-                if d not in merged:
-                    merged.append(d)
-            return merged
-        return cached if cached else ["(none)"]
+        cached = self.cached_options.get(key, ())
+        if not defaults:
+            return cached if cached else _NO_OPTIONS
+
+        # Option lists are replaced, never mutated, when values are added or
+        # rescanned, so the merge stays valid while the source list is the same
+        memo_key = (key, tuple(defaults))
+        memo = self._merged_options.get(memo_key)
+        if memo is not None and memo[0] is cached:
+            return memo[1]
+        # Merge cached and defaults, preserving order and deduplicating
+        merged = list(dict.fromkeys((*cached, *defaults)))
+        self._merged_options[memo_key] = (cached, merged)
+        return merged
 
     # -------------------------------------------------------------------------
     # WIDGET CREATION
@@ -1988,10 +2946,9 @@ class BuildingsView(ctk.CTkFrame):
         # Right pane: Building form
         self._create_building_form_pane()
 
-        # Set initial eye button icons (after both panes are created)
+        # Set initial eye button icon (the header eye is set when the header is built)
         visible_icon, _, _ = self._get_eye_icons()
         self.bulk_eye_btn.configure(image=visible_icon)
-        self.header_eye_btn.configure(image=visible_icon)
 
     def _create_building_list_pane(self):
         """
@@ -2007,83 +2964,28 @@ class BuildingsView(ctk.CTkFrame):
         list_frame = ctk.CTkFrame(self)
         list_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
 
+        # Secrets rows carry these class tags instead of per-row callbacks
+        self.bind_class(SECRETS_ROW_TAG, "<Button-1>", self._on_secrets_row_click)
+        self.bind_class(SECRETS_LABEL_TAG, "<Enter>", self._on_secrets_row_hover)
+        self.bind_class(SECRETS_LABEL_TAG, "<Leave>", self._on_secrets_row_hover)
+
         # Button rows for category filters
         btn_container = ctk.CTkFrame(list_frame, fg_color="transparent")
         btn_container.pack(fill="x", padx=10, pady=(10, 5))
 
-        # Row 1: Buildings, Weapons, Armor
-        btn_row1 = ctk.CTkFrame(btn_container, fg_color="transparent")
-        btn_row1.pack(fill="x")
-        for col in range(3):
-            btn_row1.grid_columnconfigure(col, weight=1)
-
-        self.buildings_btn = ctk.CTkButton(
-            btn_row1, text="Buildings", height=28,
-            fg_color="#2196F3", hover_color="#1976D2",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_buildings
-        )
-        self.buildings_btn.grid(row=0, column=0, sticky="ew", padx=(0, 2))
-
-        self.weapons_btn = ctk.CTkButton(
-            btn_row1, text="Weapons", height=28,
-            fg_color="#9C27B0", hover_color="#7B1FA2",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_weapons
-        )
-        self.weapons_btn.grid(row=0, column=1, sticky="ew", padx=2)
-
-        self.armor_btn = ctk.CTkButton(
-            btn_row1, text="Armor", height=28,
-            fg_color="#FF9800", hover_color="#F57C00",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_armor
-        )
-        self.armor_btn.grid(row=0, column=2, sticky="ew", padx=2)
-
-        # Row 2: Tools, Flora
-        btn_row2 = ctk.CTkFrame(btn_container, fg_color="transparent")
-        btn_row2.pack(fill="x", pady=(2, 0))
-        btn_row2.grid_columnconfigure(0, weight=1)
-        btn_row2.grid_columnconfigure(1, weight=1)
-
-        self.tools_btn = ctk.CTkButton(
-            btn_row2, text="Tools", height=28,
-            fg_color="#00897B", hover_color="#00695C",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_tools
-        )
-        self.tools_btn.grid(row=0, column=0, sticky="ew", padx=(0, 2))
-
-        self.flora_btn = ctk.CTkButton(
-            btn_row2, text="Flora", height=28,
-            fg_color="#43A047", hover_color="#2E7D32",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_flora
-        )
-        self.flora_btn.grid(row=0, column=1, sticky="ew", padx=2)
-
-        # Row 3: Loot, Items
-        btn_row3 = ctk.CTkFrame(btn_container, fg_color="transparent")
-        btn_row3.pack(fill="x", pady=(2, 0))
-        btn_row3.grid_columnconfigure(0, weight=1)
-        btn_row3.grid_columnconfigure(1, weight=1)
-
-        self.loot_btn = ctk.CTkButton(
-            btn_row3, text="Loot", height=28,
-            fg_color="#E53935", hover_color="#C62828",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_loot
-        )
-        self.loot_btn.grid(row=0, column=0, sticky="ew", padx=(0, 2))
-
-        self.items_btn = ctk.CTkButton(
-            btn_row3, text="Items", height=28,
-            fg_color="#5C6BC0", hover_color="#3949AB",
-            font=ctk.CTkFont(weight="bold"),
-            command=self._load_secrets_items
-        )
-        self.items_btn.grid(row=0, column=1, sticky="ew", padx=2)
+        for row_index, row_spec in enumerate(_CATEGORY_BUTTON_ROWS):
+            btn_row = ctk.CTkFrame(btn_container, fg_color="transparent")
+            btn_row.pack(fill="x", pady=(2, 0) if row_index else 0)
+            for col, (text, fg_color, hover_color, loader_name) in enumerate(row_spec):
+                btn_row.grid_columnconfigure(col, weight=1)
+                btn = ctk.CTkButton(
+                    btn_row, text=text, height=28,
+                    fg_color=fg_color, hover_color=hover_color,
+                    font=_font(weight="bold"),
+                    command=getattr(self, loader_name)
+                )
+                btn.grid(row=0, column=col, sticky="ew", padx=(0, 2) if col == 0 else 2)
+                self._category_buttons[text] = btn
 
         # "Include Secret Constructions" checkbox + Refresh button
         top_row = ctk.CTkFrame(list_frame, fg_color="transparent")
@@ -2093,13 +2995,13 @@ class BuildingsView(ctk.CTkFrame):
         self.include_secrets_cb = ctk.CTkCheckBox(
             top_row, text="Include Secret Constructions",
             variable=self.include_secrets_var,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         )
         self.include_secrets_cb.pack(side="left")
 
         refresh_btn = ctk.CTkButton(
             top_row, text="↻", width=28, height=28,
-            font=ctk.CTkFont(size=16),
+            font=_font(16),
             fg_color="transparent", hover_color=("gray75", "gray25"),
             command=self._on_refresh_cache_click
         )
@@ -2112,9 +3014,13 @@ class BuildingsView(ctk.CTkFrame):
         self.bulk_eye_btn.bind("<Button-1>", lambda e: self._on_bulk_eye_toggle())
         self._bulk_eye_visible = True
 
+        # List area: holds either the Secrets scrollable list or the .def Treeview
+        self._list_container = ctk.CTkFrame(list_frame, fg_color="transparent")
+        self._list_container.pack(fill="both", expand=True, padx=10, pady=(0, 5))
+
         # Scrollable file list
-        self.building_list = ctk.CTkScrollableFrame(list_frame, fg_color="transparent")
-        self.building_list.pack(fill="both", expand=True, padx=10, pady=(0, 5))
+        self.building_list = ctk.CTkScrollableFrame(self._list_container, fg_color="transparent")
+        self.building_list.pack(fill="both", expand=True)
 
         # === SEARCH BAR (below scrollable list) ===
         search_frame = ctk.CTkFrame(list_frame, fg_color="transparent")
@@ -2123,17 +3029,17 @@ class BuildingsView(ctk.CTkFrame):
         ctk.CTkLabel(
             search_frame,
             text="🔍",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         ).pack(side="left", padx=(0, 5))
 
         self.def_search_var = ctk.StringVar()
-        self.def_search_var.trace_add("write", lambda *args: self._filter_definitions_list())
+        self.def_search_var.trace_add("write", lambda *args: self._on_search_changed())
         self.def_search_entry = ctk.CTkEntry(
             search_frame,
             textvariable=self.def_search_var,
             height=28,
             placeholder_text="Search definitions...",
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         self.def_search_entry.pack(side="left", fill="x", expand=True)
 
@@ -2153,7 +3059,7 @@ class BuildingsView(ctk.CTkFrame):
         self.count_label = ctk.CTkLabel(
             list_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray"
         )
         self.count_label.pack(padx=10, anchor="w", pady=(0, 5))
@@ -2169,40 +3075,43 @@ class BuildingsView(ctk.CTkFrame):
         change_secrets_btn = ctk.CTkButton(
             left_bottom,
             text="Change Secrets",
-            fg_color="#2196F3",
-            hover_color="#1976D2",
-            text_color="white",
-            font=ctk.CTkFont(weight="bold"),
+            font=_font(weight="bold"),
+            **_BLUE_BTN,
             width=130,
             command=self._on_change_secrets_click
         )
         change_secrets_btn.pack(side="left")
 
+        # Display-only prefix: a label avoids the entry's canvas redraws and focus handling
         self.secrets_prefix_var = ctk.StringVar(value="")
-        self.secrets_prefix_entry = ctk.CTkEntry(
+        self.secrets_prefix_label = ctk.CTkLabel(
             left_bottom,
             textvariable=self.secrets_prefix_var,
             width=120,
-            placeholder_text="No prefix...",
-            state="disabled"
+            height=28,
+            anchor="w",
+            fg_color=("gray90", "gray20"),
+            corner_radius=6,
         )
-        self.secrets_prefix_entry.pack(side="left", padx=(10, 0), fill="x", expand=True)
+        self.secrets_prefix_label.pack(side="left", padx=(10, 0), fill="x", expand=True)
 
         # Right side: Build button
         build_btn = ctk.CTkButton(
             bottom_frame,
             text="Build",
-            fg_color="#4CAF50",
-            hover_color="#388E3C",
-            text_color="white",
-            font=ctk.CTkFont(weight="bold"),
+            font=_font(weight="bold"),
+            **_GREEN_BTN,
             width=80,
             command=self._on_construction_build_click
         )
         build_btn.pack(side="right", padx=(10, 0))
 
     def _create_building_form_pane(self):
-        """Create the right pane with the building form (fixed header, scrollable content, fixed footer)."""
+        """Create the right pane with the building form (fixed header, scrollable content, fixed footer).
+
+        Only the container, scroll area and placeholder are built here; the header,
+        footer and form content frame are created on first use by the _ensure_* helpers.
+        """
         self.form_container = ctk.CTkFrame(self)
         self.form_container.grid(row=0, column=1, sticky="nsew")
 
@@ -2212,75 +3121,90 @@ class BuildingsView(ctk.CTkFrame):
         self.form_container.grid_rowconfigure(2, weight=0)  # Footer - fixed
         self.form_container.grid_columnconfigure(0, weight=1)
 
-        # === FIXED HEADER ===
-        self.form_header = ctk.CTkFrame(self.form_container, fg_color=("gray90", "gray17"))
-        self.form_header.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
-        self.form_header.grid_remove()  # Hidden initially
+        # === SCROLLABLE CONTENT ===
+        self.form_scroll = ctk.CTkScrollableFrame(self.form_container, fg_color="transparent")
+        self.form_scroll.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
+
+        # Placeholder message
+        self.placeholder_label = ctk.CTkLabel(
+            self.form_scroll,
+            text="Select a building definition from the list\nto view and edit its properties",
+            text_color="gray",
+            font=_font(14)
+        )
+        self.placeholder_label.pack(pady=50)
+
+    def _ensure_form_header(self):
+        """Create the fixed form header (title, author, description, eye button) if needed."""
+        if self.form_header is not None:
+            return
+
+        header_frame = ctk.CTkFrame(self.form_container, fg_color=("gray90", "gray17"))
+        header_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        header_frame.grid_remove()  # Hidden until populated
 
-        header_top_row = ctk.CTkFrame(self.form_header, fg_color="transparent")
+        header_top_row = ctk.CTkFrame(header_frame, fg_color="transparent")
         header_top_row.pack(fill="x", padx=10, pady=(10, 2))
 
-        self.header_title = ctk.CTkLabel(
+        header_title = ctk.CTkLabel(
             header_top_row,
             text="",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, weight="bold"),
             anchor="w"
         )
-        self.header_title.pack(side="left", fill="x", expand=True)
+        header_title.pack(side="left", fill="x", expand=True)
 
-        self.header_eye_btn = ctk.CTkLabel(
+        visible_icon, _, _ = self._get_eye_icons()
+        header_eye_btn = ctk.CTkLabel(
             header_top_row,
             text="",
+            image=visible_icon,
             width=28,
             cursor="hand2",
         )
-        self.header_eye_btn.pack(side="right", padx=(5, 0))
-        self.header_eye_btn.bind("<Button-1>", lambda e: self._on_header_eye_click())
+        header_eye_btn.pack(side="right", padx=(5, 0))
+        header_eye_btn.bind("<Button-1>", lambda e: self._on_header_eye_click())
         self._header_eye_visible = True
 
-        self.header_author = ctk.CTkLabel(
-            self.form_header,
+        header_author = ctk.CTkLabel(
+            header_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray",
             anchor="w"
         )
-        self.header_author.pack(fill="x", padx=10)
+        header_author.pack(fill="x", padx=10)
 
-        self.header_description = ctk.CTkLabel(
-            self.form_header,
+        header_description = ctk.CTkLabel(
+            header_frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray",
             anchor="w",
             wraplength=500
         )
-        self.header_description.pack(fill="x", padx=10, pady=(0, 10))
-
-        # === SCROLLABLE CONTENT ===
-        self.form_scroll = ctk.CTkScrollableFrame(self.form_container, fg_color="transparent")
-        self.form_scroll.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
-
-        # Placeholder message
-        self.placeholder_label = ctk.CTkLabel(
-            self.form_scroll,
-            text="Select a building definition from the list\nto view and edit its properties",
-            text_color="gray",
-            font=ctk.CTkFont(size=14)
+        header_description.pack(fill="x", padx=10, pady=(0, 10))
+
+        self.form_header = _FormHeaderRefs(
+            frame=header_frame,
+            title=header_title,
+            author=header_author,
+            description=header_description,
+            eye_btn=header_eye_btn,
         )
-        self.placeholder_label.pack(pady=50)
 
-        # Form content (hidden initially)
-        self.form_content = ctk.CTkFrame(self.form_scroll, fg_color="transparent")
+    def _ensure_form_footer(self):
+        """Create the fixed form footer with Revert/Save buttons if needed."""
+        if self.form_footer is not None:
+            return
 
-        # === FIXED FOOTER ===
-        self.form_footer = ctk.CTkFrame(self.form_container, fg_color=("gray90", "gray17"))
-        self.form_footer.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10))
-        self.form_footer.grid_remove()  # Hidden initially
+        footer_frame = ctk.CTkFrame(self.form_container, fg_color=("gray90", "gray17"))
+        footer_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10))
+        footer_frame.grid_remove()  # Hidden until a form is shown
 
         # Footer buttons
-        self.footer_revert_btn = ctk.CTkButton(
-            self.form_footer,
+        revert_btn = ctk.CTkButton(
+            footer_frame,
             text="↩ Revert",
             width=100,
             height=36,
@@ -2288,19 +3212,55 @@ class BuildingsView(ctk.CTkFrame):
             hover_color="gray40",
             command=self._revert_changes
         )
-        self.footer_revert_btn.pack(side="left", padx=10, pady=10)
+        revert_btn.pack(side="left", padx=10, pady=10)
 
-        self.footer_save_btn = ctk.CTkButton(
-            self.form_footer,
+        save_btn = ctk.CTkButton(
+            footer_frame,
             text="💾 Save Changes",
             width=150,
             height=36,
-            fg_color="#4CAF50",
-            hover_color="#45a049",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            **_FORM_GREEN_BTN,
+            font=_font(14, weight="bold"),
             command=self._save_changes
         )
-        self.footer_save_btn.pack(side="right", padx=10, pady=10)
+        save_btn.pack(side="right", padx=10, pady=10)
+
+        self.form_footer = _FormFooterRefs(frame=footer_frame, revert_btn=revert_btn, save_btn=save_btn)
+
+    def _ensure_form_content(self):
+        """Create the (initially unpacked) form content frame if needed."""
+        if self.form_content is None:
+            self.form_content = ctk.CTkFrame(self.form_scroll, fg_color="transparent")
+
+    def _clear_form_content(self):
+        """Empty the form content frame, returning pooled rows to their pools.
+
+        Pooled rows are only unpacked; everything else is destroyed as before.
+        """
+        for kind, refs in self._form_pool_in_use:
+            if kind == 'field':
+                refs.tooltip.cancel()
+            self._form_pool[kind].append(refs)
+        self._form_pool_in_use.clear()
+
+        pooled = self._form_pooled_widgets
+        for widget in self.form_content.winfo_children():
+            if widget in pooled:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+
+    def _take_pooled_form_row(self, kind: str):
+        """Pop a free pooled row of the given kind (None if the pool is empty)."""
+        pool = self._form_pool[kind]
+        return pool.pop() if pool else None
+
+    def _hide_form_header_footer(self):
+        """Hide the fixed header and footer if they have been created."""
+        if self.form_header is not None:
+            self.form_header.frame.grid_remove()
+        if self.form_footer is not None:
+            self.form_footer.frame.grid_remove()
 
     # -------------------------------------------------------------------------
     # FILE OPERATIONS
@@ -2333,31 +3293,122 @@ class BuildingsView(ctk.CTkFrame):
                     self._get_cache_constructions_path(), recipe_name, original_construction)
 
             # Uncheck the item in the left pane and persist to INI
-            check_var = self.construction_check_vars.get(recipe_name)
-            if check_var:
-                check_var.set(False)
+            self._set_secrets_checked(recipe_name, False)
             self._save_checked_states_to_ini()
 
             # Reload the form from the now-reverted cache
             self._load_secrets_recipe(recipe_name)
             self._set_status(f"Reverted {recipe_name} to original")
 
+    def _clear_building_list(self):
+        """Hide pooled Secrets rows, destroy other list widgets, reset tracking state, and show the list."""
+        pooled = {row.frame for row in self._secrets_row_pool}
+        for widget in self.building_list.winfo_children():
+            if widget in pooled:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+        self.building_list_items.clear()
+        self.construction_checkboxes.clear()
+        self.secrets_checked.clear()
+        if self._def_tree_frame is not None:
+            self._def_tree_frame.pack_forget()
+        self.building_list.pack(fill="both", expand=True)
+
+    def _get_theme_color(self, color_tuple):
+        """Get the appropriate color based on current appearance mode."""
+        if isinstance(color_tuple, tuple) and len(color_tuple) == 2:
+            mode = ctk.get_appearance_mode()
+            return color_tuple[0] if mode == "Light" else color_tuple[1]
+        return color_tuple
+
+    def _ensure_def_tree(self) -> ttk.Treeview:
+        """Create the .def Treeview (checkbox + name columns) on first use."""
+        if self.def_tree is not None:
+            return self.def_tree
+
+        self._def_tree_frame = ctk.CTkFrame(self._list_container, fg_color="transparent")
+
+        # Style the Treeview to match the CTk theme
+        style = ttk.Style()
+        bg_color = self._get_theme_color(ctk.ThemeManager.theme["CTkFrame"]["fg_color"])
+        fg_color = self._get_theme_color(("gray10", "#E8E8E8"))
+        selected_color = self._get_theme_color(("#d0e8ff", "#1a4a6e"))
+        selected_fg = self._get_theme_color(("#0066cc", "#66b3ff"))
+
+        style.theme_use("clam")
+        style.configure("Buildings.Treeview",
+                        background=bg_color,
+                        foreground=fg_color,
+                        fieldbackground=bg_color,
+                        borderwidth=0,
+                        rowheight=28)
+        style.map("Buildings.Treeview",
+                  background=[("selected", selected_color)],
+                  foreground=[("selected", selected_fg)])
+
+        self.def_tree = ttk.Treeview(self._def_tree_frame, columns=("checked", "name"), show="",
+                                     style="Buildings.Treeview", selectmode="browse")
+        self.def_tree.column("checked", width=30, minwidth=30, stretch=False, anchor="center")
+        self.def_tree.column("name", width=200, minwidth=100, stretch=True, anchor="w")
+
+        scrollbar = ttk.Scrollbar(self._def_tree_frame, orient="vertical", command=self.def_tree.yview)
+        self.def_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.def_tree.pack(side="left", fill="both", expand=True)
+
+        # One binding for the whole list: checkbox column toggles, name column loads
+        self.def_tree.bind("<Button-1>", self._on_def_tree_click)
+        return self.def_tree
+
+    def _schedule_refresh(self, delay_ms: int = REFRESH_DEBOUNCE_MS):
+        """Request a definitions list refresh; requests within delay_ms coalesce into one."""
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(delay_ms, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        """Run a scheduled refresh unless a Secrets category is now showing."""
+        self._refresh_after_id = None
+        if self.view_mode == 'definitions':
+            self._refresh_building_list()
+
     def _refresh_building_list(self):
         """
         Refresh the list of .def files from the Buildings directory.
 
-        Clears and rebuilds the file list, creating a row for each .def file
-        with a checkbox and clickable label.
+        All files are shown in a single Treeview; each file is a cheap text row
+        with a checkbox column, instead of a CTkFrame/CTkCheckBox/CTkLabel triple.
+        Rows are kept across rescans: only added files get new rows and only
+        removed files have theirs deleted, so check state survives a refresh.
+        Runs immediately; use _schedule_refresh for coalesced requests.
         """
-        # Clear existing items
-        for widget in self.building_list.winfo_children():
-            widget.destroy()
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+        self._clear_building_list()
 
         # Get buildings directory (where .def files are stored)
         buildings_dir = get_buildings_dir()
 
-        # Find all .def files
-        self.def_files = sorted(buildings_dir.glob("*.def"))
+        # Find all .def files; the directory mtime only moves when entries are
+        # added, removed or renamed, so an unchanged mtime means the same list
+        try:
+            dir_mtime = os.stat(buildings_dir).st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = None
+        if dir_mtime is None:
+            self.def_files = []
+        elif dir_mtime != self._buildings_dir_mtime:
+            with os.scandir(buildings_dir) as it:
+                self.def_files = sorted(
+                    Path(entry.path) for entry in it
+                    if os.path.normcase(entry.name).endswith('.def') and entry.is_file()
+                )
+        self._buildings_dir_mtime = dir_mtime
+        # Files or labels may have changed, so the next filter scans every row
+        self._def_filter_text = None
 
         # Update count
         self.count_label.configure(text=f"{len(self.def_files)} definitions")
@@ -2371,59 +3422,79 @@ class BuildingsView(ctk.CTkFrame):
             no_files_label.pack(pady=20)
             return
 
-        # Clear previous item references and checkbox tracking
-        self.building_list_items.clear()
-        self.construction_checkboxes.clear()
-        self.construction_check_vars.clear()
+        tree = self._ensure_def_tree()
+        self.building_list.pack_forget()
+        self._def_tree_frame.pack(fill="both", expand=True)
+
+        # Drop rows for files that no longer exist
+        current = set(self.def_files)
+        removed = [fp for fp in self._def_labels if fp not in current]
+        if removed:
+            tree.delete(*(str(fp) for fp in removed))
+            for file_path in removed:
+                del self._def_labels[file_path]
+                del self._row_visible[file_path]
+                del self._row_search_blob[file_path]
+                self.construction_checked.pop(file_path, None)
 
-        # Create entry for each file with checkbox
         for file_path in self.def_files:
-            row_frame = ctk.CTkFrame(self.building_list, fg_color="transparent")
-            row_frame.pack(fill="x", pady=1)
-
-            # Checkbox for selection
-            check_var = ctk.BooleanVar(value=False)
-            checkbox = ctk.CTkCheckBox(
-                row_frame,
-                text="",
-                variable=check_var,
-                width=20,
-                command=lambda p=file_path: self._on_construction_checkbox_toggle(p)
-            )
-            checkbox.pack(side="left")
+            internal_name = file_path.stem
+            label_text = self._list_label(internal_name)
+            previous = self._def_labels.get(file_path)
+            if previous == label_text:
+                continue
+            self._def_labels[file_path] = label_text
+            self._row_search_blob[file_path] = f"{internal_name.lower()} {label_text.lower()}"
+            if previous is not None:
+                # Display name resolved since the last refresh (string table loaded)
+                tree.set(str(file_path), "name", label_text)
+                continue
+            # New rows start detached; the filter attaches them at their sorted index
+            self.construction_checked[file_path] = False
+            tree.insert("", "end", iid=str(file_path), values=("☐", label_text))
+            tree.detach(str(file_path))
+            self._row_visible[file_path] = False
 
-            # Store checkbox references
-            self.construction_checkboxes[file_path] = checkbox
-            self.construction_check_vars[file_path] = check_var
+        if self.current_def_path in self.construction_checked:
+            tree.selection_set(str(self.current_def_path))
 
-            internal_name = file_path.stem
-            display_name = self._lookup_game_name(internal_name)
-            label_text = (f"{display_name} ({internal_name})"
-                          if display_name != internal_name else internal_name)
+        # Apply any active filter
+        self._filter_definitions_list()
 
-            file_label = ctk.CTkLabel(
-                row_frame,
-                text=label_text,
-                anchor="w",
-                cursor="hand2",
-                text_color=("gray10", "#E8E8E8")
-            )
-            file_label.pack(side="left", fill="x", expand=True, padx=5)
-            file_label.bind("<Button-1>", lambda e, p=file_path: self._load_def_file(p))
-            row_frame.bind("<Button-1>", lambda e, p=file_path: self._load_def_file(p))
+    def _on_def_tree_click(self, event):
+        """Handle click on the .def Treeview - toggle checkbox column or load the file."""
+        tree = self.def_tree
+        if tree.identify("region", event.x, event.y) != "cell":
+            return None
 
-            # Store reference for highlighting (3-tuple with label text for filtering)
-            self.building_list_items[file_path] = (row_frame, file_label, label_text)
+        item_id = tree.identify_row(event.y)
+        if not item_id:
+            return None
+        file_path = Path(item_id)
+
+        # Column #1 is the checkbox column
+        if tree.identify_column(event.x) == "#1":
+            checked = not self.construction_checked.get(file_path, False)
+            self.construction_checked[file_path] = checked
+            tree.set(item_id, "checked", "☑" if checked else "☐")
+            self._on_construction_checkbox_toggle(file_path)
+            return "break"
 
-            # Hover effect (only if not selected)
-            file_label.bind("<Enter>", lambda e, p=file_path, lbl=file_label: self._on_item_hover(p, lbl, True))
-            file_label.bind("<Leave>", lambda e, p=file_path, lbl=file_label: self._on_item_hover(p, lbl, False))
+        self._load_def_file(file_path)
+        return None
 
-        # Apply any active filter
-        self._filter_definitions_list()
+    def _on_search_changed(self):
+        """Debounce search input so the list is filtered once typing pauses."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._filter_definitions_list)
 
     def _filter_definitions_list(self):
         """Filter the definitions list based on search text."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+
         if not self.def_search_var:
             return
 
@@ -2434,24 +3505,41 @@ class BuildingsView(ctk.CTkFrame):
 
         filter_text = self.def_search_var.get().lower().strip()
 
-        visible_count = 0
-        for file_path, item_data in self.building_list_items.items():
-            row_frame = item_data[0]
-            label_text = item_data[2] if len(item_data) == 3 else ""
-
-            # Handle both Path objects and string keys
-            if isinstance(file_path, Path):
-                name_str = file_path.stem.lower()
-            else:
-                name_str = str(file_path).lower()
-
-            # Search against both internal name and display text
-            search_str = f"{name_str} {label_text.lower()}"
-            if not filter_text or filter_text in search_str:
-                row_frame.pack(fill="x", pady=1)
-                visible_count += 1
-            else:
-                row_frame.pack_forget()
+        # Search against the precomputed internal name + display text blob. When
+        # the new text contains the previous one (typing more), only previous
+        # matches can still match, so narrow those instead of scanning every row
+        search_blob = self._row_search_blob
+        previous_text = self._def_filter_text
+        if previous_text is not None and previous_text in filter_text:
+            candidates = self._def_visible_paths
+        else:
+            candidates = self.def_files
+        self._def_visible_paths = [
+            file_path for file_path in candidates
+            if not filter_text or filter_text in search_blob.get(file_path, "")
+        ]
+        self._def_filter_text = filter_text
+        visible_count = len(self._def_visible_paths)
+
+        # Only touch rows whose visibility changed since the last filter
+        if self.def_tree is not None and self._def_labels:
+            tree = self.def_tree
+            row_visible = self._row_visible
+            matched = set(self._def_visible_paths)
+            hidden = [fp for fp, shown in row_visible.items() if shown and fp not in matched]
+            if hidden:
+                tree.detach(*(str(fp) for fp in hidden))
+                for file_path in hidden:
+                    row_visible[file_path] = False
+            # Attached rows stay sorted, so re-attaching in ascending index order is exact
+            shown_count = 0
+            for index, file_path in enumerate(self._def_visible_paths):
+                if not row_visible[file_path]:
+                    tree.move(str(file_path), "", index)
+                    row_visible[file_path] = True
+                    shown_count += 1
+            if hidden or shown_count:
+                tree.yview_moveto(0)
 
         # Update count label with filter info
         total = len(self.def_files)
@@ -2474,27 +3562,9 @@ class BuildingsView(ctk.CTkFrame):
 
     def _highlight_selected_item(self, selected_path: Path):
         """Highlight the selected building in the list."""
-        for file_path, item_data in self.building_list_items.items():
-            row_frame, file_label = item_data[0], item_data[1]
-            if file_path == selected_path:
-                # Selected state - highlight with accent color
-                row_frame.configure(fg_color=("#d0e8ff", "#1a4a6e"))
-                file_label.configure(text_color=("#0066cc", "#66b3ff"))
-            else:
-                # Unselected state - reset to default
-                row_frame.configure(fg_color="transparent")
-                file_label.configure(text_color=("gray10", "#E8E8E8"))
-
-    def _on_item_hover(self, file_path: Path, label: ctk.CTkLabel, entering: bool):
-        """Handle hover effect on list items, respecting selection state."""
-        # Don't change hover color if this is the selected item
-        if file_path == self.current_def_path:
-            return
-
-        if entering:
-            label.configure(text_color="#4CAF50")
-        else:
-            label.configure(text_color=("gray10", "#E8E8E8"))
+        if self.def_tree is not None and self.def_tree.exists(str(selected_path)):
+            self.def_tree.selection_set(str(selected_path))
+            self.def_tree.see(str(selected_path))
 
     def _on_select_all_toggle(self):
         """Toggle all construction checkboxes based on select-all state."""
@@ -2502,8 +3572,10 @@ class BuildingsView(ctk.CTkFrame):
             return
 
         select_all = self.select_all_var.get()
-        for _, check_var in self.construction_check_vars.items():
-            check_var.set(select_all)
+        symbol = "☑" if select_all else "☐"
+        for file_path in self.construction_checked:
+            self.construction_checked[file_path] = select_all
+            self.def_tree.set(str(file_path), "checked", symbol)
 
         # Save to INI file immediately if we have a construction pack selected
         if self.current_construction_pack:
@@ -2532,10 +3604,22 @@ class BuildingsView(ctk.CTkFrame):
         if self.current_secrets_recipe_name:
             self._load_secrets_recipe(self.current_secrets_recipe_name)
 
-    def _on_secrets_checkbox_toggle(self, _recipe_name: str):
+    def _on_secrets_checkbox_toggle(self, recipe_name: str):
         """Handle secrets item checkbox toggle - saves to INI in real-time."""
+        self.secrets_checked[recipe_name] = bool(self.construction_checkboxes[recipe_name].get())
         self._save_checked_states_to_ini()
 
+    def _set_secrets_checked(self, recipe_name: str, checked: bool):
+        """Set a listed Secrets item's checked state, redrawing its checkbox only if it changed."""
+        if self.secrets_checked.get(recipe_name, checked) == checked:
+            return
+        self.secrets_checked[recipe_name] = checked
+        checkbox = self.construction_checkboxes[recipe_name]
+        if checked:
+            checkbox.select()
+        else:
+            checkbox.deselect()
+
     def _on_construction_checkbox_toggle(self, _file_path: Path):
         """Handle individual construction checkbox toggle - saves to INI in real-time."""
         # Save to INI file immediately if we have a construction pack selected
@@ -2553,10 +3637,7 @@ class BuildingsView(ctk.CTkFrame):
         ini_path = pack_dir / f"{pack_name}.ini"
 
         # Get selected construction names
-        selected_names = [
-            fp.stem for fp, check_var in self.construction_check_vars.items()
-            if check_var.get()
-        ]
+        selected_names = [fp.stem for fp, checked in self.construction_checked.items() if checked]
 
         # Write to INI
         config = configparser.ConfigParser()
@@ -2601,7 +3682,15 @@ class BuildingsView(ctk.CTkFrame):
 
         Processes buildings, weapons, and armor simultaneously, creating separate
         .def files per source JSON file (e.g. MODIFY DT_Constructions.def).
+
+        Paths and checked names are resolved here on the Tk thread (they depend
+        on view_mode and the change set); reading, diffing and writing run in
+        the background via _build_changes_worker.
         """
+        if self._build_future is not None:
+            self._set_status("A build is already running")
+            return
+
         # Save current view's checked states before switching modes
         self._save_checked_states_to_ini()
         saved_view_mode = self.view_mode
@@ -2668,36 +3757,94 @@ class BuildingsView(ctk.CTkFrame):
             },
         ]
 
+        # Resolve each mode with checked items into a build plan
+        plan = []
+        try:
+            for cfg in mode_configs:
+                self.view_mode = cfg['mode']
+                # Skip modes already known to have nothing checked without re-reading
+                if self._has_checks.get(self._get_checked_ini_path()) is False:
+                    continue
+                checked_names = self._load_checked_states_from_ini()
+                if not checked_names:
+                    continue
+
+                has_recipes = cfg['recipes_name'] is not None
+                plan.append({
+                    **cfg,
+                    'checked_names': sorted(checked_names),
+                    'orig_recipes': self._get_secrets_recipes_path() if has_recipes else None,
+                    'cache_recipes': self._get_cache_recipes_path() if has_recipes else None,
+                    'orig_defs': self._get_secrets_constructions_path(),
+                    'cache_defs': self._get_cache_constructions_path(),
+                })
+        finally:
+            # Restore view mode
+            self.view_mode = saved_view_mode
+
+        if not plan:
+            self._set_status("No changes found across any checked items")
+            return
+
+        prefix = self.secrets_prefix_var.get() if hasattr(self, 'secrets_prefix_var') else ""
+        set_root = get_default_changesecrets_dir() / prefix / "definitions" if prefix else None
+        future = _IO_POOL.submit(
+            self._build_changes_worker, plan, prefix,
+            get_appdata_dir() / "Definitions", set_root)
+        self._build_future = future
+        self.after(50, self._poll_build_result, future)
+
+    def _build_changes_worker(
+        self, plan: list[dict], prefix: str, global_root: Path, set_root: Optional[Path]
+    ) -> tuple[int, int]:
+        """Diff the planned modes and write MODIFY .def files (runs off the Tk thread).
+
+        Every distinct table JSON is read and parsed once, concurrently, before
+        the diff; DT_ItemRecipes.json is shared by weapons/armor/tools/items.
+
+        Args:
+            plan: Per-mode configs with checked_names and resolved table paths
+            prefix: Active change set prefix ('' for none)
+            global_root: Definitions directory the Mod Builder reads
+            set_root: Change set definitions directory, or None without a prefix
+
+        Returns:
+            Tuple of (files written or already up to date, total changes)
+        """
+        table_keys = ('orig_recipes', 'cache_recipes', 'orig_defs', 'cache_defs')
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="buildings-read") as pool:
+            tables = {}
+            for entry in plan:
+                for key in table_keys:
+                    path = entry[key]
+                    if path is not None and path not in tables:
+                        tables[path] = pool.submit(self._load_table_data, path)
+
         # Collect changes keyed by (output_subdir, filename, def_path)
         all_changes = {}
 
-        for cfg in mode_configs:
-            self.view_mode = cfg['mode']
-            checked_names = self._load_checked_states_from_ini()
-            if not checked_names:
-                continue
-
+        for entry in plan:
             # Load original and cached data for this mode
-            has_recipes = cfg['recipes_name'] is not None
+            has_recipes = entry['recipes_name'] is not None
             try:
                 if has_recipes:
-                    orig_recipes = self._load_table_data(self._get_secrets_recipes_path())
-                    cache_recipes = self._load_table_data(self._get_cache_recipes_path())
-                orig_defs = self._load_table_data(self._get_secrets_constructions_path())
-                cache_defs = self._load_table_data(self._get_cache_constructions_path())
+                    orig_recipes = tables[entry['orig_recipes']].result()
+                    cache_recipes = tables[entry['cache_recipes']].result()
+                orig_defs = tables[entry['orig_defs']].result()
+                cache_defs = tables[entry['cache_defs']].result()
             except (OSError, json.JSONDecodeError, KeyError) as e:
-                logger.error("Build: could not read %s files: %s", cfg['mode'], e)
+                logger.error("Build: could not read %s files: %s", entry['mode'], e)
                 continue
 
             # Diff checked items
-            for name in sorted(checked_names):
+            for name in entry['checked_names']:
                 # Recipe changes (only for modes with recipes)
                 if has_recipes:
                     orig_row = orig_recipes.get(name, {})
                     cache_row = cache_recipes.get(name, {})
                     recipe_diffs = self._diff_row_properties(name, orig_row, cache_row)
                     if recipe_diffs:
-                        key = (cfg['output_subdir'], cfg['recipes_name'], cfg['recipes_def_path'])
+                        key = (entry['output_subdir'], entry['recipes_name'], entry['recipes_def_path'])
                         all_changes.setdefault(key, []).extend(recipe_diffs)
 
                 # Definition changes
@@ -2705,72 +3852,80 @@ class BuildingsView(ctk.CTkFrame):
                 cache_row = cache_defs.get(name, {})
                 def_diffs = self._diff_row_properties(name, orig_row, cache_row)
                 if def_diffs:
-                    key = (cfg['output_subdir'], cfg['defs_name'], cfg['defs_def_path'])
+                    key = (entry['output_subdir'], entry['defs_name'], entry['defs_def_path'])
                     all_changes.setdefault(key, []).extend(def_diffs)
 
-        # Restore view mode
-        self.view_mode = saved_view_mode
-
-        if not all_changes:
-            self._set_status("No changes found across any checked items")
-            return
-
         # Write a separate .def file for each JSON file that has changes
         files_created = 0
         total_changes = 0
-        try:
-            for (output_subdir, filename, def_path), changes in all_changes.items():
-                if not changes:
-                    continue
+        created_dirs: set[Path] = set()
+        prefix_str = f"{prefix}_" if prefix else ""
+        for (output_subdir, filename, def_path), changes in all_changes.items():
+            if not changes:
+                continue
+
+            def_name = f"{prefix_str}MODIFY {filename}"
+
+            lines = [
+                '<?xml version="1.0" encoding="UTF-8"?>',
+                '<definition>',
+                f'  <title>{_escape_xml(def_name)}</title>',
+                '  <author>Moria MOD Creator</author>',
+                f'  <description>{len(changes)} modifications to {filename}.json</description>',
+                f'  <mod file="{def_path}">',
+            ]
+            lines.extend(_iter_change_lines(changes))
+            lines += ('  </mod>', '</definition>')
+
+            # Encode once (platform newlines, as text-mode writes produced)
+            def_bytes = _encode_lines(lines)
 
-                prefix = self.secrets_prefix_var.get() if hasattr(self, 'secrets_prefix_var') else ""
-                prefix_str = f"{prefix}_" if prefix else ""
-                def_name = f"{prefix_str}MODIFY {filename}"
-
-                lines = [
-                    '<?xml version="1.0" encoding="UTF-8"?>',
-                    '<definition>',
-                    f'  <title>{self._escape_xml(def_name)}</title>',
-                    '  <author>Moria MOD Creator</author>',
-                    f'  <description>{len(changes)} modifications to {filename}.json</description>',
-                    f'  <mod file="{def_path}">',
-                ]
-                for item, prop, value in changes:
-                    lines.append(
-                        f'    <change item="{self._escape_xml(item)}" '
-                        f'property="{self._escape_xml(prop)}" '
-                        f'value="{self._escape_xml(str(value))}" />'
-                    )
-                lines.append('  </mod>')
-                lines.append('</definition>')
-
-                def_content = '\n'.join(lines)
-
-                # Write to global Definitions directory (for Mod Builder)
-                global_dir = get_appdata_dir() / "Definitions" / output_subdir
+            # Write to global Definitions directory (for Mod Builder)
+            global_dir = global_root / output_subdir
+            if global_dir not in created_dirs:
                 global_dir.mkdir(parents=True, exist_ok=True)
-                global_file = global_dir / f"{def_name}.def"
-                with open(global_file, 'w', encoding='utf-8') as f:
-                    f.write(def_content)
+                created_dirs.add(global_dir)
+            global_file = global_dir / f"{def_name}.def"
+            if _write_if_changed(global_file, def_bytes):
                 logger.info("Wrote %s with %d changes", global_file.name, len(changes))
+            else:
+                logger.info("%s already up to date", global_file.name)
 
-                # Also write to change set directory (for persistence)
-                if prefix:
-                    set_dir = get_default_changesecrets_dir() / prefix / "definitions" / output_subdir
+            # Also write to change set directory (for persistence)
+            if set_root is not None:
+                set_dir = set_root / output_subdir
+                if set_dir not in created_dirs:
                     set_dir.mkdir(parents=True, exist_ok=True)
-                    set_file = set_dir / f"{def_name}.def"
-                    with open(set_file, 'w', encoding='utf-8') as f:
-                        f.write(def_content)
+                    created_dirs.add(set_dir)
+                set_file = set_dir / f"{def_name}.def"
+                if _write_if_changed(set_file, def_bytes):
                     logger.info("Saved to change set: %s", set_file.name)
 
-                files_created += 1
-                total_changes += len(changes)
+            files_created += 1
+            total_changes += len(changes)
+
+        return files_created, total_changes
 
+    def _poll_build_result(self, future: Future):
+        """Wait for the background build to finish, then report it on the Tk thread."""
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(50, self._poll_build_result, future)
+            return
+
+        self._build_future = None
+        try:
+            files_created, total_changes = future.result()
         except OSError as e:
             logger.error("Error writing .def files: %s", e)
             self._set_status(f"Build failed: {e}", is_error=True)
             return
 
+        if not files_created:
+            self._set_status("No changes found across any checked items")
+            return
+
         self._set_status(
             f"Build complete: {files_created} .def file(s), {total_changes} total change(s)"
         )
@@ -2784,8 +3939,7 @@ class BuildingsView(ctk.CTkFrame):
         Returns:
             Dict mapping row name to row dict
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_file(json_path)
 
         rows_by_name = {}
         exports = data.get('Exports', [])
@@ -2816,8 +3970,9 @@ class BuildingsView(ctk.CTkFrame):
             List of (item_name, property_path, new_value_str) tuples
         """
         changes = []
-        orig_props = {p.get('Name'): p for p in orig_row.get('Value', []) if p.get('Name')}
-        cache_props = {p.get('Name'): p for p in cache_row.get('Value', []) if p.get('Name')}
+        append = changes.append
+        orig_props = {name: p for p in orig_row.get('Value', []) if (name := p.get('Name'))}
+        cache_props = {name: p for p in cache_row.get('Value', []) if (name := p.get('Name'))}
 
         for prop_name, cache_prop in cache_props.items():
             orig_prop = orig_props.get(prop_name)
@@ -2825,46 +3980,44 @@ class BuildingsView(ctk.CTkFrame):
                 continue  # New property, skip
 
             # Quick check: if JSON is identical, no change
-            if json.dumps(orig_prop, sort_keys=True) == json.dumps(cache_prop, sort_keys=True):
+            if _deep_eq(orig_prop, cache_prop):
                 continue
 
-            prop_type = cache_prop.get('$type', '')
+            kind = _property_kind(cache_prop.get('$type', ''))
             cache_val = cache_prop.get('Value')
             orig_val = orig_prop.get('Value')
 
             # Simple scalar types
-            if any(t in prop_type for t in ('BoolPropertyData', 'IntPropertyData',
-                                             'FloatPropertyData', 'EnumPropertyData',
-                                             'NamePropertyData')):
+            if kind == 'scalar':
                 if cache_val != orig_val:
-                    changes.append((row_name, prop_name, str(cache_val)))
+                    append((row_name, prop_name, str(cache_val)))
 
             # Text property - compare CultureInvariantString
-            elif 'TextPropertyData' in prop_type:
+            elif kind == 'text':
                 orig_text = orig_prop.get('CultureInvariantString', '')
                 cache_text = cache_prop.get('CultureInvariantString', '')
                 if orig_text != cache_text:
-                    changes.append((row_name, f"{prop_name}.CultureInvariantString", cache_text))
+                    append((row_name, f"{prop_name}.CultureInvariantString", cache_text))
 
             # SoftObject property (Actor paths)
-            elif 'SoftObjectPropertyData' in prop_type:
+            elif kind == 'softobj':
                 orig_path = (orig_prop.get('Value', {}).get('AssetPath', {})
                              .get('AssetName', ''))
                 cache_path = (cache_prop.get('Value', {}).get('AssetPath', {})
                               .get('AssetName', ''))
                 if orig_path != cache_path:
-                    changes.append((row_name, f"{prop_name}.AssetPath.AssetName", cache_path))
+                    append((row_name, f"{prop_name}.AssetPath.AssetName", cache_path))
 
             # Struct property (e.g. ResultConstructionHandle) - diff inner properties
-            elif 'StructPropertyData' in prop_type:
+            elif kind == 'struct':
                 if isinstance(orig_val, list) and isinstance(cache_val, list):
                     inner_changes = self._diff_struct_properties(
                         row_name, prop_name, orig_val, cache_val)
                     changes.extend(inner_changes)
 
-            # Array property (materials, name arrays) - compare serialized
-            elif 'ArrayPropertyData' in prop_type:
-                if json.dumps(orig_val, sort_keys=True) != json.dumps(cache_val, sort_keys=True):
+            # Array property (materials, name arrays) - compare structurally
+            elif kind == 'array':
+                if not _deep_eq(orig_val, cache_val):
                     # For arrays of simple values, try element-level diff
                     inner = self._diff_array_properties(
                         row_name, prop_name, orig_val, cache_val)
@@ -2872,7 +4025,7 @@ class BuildingsView(ctk.CTkFrame):
 
             # Fallback: any other type where Value changed
             elif cache_val != orig_val:
-                changes.append((row_name, prop_name, str(cache_val)))
+                append((row_name, prop_name, str(cache_val)))
 
         return changes
 
@@ -2881,68 +4034,14 @@ class BuildingsView(ctk.CTkFrame):
         orig_props: list, cache_props: list
     ) -> list[tuple[str, str, str]]:
         """Diff inner properties of a struct, returning dot-path changes."""
-        changes = []
-        # Guard: if list contains non-dict items (e.g. strings), skip struct diff
-        if not all(isinstance(p, dict) for p in orig_props) or \
-           not all(isinstance(p, dict) for p in cache_props):
-            return changes
-        orig_map = {p.get('Name'): p for p in orig_props if p.get('Name')}
-        cache_map = {p.get('Name'): p for p in cache_props if p.get('Name')}
-
-        for inner_name, cache_inner in cache_map.items():
-            orig_inner = orig_map.get(inner_name)
-            if orig_inner is None:
-                continue
-            if json.dumps(orig_inner, sort_keys=True) == json.dumps(cache_inner, sort_keys=True):
-                continue
-
-            inner_val = cache_inner.get('Value')
-            orig_inner_val = orig_inner.get('Value')
-
-            # Simple scalar inner value
-            if not isinstance(inner_val, (list, dict)):
-                if inner_val != orig_inner_val:
-                    changes.append((row_name, f"{parent_path}.{inner_name}", str(inner_val)))
-            # Nested struct
-            elif isinstance(inner_val, list) and isinstance(orig_inner_val, list):
-                changes.extend(self._diff_struct_properties(
-                    row_name, f"{parent_path}.{inner_name}", orig_inner_val, inner_val))
-
-        return changes
+        return _diff_nested(row_name, parent_path, orig_props, cache_props, 'struct')
 
     def _diff_array_properties(
         self, row_name: str, prop_name: str,
         orig_arr: list, cache_arr: list
     ) -> list[tuple[str, str, str]]:
         """Diff array elements, returning indexed changes where possible."""
-        changes = []
-
-        # Compare element by element for matching indices
-        for i in range(min(len(orig_arr), len(cache_arr))):
-            orig_elem = orig_arr[i]
-            cache_elem = cache_arr[i]
-
-            if json.dumps(orig_elem, sort_keys=True) == json.dumps(cache_elem, sort_keys=True):
-                continue
-
-            # If elements are structs with Value arrays, diff their inner properties
-            if (isinstance(orig_elem, dict) and isinstance(cache_elem, dict)
-                    and 'Value' in orig_elem and 'Value' in cache_elem
-                    and isinstance(orig_elem['Value'], list)):
-                inner = self._diff_struct_properties(
-                    row_name, f"{prop_name}[{i}]",
-                    orig_elem['Value'], cache_elem['Value'])
-                changes.extend(inner)
-            elif isinstance(orig_elem, dict) and isinstance(cache_elem, dict):
-                # Simple dict element - compare Value field
-                orig_v = orig_elem.get('Value', '')
-                cache_v = cache_elem.get('Value', '')
-                if orig_v != cache_v:
-                    changes.append((row_name, f"{prop_name}[{i}]", str(cache_v)))
-            else:
-                changes.append((row_name, f"{prop_name}[{i}]", str(cache_elem)))
-
-        return changes
+        return _diff_nested(row_name, prop_name, orig_arr, cache_arr, 'array')
 
     def _write_changes_def_file(
         self, output_file: Path, def_name: str,
@@ -2976,43 +4075,31 @@ class BuildingsView(ctk.CTkFrame):
         lines = [
             '<?xml version="1.0" encoding="UTF-8"?>',
             '<definition>',
-            f'  <title>{self._escape_xml(def_name)}</title>',
+            f'  <title>{_escape_xml(def_name)}</title>',
             '  <author>Moria MOD Creator</author>',
             f'  <description>{desc_label} modifications: {len(recipe_changes)} recipe changes, '
             f'{len(construction_changes)} definition changes</description>',
         ]
 
-        if recipe_changes:
-            lines.append(f'  <mod file="{recipes_def_path}">')
-            for item, prop, value in recipe_changes:
-                lines.append(
-                    f'    <change item="{self._escape_xml(item)}" '
-                    f'property="{self._escape_xml(prop)}" '
-                    f'value="{self._escape_xml(str(value))}" />'
-                )
-            lines.append('  </mod>')
-
-        if construction_changes:
-            lines.append(f'  <mod file="{defs_def_path}">')
-            for item, prop, value in construction_changes:
-                lines.append(
-                    f'    <change item="{self._escape_xml(item)}" '
-                    f'property="{self._escape_xml(prop)}" '
-                    f'value="{self._escape_xml(str(value))}" />'
-                )
+        for mod_path, changes in ((recipes_def_path, recipe_changes),
+                                  (defs_def_path, construction_changes)):
+            if not changes:
+                continue
+            lines.append(f'  <mod file="{mod_path}">')
+            lines.extend(_iter_change_lines(changes))
             lines.append('  </mod>')
 
         lines.append('</definition>')
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        with open(output_file, 'wb') as f:
+            f.write(_encode_lines(lines))
 
         logger.info("Wrote changes .def file: %s (%d recipe, %d construction changes)",
                      output_file, len(recipe_changes), len(construction_changes))
 
     def _get_imports_for_constructions(
-        self, constructions_path: Path, construction_names: list[str]
-    ) -> list[str]:
+        self, constructions_path: Path, construction_names: frozenset[str] | list[str]
+    ) -> list[dict]:
         """Extract icon Import entries needed by the specified constructions.
 
         Reads the Imports array from the JSON file and finds entries referenced
@@ -3020,14 +4107,13 @@ class BuildingsView(ctk.CTkFrame):
 
         Args:
             constructions_path: Path to DT_Constructions.json
-            construction_names: List of construction row names to check
+            construction_names: Construction row names to check (any iterable)
 
         Returns:
-            List of import JSON text strings (each is a JSON array)
+            List of parsed Import entries, deduplicated by ObjectName
         """
         try:
-            with open(constructions_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(constructions_path)
         except (OSError, json.JSONDecodeError):
             return []
 
@@ -3039,35 +4125,8 @@ class BuildingsView(ctk.CTkFrame):
         if not exports:
             return []
 
-        table = exports[0].get('Table', {})
-        rows = table.get('Data', [])
-
-        # Collect needed import entries
-        needed_imports = []
-        seen = set()
-
-        for row in rows:
-            if row.get('Name') not in construction_names:
-                continue
-
-            # Find Icon property with negative import index
-            for prop in row.get('Value', []):
-                if prop.get('Name') == 'Icon':
-                    icon_idx = prop.get('Value')
-                    if isinstance(icon_idx, int) and icon_idx < 0:
-                        # Negative index: -2 means Imports[1], also need Imports[0]
-                        texture_idx = abs(icon_idx) - 1
-                        package_idx = texture_idx - 1
-                        for idx in (package_idx, texture_idx):
-                            if 0 <= idx < len(all_imports):
-                                obj_name = all_imports[idx].get('ObjectName', '')
-                                if obj_name and obj_name not in seen:
-                                    seen.add(obj_name)
-                                    needed_imports.append(all_imports[idx])
-
-        if needed_imports:
-            return [json.dumps(needed_imports, separators=(',', ':'))]
-        return []
+        rows = exports[0].get('Table', {}).get('Data', [])
+        return _collect_icon_imports(rows, construction_names, all_imports)
 
     def _write_combined_def_file(
         self,
@@ -3076,86 +4135,43 @@ class BuildingsView(ctk.CTkFrame):
         recipe_rows: list,
         construction_rows: list,
         all_imports: list
-    ):
-        """Write the combined .def file with all recipes and constructions.
+    ) -> Future:
+        """Write the combined .def file on the background I/O worker.
+
+        Writes queue up in order on the single _IO_POOL thread; the outcome
+        is reported to the status bar by _poll_combined_def_write.
 
         Args:
             output_file: Path to write the .def file
             pack_name: Name of the construction pack
             recipe_rows: List of (name, json_text) tuples for recipes
             construction_rows: List of (name, json_text) tuples for constructions
-            all_imports: List of imports JSON texts
-        """
-        # Merge all imports into one array (deduplicated)
-        merged_imports = []
-        seen_imports = set()
-        for imports_text in all_imports:
-            try:
-                imports_list = json.loads(imports_text)
-                for imp in imports_list:
-                    obj_name = imp.get('ObjectName', '')
-                    if obj_name and obj_name not in seen_imports:
-                        seen_imports.add(obj_name)
-                        merged_imports.append(imp)
-            except json.JSONDecodeError:
-                pass
+            all_imports: List of parsed Import entries (dicts)
 
-        # Build the XML structure
-        lines = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<definition>',
-            f'  <title>{self._escape_xml(pack_name)}</title>',
-            '  <author>Moria MOD Creator</author>',
-            f'  <description>Combined construction pack with {len(recipe_rows)} recipes and {len(construction_rows)} constructions</description>',
-            '',  # Empty line after header
-        ]
-
-        # DT_ConstructionRecipes mod section
-        if recipe_rows:
-            lines.append('  <mod file="Moria\\Content\\Tech\\Data\\Building\\DT_ConstructionRecipes.json">')
-            lines.append('')  # Empty line after opening tag
-            for row_name, row_json in recipe_rows:
-                lines.append(f'    <add_row name="{self._escape_xml(row_name)}">')
-                lines.append(f'      <![CDATA[{row_json}]]>')
-                lines.append('    </add_row>')
-                lines.append('')  # Empty line between rows
-            lines.append('  </mod>')
-            lines.append('')  # Empty line after section
-
-        # DT_Constructions mod section
-        if construction_rows or merged_imports:
-            lines.append('  <mod file="Moria\\Content\\Tech\\Data\\Building\\DT_Constructions.json">')
-            lines.append('')  # Empty line after opening tag
-
-            # Add merged imports if any
-            if merged_imports:
-                imports_json = json.dumps(merged_imports, separators=(',', ':'))
-                lines.append(f'    <add_imports><![CDATA[{imports_json}]]></add_imports>')
-                lines.append('')  # Empty line after imports
-
-            for row_name, row_json in construction_rows:
-                lines.append(f'    <add_row name="{self._escape_xml(row_name)}">')
-                lines.append(f'      <![CDATA[{row_json}]]>')
-                lines.append('    </add_row>')
-                lines.append('')  # Empty line between rows
-            lines.append('  </mod>')
-
-        lines.append('</definition>')
-
-        # Write the file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        Returns:
+            Future that completes when the file has been written
+        """
+        future = _IO_POOL.submit(
+            _write_combined_def, output_file, pack_name, recipe_rows, construction_rows, all_imports
+        )
+        self.after(50, self._poll_combined_def_write, future, output_file)
+        return future
 
-        logger.info("Wrote combined .def file: %s", output_file)
+    def _poll_combined_def_write(self, future: Future, output_file: Path):
+        """Wait for a background combined .def write, then report it on the Tk thread."""
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self.after(50, self._poll_combined_def_write, future, output_file)
+            return
 
-    def _escape_xml(self, text: str) -> str:
-        """Escape special XML characters in text."""
-        return (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&apos;'))
+        try:
+            future.result()
+        except OSError as e:
+            logger.error("Error writing combined .def file %s: %s", output_file, e)
+            self._set_status(f"Failed to write {output_file.name}: {e}", is_error=True)
+            return
+        self._set_status(f"Wrote {output_file.name}")
 
     # -------------------------------------------------------------------------
     # FORM DISPLAY AND LAYOUT
@@ -3165,11 +4181,15 @@ class BuildingsView(ctk.CTkFrame):
         """Render the editable form, dispatching to per-type renderer."""
         # Hide placeholder and show form widgets
         self.placeholder_label.pack_forget()
+        self._ensure_form_header()
+        self._ensure_form_footer()
+        self._ensure_form_content()
 
-        # Clear existing form content
-        for widget in self.form_content.winfo_children():
-            widget.destroy()
-        self.form_content.pack(fill="both", expand=True)
+        # Unpack the content while it is rebuilt so Tk lays the new form out
+        # once when it is shown again, not after every field; pooled rows are
+        # kept for reuse
+        self.form_content.pack_forget()
+        self._clear_form_content()
 
         # Update header with def file metadata
         title = self.current_def_data.get("title", "")
@@ -3184,24 +4204,32 @@ class BuildingsView(ctk.CTkFrame):
                             if construction_name else "")
             if game_display and game_display != construction_name and game_display != title:
                 header_text = f"{header_text}  \u2014  {game_display}"
-            self.header_title.configure(text=header_text)
-            self.header_author.configure(text=f"by {author}" if author else "")
-            self.header_description.configure(text=description or "")
-            self.form_header.grid()
+            self.form_header.title.configure(text=header_text)
+            self.form_header.author.configure(text=f"by {author}" if author else "")
+            self.form_header.description.configure(text=description or "")
+            self.form_header.frame.grid()
         else:
-            self.form_header.grid_remove()
+            self.form_header.frame.grid_remove()
 
         # Show footer with save/revert/delete buttons
-        self.form_footer.grid()
+        self.form_footer.frame.grid()
 
         self.form_vars.clear()
         self.material_rows.clear()
         self.sandbox_material_rows.clear()
 
+        # Rows that are not JSON objects (e.g. a malformed .def) are dropped
+        # here, so the renderers below only need a truthiness check
         recipe_json = self.current_def_data.get("recipe_json")
+        if not isinstance(recipe_json, dict):
+            recipe_json = None
         construction_json = self.current_def_data.get("construction_json")
+        if not isinstance(construction_json, dict):
+            construction_json = None
 
-        # Dispatch to per-type form renderer
+        # Dispatch to per-type form renderer. Every load hands us freshly
+        # parsed rows, so the renderers' extract_* calls never see a dict
+        # they have already normalized and there is nothing to reuse.
         mode = self.view_mode or 'buildings'
         has_data = False
 
@@ -3225,6 +4253,7 @@ class BuildingsView(ctk.CTkFrame):
                 self.form_content, text="No data found for this item.",
                 text_color="gray"
             ).pack(anchor="center", pady=40)
+        self.form_content.pack(fill="both", expand=True)
 
         # Update header eye button to reflect current item's visibility
         self._update_header_eye_icon()
@@ -3235,7 +4264,7 @@ class BuildingsView(ctk.CTkFrame):
         """Render buildings form (construction recipe + construction definition)."""
         has_data = False
 
-        if recipe_json and isinstance(recipe_json, dict):
+        if recipe_json:
             has_data = True
             recipe = extract_recipe_fields(recipe_json)
 
@@ -3277,20 +4306,11 @@ class BuildingsView(ctk.CTkFrame):
             )
 
             self._create_subsection_header("Placement Options")
-            bool_row1 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            bool_row1.pack(fill="x", pady=4)
-            for bf in ["bOnWall", "bOnFloor", "bPlaceOnWater", "bOverrideRotation"]:
-                self._create_checkbox_field(bool_row1, bf, recipe[bf])
-
-            bool_row2 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            bool_row2.pack(fill="x", pady=4)
-            for bf in ["bAllowRefunds", "bAutoFoundation", "bInheritAutoFoundationStability", "bOnlyOnVoxel"]:
-                self._create_checkbox_field(bool_row2, bf, recipe[bf])
-
-            bool_row3 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            bool_row3.pack(fill="x", pady=4)
-            for bf in ["bIsBlockedByNearbySettlementStones", "bIsBlockedByNearbyRavenConstructions"]:
-                self._create_checkbox_field(bool_row3, bf, recipe[bf])
+            for bool_fields in _PLACEMENT_BOOL_ROWS:
+                bool_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
+                bool_row.pack(fill="x", pady=4)
+                for bf in bool_fields:
+                    self._create_checkbox_field(bool_row, bf, recipe[bf])
 
             self._create_subsection_header("Numeric Properties")
             self._create_text_field(
@@ -3315,7 +4335,7 @@ class BuildingsView(ctk.CTkFrame):
                 DEFAULT_ENABLED_STATE, label="Recipe Enabled State"
             )
 
-        if construction_json and isinstance(construction_json, dict):
+        if construction_json:
             has_data = True
             construction = extract_construction_fields(construction_json)
             self._render_construction_definition(construction)
@@ -3327,7 +4347,7 @@ class BuildingsView(ctk.CTkFrame):
         self._create_subsection_header("Required Materials")
         add_mat_btn = ctk.CTkButton(
             self.form_content, text="+ Add Material", width=120, height=28,
-            fg_color="#4CAF50", hover_color="#45a049",
+            **_FORM_GREEN_BTN,
             command=self._add_new_material_row
         )
         add_mat_btn.pack(anchor="w", pady=(0, 5))
@@ -3409,7 +4429,7 @@ class BuildingsView(ctk.CTkFrame):
         self._create_subsection_header("Sandbox Required Materials")
         add_sandbox_mat_btn = ctk.CTkButton(
             self.form_content, text="+ Add Sandbox Material", width=160, height=28,
-            fg_color="#4CAF50", hover_color="#45a049",
+            **_FORM_GREEN_BTN,
             command=self._add_new_sandbox_material_row
         )
         add_sandbox_mat_btn.pack(anchor="w", pady=(0, 5))
@@ -3444,7 +4464,7 @@ class BuildingsView(ctk.CTkFrame):
         self._create_dropdown_field(
             "Tags",
             construction["Tags"][0] if construction["Tags"] else "",
-            self._get_options("Tags", []),
+            self._get_options("Tags"),
             label="Category Tag"
         )
         self._create_text_field(
@@ -3497,6 +4517,15 @@ class BuildingsView(ctk.CTkFrame):
         self._create_section_header(section_title, section_color)
 
         self._create_text_field("Def_Name", fields["Name"], label="Row Name", readonly=True)
+        self._render_item_display_fields(fields)
+
+        self._create_subsection_header("Inventory")
+        self._render_item_inventory_fields(fields)
+
+        self._render_definition_enabled_state(fields)
+
+    def _render_item_display_fields(self, fields):
+        """Render the display name, description, actor, icon and category tag fields."""
         self._create_text_field("DisplayName", fields["DisplayName"], label="Display Name")
         self._create_text_field("Description", fields.get("Description", ""))
         self._create_text_field("Actor", fields.get("Actor", ""),
@@ -3509,48 +4538,45 @@ class BuildingsView(ctk.CTkFrame):
         self._create_dropdown_field(
             "Tags",
             tags[0] if tags else "",
-            self._get_options("Tags", []),
+            self._get_options("Tags"),
             label="Category Tag"
         )
 
-        # Inventory
-        self._create_subsection_header("Inventory")
+    def _render_item_inventory_fields(self, fields):
+        """Render the portability dropdown and inventory stat row."""
         self._create_dropdown_field(
-            "Portability", fields.get("Portability", "EItemPortability::Storable"),
-            ["EItemPortability::Storable", "EItemPortability::NotStorable",
-             "EItemPortability::Holdable"],
+            "Portability", fields.get("Portability", DEFAULT_PORTABILITY[0]),
+            DEFAULT_PORTABILITY,
             label="Portability"
         )
-        inv_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-        inv_row.pack(fill="x", pady=3)
-        for col in range(3):
-            inv_row.grid_columnconfigure(col, weight=1)
-        for i, (key, label) in enumerate([
-            ("MaxStackSize", "Max Stack"), ("SlotSize", "Slot Size"),
-            ("BaseTradeValue", "Trade Value")
-        ]):
-            frame = ctk.CTkFrame(inv_row, fg_color="transparent")
-            frame.grid(row=0, column=i, sticky="ew", padx=2)
-            ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                         width=80, anchor="w").pack(side="left")
-            var = ctk.StringVar(value=str(fields.get(key, 0)))
-            self.form_vars[key] = var
-            ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
+        self._render_stat_grid(_INVENTORY_STAT_SPECS, fields)
 
+    def _render_repair_cost(self, fields):
+        """Render the editable InitialRepairCost material rows, if the item has any."""
+        if not fields["InitialRepairCost"]:
+            return
+        self._create_subsection_header("Repair Cost")
+        self.materials_frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
+        self.materials_frame.pack(fill="x", pady=5)
+        for mat in fields["InitialRepairCost"]:
+            self._add_material_row(mat["Material"], mat["Amount"])
+
+    def _render_definition_enabled_state(self, fields, label: str = "Definition Enabled State"):
+        """Render the definition row's EnabledState dropdown."""
         self._create_dropdown_field(
             "Def_EnabledState", fields["EnabledState"],
-            DEFAULT_ENABLED_STATE, label="Definition Enabled State"
+            DEFAULT_ENABLED_STATE, label=label
         )
 
     def _show_weapon_form(self, recipe_json, definition_json):
         """Render weapon form (item recipe + weapon definition)."""
         has_data = False
 
-        if recipe_json and isinstance(recipe_json, dict):
+        if recipe_json:
             has_data = True
             self._render_item_recipe_section(recipe_json)
 
-        if definition_json and isinstance(definition_json, dict):
+        if definition_json:
             has_data = True
             w = extract_weapon_fields(definition_json)
 
@@ -3562,89 +4588,35 @@ class BuildingsView(ctk.CTkFrame):
             self._create_subsection_header("Combat Stats")
             self._create_text_field("DamageType", w["DamageType"], label="Damage Type",
                                     autocomplete_key="DamageTypes")
-            stats_row1 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            stats_row1.pack(fill="x", pady=3)
-            for col in range(4):
-                stats_row1.grid_columnconfigure(col, weight=1)
-            for i, (key, label) in enumerate([
-                ("Damage", "Damage"), ("Speed", "Speed"),
-                ("Durability", "Durability"), ("Tier", "Tier")
-            ]):
-                frame = ctk.CTkFrame(stats_row1, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                             width=70, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(w[key]))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=70).pack(side="left", padx=2)
-
-            stats_row2 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            stats_row2.pack(fill="x", pady=3)
-            for col in range(4):
-                stats_row2.grid_columnconfigure(col, weight=1)
-            for i, (key, label) in enumerate([
-                ("ArmorPenetration", "Armor Pen"),
-                ("StaminaCost", "Stamina Cost"),
-                ("EnergyCost", "Energy Cost"),
-                ("BlockDamageReduction", "Block Reduction")
-            ]):
-                frame = ctk.CTkFrame(stats_row2, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                             width=80, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(w[key]))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=70).pack(side="left", padx=2)
-
-            # Repair cost
-            if w["InitialRepairCost"]:
-                self._create_subsection_header("Repair Cost")
-                self.materials_frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
-                self.materials_frame.pack(fill="x", pady=5)
-                for mat in w["InitialRepairCost"]:
-                    self._add_material_row(mat["Material"], mat["Amount"])
-
-            # Display
-            self._create_subsection_header("Display")
-            self._create_text_field("DisplayName", w["DisplayName"], label="Display Name")
-            self._create_text_field("Description", w["Description"])
-            self._create_text_field("Actor", w["Actor"],
-                                    label="Actor Path", autocomplete_key="Actors")
-            self._create_text_field("Icon", w["Icon"], label="Icon Path", readonly=True)
-
-            # Tags & inventory
-            tags = w.get("Tags", [])
-            self._create_dropdown_field(
-                "Tags", tags[0] if tags else "",
-                self._get_options("Tags", []), label="Category Tag"
+            self._render_stat_grid(
+                (
+                    ("Damage", "Damage"),
+                    ("Speed", "Speed"),
+                    ("Durability", "Durability"),
+                    ("Tier", "Tier"),
+                ),
+                w, label_width=70, entry_width=70
             )
 
-            self._create_subsection_header("Inventory")
-            self._create_dropdown_field(
-                "Portability", w.get("Portability", "EItemPortability::Storable"),
-                ["EItemPortability::Storable", "EItemPortability::NotStorable",
-                 "EItemPortability::Holdable"], label="Portability"
+            self._render_stat_grid(
+                (
+                    ("ArmorPenetration", "Armor Pen"),
+                    ("StaminaCost", "Stamina Cost"),
+                    ("EnergyCost", "Energy Cost"),
+                    ("BlockDamageReduction", "Block Reduction"),
+                ),
+                w, entry_width=70
             )
-            inv_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            inv_row.pack(fill="x", pady=3)
-            for col in range(3):
-                inv_row.grid_columnconfigure(col, weight=1)
-            for i, (key, lbl) in enumerate([
-                ("MaxStackSize", "Max Stack"), ("SlotSize", "Slot Size"),
-                ("BaseTradeValue", "Trade Value")
-            ]):
-                frame = ctk.CTkFrame(inv_row, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=lbl, font=ctk.CTkFont(size=11),
-                             width=80, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(w.get(key, 0)))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
 
-            self._create_dropdown_field(
-                "Def_EnabledState", w["EnabledState"],
-                DEFAULT_ENABLED_STATE, label="Definition Enabled State"
-            )
+            self._render_repair_cost(w)
+
+            self._create_subsection_header("Display")
+            self._render_item_display_fields(w)
+
+            self._create_subsection_header("Inventory")
+            self._render_item_inventory_fields(w)
+
+            self._render_definition_enabled_state(w)
 
         return has_data
 
@@ -3652,11 +4624,11 @@ class BuildingsView(ctk.CTkFrame):
         """Render armor form (item recipe + armor definition)."""
         has_data = False
 
-        if recipe_json and isinstance(recipe_json, dict):
+        if recipe_json:
             has_data = True
             self._render_item_recipe_section(recipe_json)
 
-        if definition_json and isinstance(definition_json, dict):
+        if definition_json:
             has_data = True
             a = extract_armor_fields(definition_json)
 
@@ -3666,71 +4638,24 @@ class BuildingsView(ctk.CTkFrame):
 
             # Defense stats
             self._create_subsection_header("Defense Stats")
-            stats_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            stats_row.pack(fill="x", pady=3)
-            for col in range(3):
-                stats_row.grid_columnconfigure(col, weight=1)
-            for i, (key, label) in enumerate([
-                ("Durability", "Durability"),
-                ("DamageReduction", "Damage Reduction"),
-                ("DamageProtection", "Damage Protection"),
-            ]):
-                frame = ctk.CTkFrame(stats_row, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                             width=100, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(a[key]))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
-
-            # Repair cost
-            if a["InitialRepairCost"]:
-                self._create_subsection_header("Repair Cost")
-                self.materials_frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
-                self.materials_frame.pack(fill="x", pady=5)
-                for mat in a["InitialRepairCost"]:
-                    self._add_material_row(mat["Material"], mat["Amount"])
-
-            # Display & common
-            self._create_subsection_header("Display")
-            self._create_text_field("DisplayName", a["DisplayName"], label="Display Name")
-            self._create_text_field("Description", a["Description"])
-            self._create_text_field("Actor", a["Actor"],
-                                    label="Actor Path", autocomplete_key="Actors")
-            self._create_text_field("Icon", a["Icon"], label="Icon Path", readonly=True)
-
-            tags = a.get("Tags", [])
-            self._create_dropdown_field(
-                "Tags", tags[0] if tags else "",
-                self._get_options("Tags", []), label="Category Tag"
+            self._render_stat_grid(
+                (
+                    ("Durability", "Durability"),
+                    ("DamageReduction", "Damage Reduction"),
+                    ("DamageProtection", "Damage Protection"),
+                ),
+                a, label_width=100
             )
 
+            self._render_repair_cost(a)
+
+            self._create_subsection_header("Display")
+            self._render_item_display_fields(a)
+
             self._create_subsection_header("Inventory")
-            self._create_dropdown_field(
-                "Portability", a.get("Portability", "EItemPortability::Storable"),
-                ["EItemPortability::Storable", "EItemPortability::NotStorable",
-                 "EItemPortability::Holdable"], label="Portability"
-            )
-            inv_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            inv_row.pack(fill="x", pady=3)
-            for col in range(3):
-                inv_row.grid_columnconfigure(col, weight=1)
-            for i, (key, lbl) in enumerate([
-                ("MaxStackSize", "Max Stack"), ("SlotSize", "Slot Size"),
-                ("BaseTradeValue", "Trade Value")
-            ]):
-                frame = ctk.CTkFrame(inv_row, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=lbl, font=ctk.CTkFont(size=11),
-                             width=80, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(a.get(key, 0)))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
+            self._render_item_inventory_fields(a)
 
-            self._create_dropdown_field(
-                "Def_EnabledState", a["EnabledState"],
-                DEFAULT_ENABLED_STATE, label="Definition Enabled State"
-            )
+            self._render_definition_enabled_state(a)
 
         return has_data
 
@@ -3738,11 +4663,11 @@ class BuildingsView(ctk.CTkFrame):
         """Render tool form (item recipe + tool definition)."""
         has_data = False
 
-        if recipe_json and isinstance(recipe_json, dict):
+        if recipe_json:
             has_data = True
             self._render_item_recipe_section(recipe_json)
 
-        if definition_json and isinstance(definition_json, dict):
+        if definition_json:
             has_data = True
             t = extract_tool_fields(definition_json)
 
@@ -3750,90 +4675,36 @@ class BuildingsView(ctk.CTkFrame):
 
             self._create_text_field("Def_Name", t["Name"], label="Row Name", readonly=True)
 
-            # Tool stats
-            self._create_subsection_header("Tool Stats")
-            stats_row1 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            stats_row1.pack(fill="x", pady=3)
-            for col in range(3):
-                stats_row1.grid_columnconfigure(col, weight=1)
-            for i, (key, label) in enumerate([
-                ("Durability", "Durability"),
-                ("DurabilityDecayWhileEquipped", "Durability Decay"),
-                ("CarveHits", "Carve Hits"),
-            ]):
-                frame = ctk.CTkFrame(stats_row1, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                             width=90, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(t[key]))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
-
-            stats_row2 = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            stats_row2.pack(fill="x", pady=3)
-            for col in range(3):
-                stats_row2.grid_columnconfigure(col, weight=1)
-            for i, (key, label) in enumerate([
-                ("StaminaCost", "Stamina Cost"),
-                ("EnergyCost", "Energy Cost"),
-                ("NpcMiningRate", "NPC Mining Rate"),
-            ]):
-                frame = ctk.CTkFrame(stats_row2, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                             width=90, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(t[key]))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
-
-            # Repair cost
-            if t["InitialRepairCost"]:
-                self._create_subsection_header("Repair Cost")
-                self.materials_frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
-                self.materials_frame.pack(fill="x", pady=5)
-                for mat in t["InitialRepairCost"]:
-                    self._add_material_row(mat["Material"], mat["Amount"])
-
-            # Display & common
-            self._create_subsection_header("Display")
-            self._create_text_field("DisplayName", t["DisplayName"], label="Display Name")
-            self._create_text_field("Description", t["Description"])
-            self._create_text_field("Actor", t["Actor"],
-                                    label="Actor Path", autocomplete_key="Actors")
-            self._create_text_field("Icon", t["Icon"], label="Icon Path", readonly=True)
+            def build_tool_stats():
+                self._render_stat_grid(
+                    (
+                        ("Durability", "Durability"),
+                        ("DurabilityDecayWhileEquipped", "Durability Decay"),
+                        ("CarveHits", "Carve Hits"),
+                    ),
+                    t, label_width=90
+                )
+                self._render_stat_grid(
+                    (
+                        ("StaminaCost", "Stamina Cost"),
+                        ("EnergyCost", "Energy Cost"),
+                        ("NpcMiningRate", "NPC Mining Rate"),
+                    ),
+                    t, label_width=90
+                )
 
-            tags = t.get("Tags", [])
-            self._create_dropdown_field(
-                "Tags", tags[0] if tags else "",
-                self._get_options("Tags", []), label="Category Tag"
-            )
+            self._create_collapsible_section("Tool Stats", build_tool_stats, expanded=True)
 
-            self._create_subsection_header("Inventory")
-            self._create_dropdown_field(
-                "Portability", t.get("Portability", "EItemPortability::Storable"),
-                ["EItemPortability::Storable", "EItemPortability::NotStorable",
-                 "EItemPortability::Holdable"], label="Portability"
-            )
-            inv_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-            inv_row.pack(fill="x", pady=3)
-            for col in range(3):
-                inv_row.grid_columnconfigure(col, weight=1)
-            for i, (key, lbl) in enumerate([
-                ("MaxStackSize", "Max Stack"), ("SlotSize", "Slot Size"),
-                ("BaseTradeValue", "Trade Value")
-            ]):
-                frame = ctk.CTkFrame(inv_row, fg_color="transparent")
-                frame.grid(row=0, column=i, sticky="ew", padx=2)
-                ctk.CTkLabel(frame, text=lbl, font=ctk.CTkFont(size=11),
-                             width=80, anchor="w").pack(side="left")
-                var = ctk.StringVar(value=str(t.get(key, 0)))
-                self.form_vars[key] = var
-                ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
+            # Repair cost stays eager: saving rebuilds InitialRepairCost from
+            # material_rows, so unbuilt rows would wipe it
+            self._render_repair_cost(t)
 
-            self._create_dropdown_field(
-                "Def_EnabledState", t["EnabledState"],
-                DEFAULT_ENABLED_STATE, label="Definition Enabled State"
-            )
+            self._create_collapsible_section(
+                "Display", functools.partial(self._render_item_display_fields, t))
+            self._create_collapsible_section(
+                "Inventory", functools.partial(self._render_item_inventory_fields, t))
+
+            self._render_definition_enabled_state(t)
 
         return has_data
 
@@ -3841,11 +4712,11 @@ class BuildingsView(ctk.CTkFrame):
         """Render generic items form (item recipe + item definition)."""
         has_data = False
 
-        if recipe_json and isinstance(recipe_json, dict):
+        if recipe_json:
             has_data = True
             self._render_item_recipe_section(recipe_json)
 
-        if definition_json and isinstance(definition_json, dict):
+        if definition_json:
             has_data = True
             item = extract_item_fields(definition_json)
             self._render_common_item_fields(item, "Item Definition", "#5C6BC0")
@@ -3854,7 +4725,7 @@ class BuildingsView(ctk.CTkFrame):
 
     def _show_flora_form(self, definition_json):
         """Render flora form (no recipe)."""
-        if not definition_json or not isinstance(definition_json, dict):
+        if not definition_json:
             return False
 
         f = extract_flora_fields(definition_json)
@@ -3873,37 +4744,18 @@ class BuildingsView(ctk.CTkFrame):
 
         # Drop amounts
         self._create_subsection_header("Drop Amounts")
-        drop_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-        drop_row.pack(fill="x", pady=3)
-        for col in range(2):
-            drop_row.grid_columnconfigure(col, weight=1)
-        for i, (key, label) in enumerate([("MinCount", "Min Count"), ("MaxCount", "Max Count")]):
-            frame = ctk.CTkFrame(drop_row, fg_color="transparent")
-            frame.grid(row=0, column=i, sticky="ew", padx=2)
-            ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                         width=80, anchor="w").pack(side="left")
-            var = ctk.StringVar(value=str(f[key]))
-            self.form_vars[key] = var
-            ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
+        self._render_stat_grid((("MinCount", "Min Count"), ("MaxCount", "Max Count")), f)
 
         # Growth timing
         self._create_subsection_header("Growth Timing")
-        for key, label in [
-            ("NumToGrowPerCycle", "Grow Per Cycle"),
-            ("RegrowthSleepCount", "Regrowth Sleep Count"),
-            ("TimeUntilGrowingStage", "Time Until Growing"),
-            ("TimeUntilReadyStage", "Time Until Ready"),
-            ("TimeUntilSpoiledStage", "Time Until Spoiled"),
-            ("MinVariableGrowthTime", "Min Variable Growth"),
-            ("MaxVariableGrowthTime", "Max Variable Growth"),
-        ]:
+        for key, label in _FLORA_GROWTH_TIMING_FIELDS:
             self._create_text_field(key, str(f[key]), label=label, width=200)
 
         # Growth properties
         self._create_subsection_header("Growth Properties")
         bool_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
         bool_row.pack(fill="x", pady=4)
-        for bf in ["bPrefersInShade", "bCanSpoil", "IsPlantable", "IsFungus"]:
+        for bf in _FLORA_BOOL_FIELDS:
             self._create_checkbox_field(bool_row, bf, f.get(bf, False))
 
         self._create_text_field("MinimumFarmingLight", str(f["MinimumFarmingLight"]),
@@ -3912,47 +4764,25 @@ class BuildingsView(ctk.CTkFrame):
         # Enum dropdowns
         enum_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
         enum_row.pack(fill="x", pady=3)
+        self._create_dropdown_field_inline(enum_row, "FloraType", f["FloraType"], DEFAULT_FLORA_TYPE)
         self._create_dropdown_field_inline(
-            enum_row, "FloraType", f["FloraType"],
-            ["EMorFarmingFloraType::Flora", "EMorFarmingFloraType::Fungus",
-             "EMorFarmingFloraType::Tree", "EMorFarmingFloraType::Crop"]
-        )
-        self._create_dropdown_field_inline(
-            enum_row, "GrowthRate", f["GrowthRate"],
-            ["EMorFarmingFloraGrowthRate::None", "EMorFarmingFloraGrowthRate::Slow",
-             "EMorFarmingFloraGrowthRate::Medium", "EMorFarmingFloraGrowthRate::Fast"]
+            enum_row, "GrowthRate", f["GrowthRate"], DEFAULT_FLORA_GROWTH_RATE
         )
 
         # Scale
         self._create_subsection_header("Visual")
-        scale_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-        scale_row.pack(fill="x", pady=3)
-        for col in range(2):
-            scale_row.grid_columnconfigure(col, weight=1)
-        for i, (key, label) in enumerate([
-            ("MinRandomScale", "Min Scale"), ("MaxRandomScale", "Max Scale")
-        ]):
-            frame = ctk.CTkFrame(scale_row, fg_color="transparent")
-            frame.grid(row=0, column=i, sticky="ew", padx=2)
-            ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                         width=80, anchor="w").pack(side="left")
-            var = ctk.StringVar(value=str(f[key]))
-            self.form_vars[key] = var
-            ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
+        self._render_stat_grid((("MinRandomScale", "Min Scale"), ("MaxRandomScale", "Max Scale")), f)
 
         self._create_text_field("ReceptacleActorToSpawn", f["ReceptacleActorToSpawn"],
                                 label="Receptacle Actor", autocomplete_key="Actors")
 
-        self._create_dropdown_field(
-            "Def_EnabledState", f["EnabledState"],
-            DEFAULT_ENABLED_STATE, label="Enabled State"
-        )
+        self._render_definition_enabled_state(f, label="Enabled State")
 
         return True
 
     def _show_loot_form(self, definition_json):
         """Render loot form (no recipe, simple fields)."""
-        if not definition_json or not isinstance(definition_json, dict):
+        if not definition_json:
             return False
 
         lt = extract_loot_fields(definition_json)
@@ -3978,25 +4808,9 @@ class BuildingsView(ctk.CTkFrame):
         self._create_text_field("DropChance", str(lt["DropChance"]),
                                 label="Drop Chance (0-1)", width=200)
 
-        qty_row = ctk.CTkFrame(self.form_content, fg_color="transparent")
-        qty_row.pack(fill="x", pady=3)
-        for col in range(2):
-            qty_row.grid_columnconfigure(col, weight=1)
-        for i, (key, label) in enumerate([
-            ("MinQuantity", "Min Quantity"), ("MaxQuantity", "Max Quantity")
-        ]):
-            frame = ctk.CTkFrame(qty_row, fg_color="transparent")
-            frame.grid(row=0, column=i, sticky="ew", padx=2)
-            ctk.CTkLabel(frame, text=label, font=ctk.CTkFont(size=11),
-                         width=80, anchor="w").pack(side="left")
-            var = ctk.StringVar(value=str(lt[key]))
-            self.form_vars[key] = var
-            ctk.CTkEntry(frame, textvariable=var, width=80).pack(side="left", padx=2)
+        self._render_stat_grid((("MinQuantity", "Min Quantity"), ("MaxQuantity", "Max Quantity")), lt)
 
-        self._create_dropdown_field(
-            "Def_EnabledState", lt["EnabledState"],
-            DEFAULT_ENABLED_STATE, label="Enabled State"
-        )
+        self._render_definition_enabled_state(lt, label="Enabled State")
 
         return True
 
@@ -4009,30 +4823,102 @@ class BuildingsView(ctk.CTkFrame):
 
     def _create_section_header(self, text: str, color: str = "#4CAF50"):
         """Create a section header in the form."""
-        header_frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
-        header_frame.pack(fill="x", pady=(20, 5), anchor="w")
+        refs = self._take_pooled_form_row('section')
+        if refs is None:
+            header_frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
+            header = ctk.CTkLabel(
+                header_frame,
+                text=text,
+                font=_font(16, weight="bold"),
+                text_color=color
+            )
+            header.pack(side="left")
 
-        header = ctk.CTkLabel(
-            header_frame,
-            text=text,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=color
-        )
-        header.pack(side="left")
+            # Separator line
+            sep = ctk.CTkFrame(self.form_content, height=2, fg_color=color)
+            refs = _SectionHeaderRefs(header_frame, header, sep)
+            self._form_pooled_widgets.update((header_frame, sep))
+        else:
+            refs.label.configure(text=text, text_color=color)
+            refs.separator.configure(fg_color=color)
+        self._form_pool_in_use.append(('section', refs))
 
-        # Separator line
-        sep = ctk.CTkFrame(self.form_content, height=2, fg_color=color)
-        sep.pack(fill="x", pady=(0, 10))
+        refs.frame.pack(fill="x", pady=(20, 5), anchor="w")
+        refs.separator.pack(fill="x", pady=(0, 10))
 
     def _create_subsection_header(self, text: str):
         """Create a subsection header."""
-        header = ctk.CTkLabel(
+        header = self._take_pooled_form_row('subsection')
+        if header is None:
+            header = ctk.CTkLabel(
+                self.form_content,
+                text=text,
+                font=_font(13, weight="bold"),
+                text_color="gray"
+            )
+            self._form_pooled_widgets.add(header)
+        else:
+            header.configure(text=text)
+        self._form_pool_in_use.append(('subsection', header))
+        header.pack(fill="x", pady=(10, 5), anchor="w")
+
+    def _create_collapsible_section(self, title: str, builder: Callable[[], None], expanded: bool = False):
+        """Create a subsection header that builds its fields on first expand.
+
+        A section that is never expanded adds nothing to form_vars, and the
+        definition save path only writes properties present in form_vars, so
+        those values are saved unchanged.
+
+        Args:
+            title: Subsection title
+            builder: Callable that creates the section's fields in form_content
+            expanded: Build and show the fields right away
+        """
+        section = _CollapsibleSection(title, builder)
+        section.toggle = ctk.CTkButton(
             self.form_content,
-            text=text,
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color="gray"
+            text=f"\u25b8 {title}",
+            font=_font(13, weight="bold"),
+            text_color="gray",
+            fg_color="transparent",
+            hover_color=("gray85", "gray25"),
+            anchor="w",
+            height=24,
+            command=lambda: self._toggle_collapsible_section(section)
         )
-        header.pack(fill="x", pady=(10, 5), anchor="w")
+        section.toggle.pack(fill="x", pady=(10, 5), anchor="w")
+        if expanded:
+            self._toggle_collapsible_section(section)
+
+    def _toggle_collapsible_section(self, section: _CollapsibleSection):
+        """Expand (building the fields the first time) or collapse a section."""
+        if section.expanded:
+            for widget, _ in section.packed:
+                widget.pack_forget()
+        elif section.packed is None:
+            # The builder packs at the end of the form; move what it added
+            # up under the section header, keeping the pack options for later
+            before = set(self.form_content.pack_slaves())
+            section.builder()
+            section.packed = []
+            anchor = section.toggle
+            for widget in self.form_content.pack_slaves():
+                if widget in before:
+                    continue
+                widget.pack_configure(after=anchor)
+                info = widget.pack_info()
+                del info["in"]
+                section.packed.append((widget, info))
+                anchor = widget
+        else:
+            anchor = section.toggle
+            for widget, info in section.packed:
+                widget.pack(after=anchor, **info)
+                anchor = widget
+
+        section.expanded = not section.expanded
+        arrow = "\u25be" if section.expanded else "\u25b8"
+        section.toggle.configure(text=f"{arrow} {section.title}")
 
     def _create_text_field(self, name: str, value: str, width: int = 600, label: str | None = None,
                            autocomplete_key: str | None = None, readonly: bool = False):
@@ -4046,6 +4932,17 @@ class BuildingsView(ctk.CTkFrame):
             autocomplete_key: Key to look up autocomplete suggestions from cached_options
             readonly: If True, field is displayed but not editable
         """
+        # Plain entries come from the row pool; autocomplete rows are built fresh
+        suggestions = None
+        if autocomplete_key and not readonly:
+            # Get suggestions directly from cached options (avoid _get_options "(none)" fallback)
+            suggestions = self.cached_options.get(autocomplete_key, [])
+        if not suggestions:
+            self._show_pooled_text_field(name, value, width, label, readonly)
+            return
+
+        self.form_vars[name] = ctk.StringVar(value=value)
+        description = FIELD_DESCRIPTIONS.get(name)
         frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
         frame.pack(fill="x", pady=3)
 
@@ -4054,41 +4951,69 @@ class BuildingsView(ctk.CTkFrame):
             text=f"{label or name}:",
             width=140,
             anchor="w",
-            cursor="question_arrow" if name in FIELD_DESCRIPTIONS else ""
+            cursor="question_arrow" if description else ""
         )
         field_label.pack(side="left")
 
         # Add tooltip if description exists
-        if name in FIELD_DESCRIPTIONS:
-            FieldTooltip(field_label, FIELD_DESCRIPTIONS[name])
+        if description:
+            FieldTooltip(field_label, description)
 
-        self.form_vars[name] = ctk.StringVar(value=value)
+        entry = AutocompleteEntry(
+            frame,
+            textvariable=self.form_vars[name],
+            suggestions=suggestions,
+            width=width
+        )
+        entry.pack(side="left", fill="x", expand=True, padx=(10, 0))
 
-        # Use autocomplete entry if suggestions are available (skip for readonly)
-        if autocomplete_key and not readonly:
-            # Get suggestions directly from cached options (avoid _get_options "(none)" fallback)
-            suggestions = self.cached_options.get(autocomplete_key, [])
-            if suggestions:
-                entry = AutocompleteEntry(
-                    frame,
-                    textvariable=self.form_vars[name],
-                    suggestions=suggestions,
-                    width=width
+    def _show_pooled_text_field(self, name: str, value: str, width: int, label: str | None,
+                                readonly: bool):
+        """Show a plain (or readonly) entry row for form_vars[name], reusing a pooled row.
+
+        A pooled row keeps its StringVar, so a reused row only sets the new
+        value instead of creating a variable and rebinding the entry to it,
+        and its entry is only reconfigured when the width or readonly flag differ.
+        """
+        description = FIELD_DESCRIPTIONS.get(name, "")
+        style = (width, bool(readonly))
+
+        refs = self._take_pooled_form_row('field')
+        if refs is None:
+            var = ctk.StringVar(value=value)
+            frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
+            field_label = ctk.CTkLabel(frame, text="", width=140, anchor="w")
+            field_label.pack(side="left")
+            entry = ctk.CTkEntry(
+                frame,
+                textvariable=var,
+                width=width,
+                state=_ENTRY_STATES[style[1]],
+                text_color=_ENTRY_TEXT_COLORS[style[1]]
+            )
+            entry.pack(side="left", fill="x", expand=True, padx=(10, 0))
+            refs = _FormFieldRefs(frame, field_label, entry, FieldTooltip(field_label, ""), var, style)
+            self._form_pooled_widgets.add(frame)
+        else:
+            refs.var.set(value)
+            if refs.style != style:
+                refs.entry.configure(
+                    width=width, state=_ENTRY_STATES[style[1]], text_color=_ENTRY_TEXT_COLORS[style[1]]
                 )
-                entry.pack(side="left", fill="x", expand=True, padx=(10, 0))
-                return
+                refs.style = style
+        self.form_vars[name] = refs.var
+        self._form_pool_in_use.append(('field', refs))
 
-        # Regular entry (or readonly)
-        ctk.CTkEntry(
-            frame,
-            textvariable=self.form_vars[name],
-            width=width,
-            state="disabled" if readonly else "normal",
-            text_color=("gray50", "gray60") if readonly else ("gray10", "gray90")
-        ).pack(side="left", fill="x", expand=True, padx=(10, 0))
+        refs.label.configure(
+            text=f"{label or name}:", cursor="question_arrow" if description else ""
+        )
+        # One tooltip per pooled label; an empty text disables it
+        refs.tooltip.text = description
+        refs.frame.pack(fill="x", pady=3)
 
-    def _create_dropdown_field(self, name: str, value: str, options: list[str], label: str | None = None):
+    def _create_dropdown_field(self, name: str, value: str, options: Sequence[str], label: str | None = None):
         """Create a dropdown field with manual input support (ComboBox)."""
+        description = FIELD_DESCRIPTIONS.get(name)
         frame = ctk.CTkFrame(self.form_content, fg_color="transparent")
         frame.pack(fill="x", pady=3)
 
@@ -4097,27 +5022,28 @@ class BuildingsView(ctk.CTkFrame):
             text=f"{label or name}:",
             width=120,
             anchor="w",
-            cursor="question_arrow" if name in FIELD_DESCRIPTIONS else ""
+            cursor="question_arrow" if description else ""
         )
         field_label.pack(side="left")
 
         # Add tooltip if description exists
-        if name in FIELD_DESCRIPTIONS:
-            FieldTooltip(field_label, FIELD_DESCRIPTIONS[name])
+        if description:
+            FieldTooltip(field_label, description)
 
         self.form_vars[name] = ctk.StringVar(value=value)
         combo = ctk.CTkComboBox(
             frame,
             variable=self.form_vars[name],
-            values=options if options else ["(none)"],
+            values=options if options else _NO_OPTIONS,
             width=350
         )
         combo.pack(side="left", padx=(10, 0))
 
     def _create_dropdown_field_inline(
-        self, parent, name: str, value: str, options: list[str], label: str | None = None
+        self, parent, name: str, value: str, options: Sequence[str], label: str | None = None
     ):
         """Create an inline dropdown field with manual input support (ComboBox)."""
+        description = FIELD_DESCRIPTIONS.get(name)
         frame = ctk.CTkFrame(parent, fg_color="transparent")
         frame.pack(side="left", padx=(0, 20))
 
@@ -4126,25 +5052,48 @@ class BuildingsView(ctk.CTkFrame):
             frame,
             text=f"{display_label}:",
             anchor="w",
-            cursor="question_arrow" if name in FIELD_DESCRIPTIONS else ""
+            cursor="question_arrow" if description else ""
         )
         field_label.pack(side="left")
 
         # Add tooltip if description exists
-        if name in FIELD_DESCRIPTIONS:
-            FieldTooltip(field_label, FIELD_DESCRIPTIONS[name])
+        if description:
+            FieldTooltip(field_label, description)
 
         self.form_vars[name] = ctk.StringVar(value=value)
         combo = ctk.CTkComboBox(
             frame,
             variable=self.form_vars[name],
-            values=options if options else ["(none)"],
+            values=options if options else _NO_OPTIONS,
             width=280
         )
         combo.pack(side="left", padx=(5, 0))
 
+    def _render_stat_grid(self, specs, source: dict, label_width: int = 80, entry_width: int = 80):
+        """Render one row of small labelled numeric entries, one grid column per spec.
+
+        Args:
+            specs: Sequence of (form_vars key, label) pairs
+            source: Extracted fields to read initial values from (missing keys show 0)
+            label_width: Width of each label
+            entry_width: Width of each entry
+        """
+        row = ctk.CTkFrame(self.form_content, fg_color="transparent")
+        row.pack(fill="x", pady=3)
+        grid_vars = {key: ctk.StringVar(value=str(source.get(key, 0))) for key, _ in specs}
+        self.form_vars.update(grid_vars)
+        # Label and entry share the row's grid directly (no per-column frame);
+        # the entry columns, weighted in one grid call, take the slack after each entry
+        row.grid_columnconfigure(tuple(range(1, 2 * len(specs), 2)), weight=1)
+        for i, (key, label) in enumerate(specs):
+            ctk.CTkLabel(row, text=label, font=_font(11), width=label_width, anchor="w").grid(
+                row=0, column=2 * i, sticky="w", padx=(2, 0))
+            ctk.CTkEntry(row, textvariable=grid_vars[key], width=entry_width).grid(
+                row=0, column=2 * i + 1, sticky="w", padx=(2, 4))
+
     def _create_checkbox_field(self, parent, name: str, value: bool):
         """Create a checkbox field with tooltip."""
+        description = FIELD_DESCRIPTIONS.get(name)
         self.form_vars[name] = ctk.BooleanVar(value=value)
 
         # Get display text (strip leading 'b' from boolean field names)
@@ -4154,25 +5103,23 @@ class BuildingsView(ctk.CTkFrame):
             parent,
             text=display_text,
             variable=self.form_vars[name],
-            cursor="question_arrow" if name in FIELD_DESCRIPTIONS else ""
+            cursor="question_arrow" if description else ""
         )
         cb.pack(side="left", padx=(0, 15))
 
         # Add tooltip if description exists
-        if name in FIELD_DESCRIPTIONS:
-            FieldTooltip(cb, FIELD_DESCRIPTIONS[name])
+        if description:
+            FieldTooltip(cb, description)
 
     def _add_material_row(self, material: str = "Item.Wood", amount: int = 1):
         """Add an editable material row with combobox (supports manual input) and amount entry."""
-        row_id = len(self.material_rows)
-        row_frame = ctk.CTkFrame(self.materials_frame, fg_color=("gray85", "gray20"))
+        if self._reuse_material_row(self.material_rows, material, amount):
+            return
+        row_frame = ctk.CTkFrame(self.materials_frame, fg_color=_MATERIAL_ROW_BG)
         row_frame.pack(fill="x", pady=2)
 
         # Material combobox with display names
-        raw_options = self._get_options("Materials", ["Item.Wood"])
-        if material and material not in raw_options:
-            raw_options.insert(0, material)
-        material_options = [self._format_material_display(m) for m in raw_options]
+        material_options = self._material_display_options(material)
 
         mat_var = ctk.StringVar(value=self._format_material_display(material))
         mat_combo = ctk.CTkComboBox(
@@ -4196,6 +5143,13 @@ class BuildingsView(ctk.CTkFrame):
         )
         amount_entry.pack(side="left", padx=5)
 
+        row = {
+            "frame": row_frame,
+            "combo": mat_combo,
+            "material_var": mat_var,
+            "amount_var": amount_var
+        }
+
         # Remove button
         remove_btn = ctk.CTkButton(
             row_frame,
@@ -4204,39 +5158,75 @@ class BuildingsView(ctk.CTkFrame):
             height=28,
             fg_color="#f44336",
             hover_color="#d32f2f",
-            command=lambda rf=row_frame, rid=row_id: self._remove_material_row(rf, rid)
+            command=lambda: self._remove_material_row(row)
         )
         remove_btn.pack(side="right", padx=5, pady=5)
 
-        self.material_rows.append({
-            "frame": row_frame,
-            "material_var": mat_var,
-            "amount_var": amount_var
-        })
+        self.material_rows.append(row)
 
     def _add_new_material_row(self):
         """Add a new empty material row."""
         self._add_material_row("Item.Wood", 1)
 
-    def _remove_material_row(self, row_frame, _row_id):
-        """Remove a material row."""
-        row_frame.destroy()
-        # Mark as removed (don't reindex to avoid issues)
-        for row in self.material_rows:
-            if row.get("frame") == row_frame:
-                row["removed"] = True
+    def _material_display_options(self, material: str) -> list[str]:
+        """Return the formatted Materials combobox values for a row showing material.
+
+        The formatted list is built once per Materials option list and string
+        table and shared by every row; a material that is not a known option
+        gets its own copy with it added in front. Callers must not modify it.
+        """
+        raw_options = self._get_options("Materials", ["Item.Wood"])
+        memo = self._material_display_memo
+        if memo is None or memo[0] is not raw_options or memo[1] is not self.string_table:
+            formatted = [self._format_material_display(m) for m in raw_options]
+            memo = (raw_options, self.string_table, frozenset(raw_options), formatted)
+            self._material_display_memo = memo
+        if material and material not in memo[2]:
+            return [self._format_material_display(material), *memo[3]]
+        return memo[3]
+
+    def _reuse_material_row(self, rows: list[dict], material: str, amount: int) -> bool:
+        """Show a removed row from rows again with new values instead of building one.
+
+        Removed rows are only unpacked, and rows is cleared on every form
+        render, so any removed row still belongs to the current materials frame.
+
+        Returns:
+            True if a row was reused, False if the caller must create one
+        """
+        for index, row in enumerate(rows):
+            if row.get("removed"):
                 break
+        else:
+            return False
+
+        # Move it to the end so list order keeps matching display order
+        del rows[index]
+        del row["removed"]
+        row["combo"].configure(values=self._material_display_options(material))
+        row["material_var"].set(self._format_material_display(material))
+        row["amount_var"].set(str(amount))
+        row["frame"].pack(fill="x", pady=2)
+        rows.append(row)
+        return True
+
+    def _remove_material_row(self, row: dict):
+        """Remove a material or sandbox material row (unpacked and kept for reuse by the next add).
+
+        The remove button passes its own row dict, so no lookup is needed; the
+        row stays in its list, marked removed (no reindexing).
+        """
+        row["frame"].pack_forget()
+        row["removed"] = True
 
     def _add_sandbox_material_row(self, material: str = "Item.Wood", amount: int = 1):
         """Add an editable sandbox material row."""
-        row_id = len(self.sandbox_material_rows)
-        row_frame = ctk.CTkFrame(self.sandbox_materials_frame, fg_color=("gray85", "gray20"))
+        if self._reuse_material_row(self.sandbox_material_rows, material, amount):
+            return
+        row_frame = ctk.CTkFrame(self.sandbox_materials_frame, fg_color=_MATERIAL_ROW_BG)
         row_frame.pack(fill="x", pady=2)
 
-        raw_options = self._get_options("Materials", ["Item.Wood"])
-        if material and material not in raw_options:
-            raw_options.insert(0, material)
-        material_options = [self._format_material_display(m) for m in raw_options]
+        material_options = self._material_display_options(material)
 
         mat_var = ctk.StringVar(value=self._format_material_display(material))
         mat_combo = ctk.CTkComboBox(
@@ -4251,16 +5241,15 @@ class BuildingsView(ctk.CTkFrame):
             row_frame, textvariable=amount_var, width=60, placeholder_text="qty"
         ).pack(side="left", padx=5)
 
+        row = {"frame": row_frame, "combo": mat_combo, "material_var": mat_var, "amount_var": amount_var}
         remove_btn = ctk.CTkButton(
             row_frame, text="✕", width=28, height=28,
             fg_color="#f44336", hover_color="#d32f2f",
-            command=lambda rf=row_frame, rid=row_id: self._remove_sandbox_material_row(rf, rid)
+            command=lambda: self._remove_material_row(row)
         )
         remove_btn.pack(side="right", padx=5, pady=5)
 
-        self.sandbox_material_rows.append({
-            "frame": row_frame, "material_var": mat_var, "amount_var": amount_var
-        })
+        self.sandbox_material_rows.append(row)
 
     def _add_new_sandbox_material_row(self):
         """Add a new empty sandbox material row."""
@@ -4268,14 +5257,6 @@ class BuildingsView(ctk.CTkFrame):
             self.sandbox_materials_frame.pack(fill="x", pady=(0, 5))
         self._add_sandbox_material_row("Item.Wood", 1)
 
-    def _remove_sandbox_material_row(self, row_frame, _row_id):
-        """Remove a sandbox material row."""
-        row_frame.destroy()
-        for row in self.sandbox_material_rows:
-            if row.get("frame") == row_frame:
-                row["removed"] = True
-                break
-
     def _save_changes(self):
         """Save form changes back to the cached JSON files."""
         if not self.current_def_data:
@@ -4345,12 +5326,12 @@ class BuildingsView(ctk.CTkFrame):
 
     def _mark_item_checked_on_save(self):
         """Mark the currently selected item's checkbox as checked after a save."""
-        # For secrets items, use the recipe name
-        if self.current_secrets_recipe_name:
-            check_var = self.construction_check_vars.get(self.current_secrets_recipe_name)
-            if check_var:
-                check_var.set(True)
-                self._save_checked_states_to_ini()
+        # For secrets items, use the recipe name. An item that is already
+        # checked is already listed in the INI, so repeated saves skip the rewrite.
+        recipe_name = self.current_secrets_recipe_name
+        if recipe_name in self.secrets_checked and not self.secrets_checked[recipe_name]:
+            self._set_secrets_checked(recipe_name, True)
+            self._save_checked_states_to_ini()
 
     def _get_current_item_visibility(self) -> bool:
         """Determine visibility of the current item from form_vars."""
@@ -4370,11 +5351,13 @@ class BuildingsView(ctk.CTkFrame):
 
     def _update_header_eye_icon(self):
         """Update the right-pane header eye button based on current item visibility."""
+        if self.form_header is None:
+            return
         is_visible = self._get_current_item_visibility()
         self._header_eye_visible = is_visible
         visible_icon, hidden_icon, _ = self._get_eye_icons()
         icon = visible_icon if is_visible else hidden_icon
-        self.header_eye_btn.configure(image=icon)
+        self.form_header.eye_btn.configure(image=icon)
 
     def _update_current_item_eye_icon(self):
         """Update the eye icon for the current item in the left pane list."""
@@ -4543,9 +5526,7 @@ class BuildingsView(ctk.CTkFrame):
                             pass
                         break
             # Check the checkbox so the .def file picks up the changes
-            check_var = self.construction_check_vars.get(name)
-            if check_var:
-                check_var.set(True)
+            self._set_secrets_checked(name, True)
         self._save_checked_states_to_ini()
 
         # If an item is currently loaded in the form, refresh its form_vars
@@ -4574,8 +5555,7 @@ class BuildingsView(ctk.CTkFrame):
         # Update recipes JSON (unlock types + EnabledState)
         recipes_path = self._get_cache_recipes_path()
         if recipes_path and recipes_path.exists():
-            with open(recipes_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data, row_index = _load_table_doc(recipes_path)
 
             exports = data.get('Exports', [])
             if exports:
@@ -4605,14 +5585,12 @@ class BuildingsView(ctk.CTkFrame):
                                 orig = orig_recipe_rows.get(row_name, {})
                                 prop['Value'] = self._extract_enabled_state(orig)
 
-            with open(recipes_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _save_table_doc(recipes_path, data, row_index)
 
         # Update constructions/definitions JSON (EnabledState)
         defs_path = self._get_cache_constructions_path()
         if defs_path and defs_path.exists():
-            with open(defs_path, 'r', encoding='utf-8') as f:
-                def_data = json.load(f)
+            def_data, def_index = _load_table_doc(defs_path)
 
             exports = def_data.get('Exports', [])
             if exports:
@@ -4630,8 +5608,7 @@ class BuildingsView(ctk.CTkFrame):
                                 orig = orig_def_rows.get(row_name, {})
                                 prop['Value'] = self._extract_enabled_state(orig)
 
-            with open(defs_path, 'w', encoding='utf-8') as f:
-                json.dump(def_data, f, indent=2, ensure_ascii=False)
+            _save_table_doc(defs_path, def_data, def_index)
 
     def _bulk_set_definition_visibility(self, item_names, make_hidden):
         """Bulk-set EnabledState for all definition items. Writes JSON once."""
@@ -4639,8 +5616,7 @@ class BuildingsView(ctk.CTkFrame):
         if not defs_path or not defs_path.exists():
             return
 
-        with open(defs_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data, row_index = _load_table_doc(defs_path)
 
         name_set = set(item_names)
 
@@ -4667,8 +5643,7 @@ class BuildingsView(ctk.CTkFrame):
                             orig = orig_rows.get(row_name, {})
                             prop['Value'] = self._extract_enabled_state(orig)
 
-        with open(defs_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _save_table_doc(defs_path, data, row_index)
 
     def _update_autocomplete_index(self):
         """Extract new values from the current form and add them to the autocomplete index.
@@ -4676,42 +5651,13 @@ class BuildingsView(ctk.CTkFrame):
         Maps form fields to their autocomplete keys and adds any new values
         found. Persists the updated index to the cache INI file.
         """
-        # Field name -> autocomplete key mapping for comma-separated text fields
-        field_to_key = {
-            "ResultConstructionHandle": "ResultConstructions",
-            "ResultItemHandle": "AllValues",
-            "DefaultRequiredConstructions": "Constructions",
-            "SandboxRequiredConstructions": "Constructions",
-            "Actor": "Actors",
-            "BackwardCompatibilityActors": "Actors",
-            "ReceptacleActorToSpawn": "Actors",
-            "DamageType": "DamageTypes",
-            "ItemRowHandle": "AllValues",
-            "OverrideItemDropHandle": "AllValues",
-            "ItemHandle": "AllValues",
-            "RequiredTags": "LootTags",
-        }
-
-        changed = False
-        for field_name, ac_key in field_to_key.items():
-            if field_name not in self.form_vars:
+        new_values = defaultdict(set)
+        for field_name, ac_key in _AUTOCOMPLETE_FIELD_KEYS:
+            var = self.form_vars.get(field_name)
+            if var is None:
                 continue
-            raw = self.form_vars[field_name].get().strip()
-            if not raw:
-                continue
-
             # Split comma-separated values and clean
-            values = [v.strip() for v in raw.split(",") if v.strip()]
-
-            if ac_key not in self.cached_options:
-                self.cached_options[ac_key] = []
-
-            existing = set(self.cached_options[ac_key])
-            for val in values:
-                if val not in existing:
-                    existing.add(val)
-                    changed = True
-            self.cached_options[ac_key] = sorted(existing)
+            new_values[ac_key].update(_split_comma_list(var.get()))
 
         # Add material names from material rows
         for row in getattr(self, 'material_rows', []):
@@ -4719,64 +5665,65 @@ class BuildingsView(ctk.CTkFrame):
                 continue
             mat_name = row["material_var"].get().strip()
             if mat_name:
-                if "Materials" not in self.cached_options:
-                    self.cached_options["Materials"] = []
-                existing = set(self.cached_options["Materials"])
-                if mat_name not in existing:
-                    existing.add(mat_name)
-                    self.cached_options["Materials"] = sorted(existing)
-                    changed = True
+                new_values["Materials"].add(mat_name)
 
         # Add Tags value
-        if "Tags" in self.form_vars:
-            tag = self.form_vars["Tags"].get().strip()
+        tag_var = self.form_vars.get("Tags")
+        if tag_var is not None:
+            tag = tag_var.get().strip()
             if tag:
-                if "Tags" not in self.cached_options:
-                    self.cached_options["Tags"] = []
-                existing = set(self.cached_options["Tags"])
-                if tag not in existing:
-                    existing.add(tag)
-                    self.cached_options["Tags"] = sorted(existing)
-                    changed = True
-
-        if changed:
-            # Rebuild AllValues
-            all_values = set()
-            for values in self.cached_options.values():
-                all_values.update(values)
-            self.cached_options["AllValues"] = sorted(all_values)
+                new_values["Tags"].add(tag)
+
+        # Only keys that gained values get a new list, so option lists that
+        # did not change keep their identity and merge memos. The few new
+        # values are sorted and merged in linearly instead of re-sorting.
+        all_added = set()
+        for ac_key, values in new_values.items():
+            existing = self.cached_options.get(ac_key, [])
+            added = values.difference(existing)
+            if added:
+                all_added.update(added)
+                if ac_key != "AllValues":
+                    self.cached_options[ac_key] = _merge_sorted_unique(existing, sorted(added))
+
+        if all_added:
+            # AllValues is already the union of every list, so only new values need adding
+            all_values = self.cached_options.get("AllValues", [])
+            added = all_added.difference(all_values)
+            if added:
+                self.cached_options["AllValues"] = _merge_sorted_unique(all_values, sorted(added))
 
             # Persist to cache file
             buildings_dir = get_buildings_dir()
             cache_path = buildings_dir / CACHE_FILENAME
-            _save_cached_options(cache_path, self.cached_options)
+            _save_cached_options(cache_path, self.cached_options, self._options_signature)
             logger.info("Updated autocomplete index with new values")
 
     def _update_row_in_json(self, json_path: Path, row_name: str, updated_row: dict):
         """Replace a row in a JSON file's Table.Data by matching Name.
 
+        The parsed document and its Name -> row index are kept after writing,
+        so repeated saves to the same cache file skip re-parsing it and
+        scanning its rows while the file is unchanged on disk. A row that
+        already matches updated_row is left alone and nothing is written.
+
         Args:
             json_path: Path to the JSON file
             row_name: Name of the row to replace
             updated_row: The updated row dict
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        exports = data.get('Exports', [])
-        if not exports:
+        data, row_index = _load_table_doc(json_path)
+        i = row_index.get(row_name)
+        if i is None:
             return
-
-        table = exports[0].get('Table', {})
-        rows = table.get('Data', [])
-
-        for i, row in enumerate(rows):
-            if row.get('Name') == row_name:
-                rows[i] = updated_row
-                break
-
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        rows = _table_rows(data)
+        if _deep_eq(rows[i], updated_row):
+            # Nothing changed in this row: skip serializing the whole table
+            return
+        # Copied so later edits to the caller's dict cannot leak into the
+        # kept document without being saved
+        rows[i] = copy.deepcopy(updated_row)
+        _save_table_doc(json_path, data, row_index)
 
     # -------------------------------------------------------------------------
     # JSON DATA UPDATE METHODS
@@ -4789,35 +5736,18 @@ class BuildingsView(ctk.CTkFrame):
         """Update recipe JSON structure with current form values."""
         for prop in recipe_json.get("Value", []):
             prop_name = prop.get("Name", "")
-            prop_type = prop.get("$type", "")
+            prop_class = _property_class(prop.get("$type", ""))
 
             # Update enum fields (dropdowns)
-            if "EnumPropertyData" in prop_type:
+            if prop_class == "EnumPropertyData":
                 if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
+                    self._apply_form_value(prop, prop_name, prop_class)
                 elif prop_name == "EnabledState" and "Recipe_EnabledState" in self.form_vars:
                     prop["Value"] = self.form_vars["Recipe_EnabledState"].get()
 
-            # Update boolean fields (checkboxes)
-            elif "BoolPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
-
-            # Update float fields
-            elif "FloatPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = float(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
-
-            # Update int fields
-            elif "IntPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = int(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
+            # Update boolean (checkbox), float and int fields
+            elif prop_class in ("BoolPropertyData", "FloatPropertyData", "IntPropertyData"):
+                self._apply_form_value(prop, prop_name, prop_class)
 
             # Update ResultConstructionHandle
             elif prop_name == "ResultConstructionHandle":
@@ -4828,24 +5758,14 @@ class BuildingsView(ctk.CTkFrame):
 
             # Update materials array
             elif prop_name == "DefaultRequiredMaterials":
-                new_materials = []
-                for row in self.material_rows:
-                    if row.get("removed"):
-                        continue
-                    mat_name = self._parse_material_name(row["material_var"].get())
-                    try:
-                        mat_amount = int(row["amount_var"].get())
-                    except ValueError:
-                        mat_amount = 1
-                    new_materials.append(self._build_material_entry(mat_name, mat_amount))
-                prop["Value"] = new_materials
+                prop["Value"] = self._build_material_entries(self.material_rows, "DefaultRequiredMaterials")
 
             # Update DefaultRequiredConstructions
             elif prop_name == "DefaultRequiredConstructions":
                 if "DefaultRequiredConstructions" in self.form_vars:
                     const_str = self.form_vars["DefaultRequiredConstructions"].get().strip()
                     if const_str:
-                        constructions = [c.strip() for c in const_str.split(",") if c.strip()]
+                        constructions = _split_comma_list(const_str)
                         prop["Value"] = self._build_unlock_required_constructions(constructions)
                     else:
                         prop["Value"] = []
@@ -4860,37 +5780,42 @@ class BuildingsView(ctk.CTkFrame):
 
             # Update SandboxRequiredMaterials
             elif prop_name == "SandboxRequiredMaterials":
-                new_materials = []
-                for row in self.sandbox_material_rows:
-                    if row.get("removed"):
-                        continue
-                    mat_name = self._parse_material_name(row["material_var"].get())
-                    try:
-                        mat_amount = int(row["amount_var"].get())
-                    except ValueError:
-                        mat_amount = 1
-                    entry = self._build_material_entry(mat_name, mat_amount)
-                    entry["Name"] = "SandboxRequiredMaterials"
-                    new_materials.append(entry)
-                prop["Value"] = new_materials
+                prop["Value"] = self._build_material_entries(self.sandbox_material_rows, "SandboxRequiredMaterials")
 
             # Update SandboxRequiredConstructions
             elif prop_name == "SandboxRequiredConstructions":
                 if "SandboxRequiredConstructions" in self.form_vars:
                     const_str = self.form_vars["SandboxRequiredConstructions"].get().strip()
                     if const_str:
-                        constructions = [c.strip() for c in const_str.split(",") if c.strip()]
+                        constructions = _split_comma_list(const_str)
                         prop["Value"] = self._build_unlock_required_constructions(constructions)
                     else:
                         prop["Value"] = []
 
+    def _apply_form_value(self, prop: dict, prop_name: str, prop_class: str):
+        """Set a scalar property's Value from form_vars[prop_name], if the form has that field.
+
+        Float, int and byte values that do not parse leave the property unchanged.
+        """
+        var = self.form_vars.get(prop_name)
+        if var is None:
+            return
+        value = var.get()
+        converter = _FORM_VALUE_CONVERTERS[prop_class]
+        if converter is not None:
+            try:
+                value = converter(value)
+            except ValueError:
+                return
+        prop["Value"] = value
+
     def _update_unlock_struct(self, prop: dict, prefix: str):
         """Update an unlock struct (DefaultUnlocks or SandboxUnlocks) from form_vars."""
         for unlock_prop in prop.get("Value", []):
             unlock_name = unlock_prop.get("Name", "")
-            unlock_type = unlock_prop.get("$type", "")
 
-            if unlock_name == "UnlockType" and "EnumPropertyData" in unlock_type:
+            if (unlock_name == "UnlockType"
+                    and _property_class(unlock_prop.get("$type", "")) == "EnumPropertyData"):
                 key = f"{prefix}_UnlockType"
                 if key in self.form_vars:
                     unlock_prop["Value"] = self.form_vars[key].get()
@@ -4908,7 +5833,7 @@ class BuildingsView(ctk.CTkFrame):
                 if key in self.form_vars:
                     items_str = self.form_vars[key].get().strip()
                     if items_str:
-                        items = [i.strip() for i in items_str.split(",") if i.strip()]
+                        items = _split_comma_list(items_str)
                         unlock_prop["Value"] = self._build_unlock_required_items(items)
                     else:
                         unlock_prop["Value"] = []
@@ -4918,7 +5843,7 @@ class BuildingsView(ctk.CTkFrame):
                 if key in self.form_vars:
                     const_str = self.form_vars[key].get().strip()
                     if const_str:
-                        constructions = [c.strip() for c in const_str.split(",") if c.strip()]
+                        constructions = _split_comma_list(const_str)
                         unlock_prop["Value"] = self._build_unlock_required_constructions(constructions)
                     else:
                         unlock_prop["Value"] = []
@@ -4928,7 +5853,7 @@ class BuildingsView(ctk.CTkFrame):
                 if key in self.form_vars:
                     frag_str = self.form_vars[key].get().strip()
                     if frag_str:
-                        fragments = [f.strip() for f in frag_str.split(",") if f.strip()]
+                        fragments = _split_comma_list(frag_str)
                         unlock_prop["Value"] = self._build_unlock_required_items(fragments)
                     else:
                         unlock_prop["Value"] = []
@@ -4937,13 +5862,13 @@ class BuildingsView(ctk.CTkFrame):
         """Update construction JSON with form values."""
         for prop in construction_json.get("Value", []):
             prop_name = prop.get("Name", "")
-            prop_type = prop.get("$type", "")
+            prop_class = _property_class(prop.get("$type", ""))
 
-            if prop_name == "DisplayName" and "TextPropertyData" in prop_type:
+            if prop_name == "DisplayName" and prop_class == "TextPropertyData":
                 if "DisplayName" in self.form_vars:
                     prop["Value"] = self.form_vars["DisplayName"].get()
 
-            elif prop_name == "Description" and "TextPropertyData" in prop_type:
+            elif prop_name == "Description" and prop_class == "TextPropertyData":
                 if "Description" in self.form_vars:
                     prop["Value"] = self.form_vars["Description"].get()
 
@@ -4954,7 +5879,7 @@ class BuildingsView(ctk.CTkFrame):
                         if tag_prop.get("Name") == "Tags":
                             tag_prop["Value"] = [tag_val] if tag_val else []
 
-            elif prop_name == "EnabledState" and "EnumPropertyData" in prop_type:
+            elif prop_name == "EnabledState" and prop_class == "EnumPropertyData":
                 if "Construction_EnabledState" in self.form_vars:
                     prop["Value"] = self.form_vars["Construction_EnabledState"].get()
 
@@ -4962,50 +5887,27 @@ class BuildingsView(ctk.CTkFrame):
         """Update item recipe JSON (weapons/armor/tools/items) with form values."""
         for prop in recipe_json.get("Value", []):
             prop_name = prop.get("Name", "")
-            prop_type = prop.get("$type", "")
+            prop_class = _property_class(prop.get("$type", ""))
 
-            if "EnumPropertyData" in prop_type:
+            if prop_class == "EnumPropertyData":
                 if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
+                    self._apply_form_value(prop, prop_name, prop_class)
                 elif prop_name == "EnabledState" and "Recipe_EnabledState" in self.form_vars:
                     prop["Value"] = self.form_vars["Recipe_EnabledState"].get()
-            elif "BoolPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
-            elif "FloatPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = float(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
-            elif "IntPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = int(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
+            elif prop_class in ("BoolPropertyData", "FloatPropertyData", "IntPropertyData"):
+                self._apply_form_value(prop, prop_name, prop_class)
             elif prop_name == "ResultItemHandle":
                 if "ResultItemHandle" in self.form_vars:
                     for handle_prop in prop.get("Value", []):
                         if handle_prop.get("Name") == "RowName":
                             handle_prop["Value"] = self.form_vars["ResultItemHandle"].get()
             elif prop_name == "DefaultRequiredMaterials":
-                new_materials = []
-                for row in self.material_rows:
-                    if row.get("removed"):
-                        continue
-                    mat_name = self._parse_material_name(row["material_var"].get())
-                    try:
-                        mat_amount = int(row["amount_var"].get())
-                    except ValueError:
-                        mat_amount = 1
-                    new_materials.append(self._build_material_entry(mat_name, mat_amount))
-                prop["Value"] = new_materials
+                prop["Value"] = self._build_material_entries(self.material_rows, "DefaultRequiredMaterials")
             elif prop_name == "DefaultRequiredConstructions":
                 if "DefaultRequiredConstructions" in self.form_vars:
                     const_str = self.form_vars["DefaultRequiredConstructions"].get().strip()
                     if const_str:
-                        constructions = [c.strip() for c in const_str.split(",") if c.strip()]
+                        constructions = _split_comma_list(const_str)
                         prop["Value"] = self._build_unlock_required_constructions(constructions)
                     else:
                         prop["Value"] = []
@@ -5014,24 +5916,12 @@ class BuildingsView(ctk.CTkFrame):
             elif prop_name == "SandboxUnlocks":
                 self._update_unlock_struct(prop, "SandboxUnlocks")
             elif prop_name == "SandboxRequiredMaterials":
-                new_materials = []
-                for row in self.sandbox_material_rows:
-                    if row.get("removed"):
-                        continue
-                    mat_name = self._parse_material_name(row["material_var"].get())
-                    try:
-                        mat_amount = int(row["amount_var"].get())
-                    except ValueError:
-                        mat_amount = 1
-                    entry = self._build_material_entry(mat_name, mat_amount)
-                    entry["Name"] = "SandboxRequiredMaterials"
-                    new_materials.append(entry)
-                prop["Value"] = new_materials
+                prop["Value"] = self._build_material_entries(self.sandbox_material_rows, "SandboxRequiredMaterials")
             elif prop_name == "SandboxRequiredConstructions":
                 if "SandboxRequiredConstructions" in self.form_vars:
                     const_str = self.form_vars["SandboxRequiredConstructions"].get().strip()
                     if const_str:
-                        constructions = [c.strip() for c in const_str.split(",") if c.strip()]
+                        constructions = _split_comma_list(const_str)
                         prop["Value"] = self._build_unlock_required_constructions(constructions)
                     else:
                         prop["Value"] = []
@@ -5042,103 +5932,84 @@ class BuildingsView(ctk.CTkFrame):
         Works for weapons, armor, tools, items, flora, and loot definitions.
         Iterates over the Value array and matches property names to form_vars.
         """
+        form_vars = self.form_vars
         for prop in definition_json.get("Value", []):
             prop_name = prop.get("Name", "")
-            prop_type = prop.get("$type", "")
-
-            # Text fields (DisplayName, Description)
-            if "TextPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
+            # Most definition properties have no form field: skip them before
+            # classifying their $type
+            if prop_name not in form_vars and prop_name not in _FORMLESS_DEFINITION_PROPS:
+                continue
+            prop_class = _property_class(prop.get("$type", ""))
 
             # Enum fields (Portability, EnabledState, FloraType, etc.)
-            elif "EnumPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
-                elif prop_name == "EnabledState" and "Def_EnabledState" in self.form_vars:
-                    prop["Value"] = self.form_vars["Def_EnabledState"].get()
-
-            # Bool fields
-            elif "BoolPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    prop["Value"] = self.form_vars[prop_name].get()
+            if prop_class == "EnumPropertyData":
+                if prop_name in form_vars:
+                    self._apply_form_value(prop, prop_name, prop_class)
+                elif prop_name == "EnabledState" and "Def_EnabledState" in form_vars:
+                    prop["Value"] = form_vars["Def_EnabledState"].get()
 
-            # Float fields
-            elif "FloatPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = float(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
-
-            # Int fields
-            elif "IntPropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = int(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
-
-            # Byte fields (Tier)
-            elif "BytePropertyData" in prop_type:
-                if prop_name in self.form_vars:
-                    try:
-                        prop["Value"] = int(self.form_vars[prop_name].get())
-                    except ValueError:
-                        pass
+            # Text (DisplayName, Description), bool, float, int and byte (Tier) fields
+            elif prop_class in _FORM_VALUE_CONVERTERS:
+                self._apply_form_value(prop, prop_name, prop_class)
 
             # Tags (GameplayTagContainer)
-            elif prop_name == "Tags" and "StructPropertyData" in prop_type:
-                if "Tags" in self.form_vars:
-                    tag_val = self.form_vars["Tags"].get()
-                    for tag_prop in prop.get("Value", []):
-                        if tag_prop.get("Name") == "Tags":
-                            tag_prop["Value"] = [tag_val] if tag_val else []
+            elif prop_name == "Tags" and prop_class == "StructPropertyData":
+                tag_val = form_vars["Tags"].get()
+                for tag_prop in prop.get("Value", []):
+                    if tag_prop.get("Name") == "Tags":
+                        tag_prop["Value"] = [tag_val] if tag_val else []
 
             # DamageType tag (weapon-specific)
-            elif prop_name == "DamageType" and "StructPropertyData" in prop_type:
-                if "DamageType" in self.form_vars:
-                    for inner in prop.get("Value", []):
-                        if inner.get("Name") == "TagName":
-                            inner["Value"] = self.form_vars["DamageType"].get()
+            elif prop_name == "DamageType" and prop_class == "StructPropertyData":
+                for inner in prop.get("Value", []):
+                    if inner.get("Name") == "TagName":
+                        inner["Value"] = form_vars["DamageType"].get()
 
             # Handle structs (ItemRowHandle, OverrideItemDropHandle, ItemHandle)
             elif prop_name in ("ItemRowHandle", "OverrideItemDropHandle", "ItemHandle"):
-                if prop_name in self.form_vars:
-                    for inner in prop.get("Value", []):
-                        if inner.get("Name") == "RowName":
-                            inner["Value"] = self.form_vars[prop_name].get()
+                for inner in prop.get("Value", []):
+                    if inner.get("Name") == "RowName":
+                        inner["Value"] = form_vars[prop_name].get()
 
             # Required tags (loot)
-            elif prop_name == "RequiredTags" and "StructPropertyData" in prop_type:
-                if "RequiredTags" in self.form_vars:
-                    tags_str = self.form_vars["RequiredTags"].get().strip()
-                    tag_list = [t.strip() for t in tags_str.split(",") if t.strip()] if tags_str else []
-                    for tag_prop in prop.get("Value", []):
-                        if tag_prop.get("Name") in ("Tags", "RequiredTags"):
-                            tag_prop["Value"] = tag_list
+            elif prop_name == "RequiredTags" and prop_class == "StructPropertyData":
+                tags_str = form_vars["RequiredTags"].get().strip()
+                tag_list = _split_comma_list(tags_str) if tags_str else []
+                for tag_prop in prop.get("Value", []):
+                    if tag_prop.get("Name") in ("Tags", "RequiredTags"):
+                        tag_prop["Value"] = tag_list
 
             # InitialRepairCost (material rows)
             elif prop_name == "InitialRepairCost":
-                new_materials = []
-                for row in self.material_rows:
-                    if row.get("removed"):
-                        continue
-                    mat_name = self._parse_material_name(row["material_var"].get())
-                    try:
-                        mat_amount = int(row["amount_var"].get())
-                    except ValueError:
-                        mat_amount = 1
-                    entry = self._build_material_entry(mat_name, mat_amount)
-                    entry["Name"] = "InitialRepairCost"
-                    new_materials.append(entry)
-                prop["Value"] = new_materials
-
-    def _build_material_entry(self, material_name: str, amount: int) -> dict:
-        """Build a material entry structure for the recipe JSON."""
+                prop["Value"] = self._build_material_entries(self.material_rows, "InitialRepairCost")
+
+    def _build_material_entries(self, rows: list[dict], prop_name: str) -> list[dict]:
+        """Build the material entries for prop_name from the non-removed material rows.
+
+        An amount that does not parse as an integer is saved as 1.
+        """
+        entries = []
+        for row in rows:
+            if row.get("removed"):
+                continue
+            mat_name = self._parse_material_name(row["material_var"].get())
+            try:
+                mat_amount = int(row["amount_var"].get())
+            except ValueError:
+                mat_amount = 1
+            entries.append(self._build_material_entry(mat_name, mat_amount, prop_name))
+        return entries
+
+    def _build_material_entry(self, material_name: str, amount: int,
+                              prop_name: str = "DefaultRequiredMaterials") -> dict:
+        """Build a material entry structure for the recipe JSON.
+
+        A fresh dict literal per entry is much cheaper than deep-copying a
+        prebuilt template, and keeps every entry independent.
+        """
         return {
             "$type": "UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI",
-            "Name": "DefaultRequiredMaterials",
+            "Name": prop_name,
             "StructType": "FConstructionMaterial",
             "Value": [
                 {
@@ -5245,46 +6116,52 @@ class BuildingsView(ctk.CTkFrame):
         # Show the import dialog, passing a callback to refresh the list when done
         show_import_construction_dialog(
             self.winfo_toplevel(),
-            on_complete=self._refresh_building_list
+            on_complete=self._schedule_refresh
         )
 
     # -------------------------------------------------------------------------
     # SECRETS SOURCE LOADING FUNCTIONS
     # -------------------------------------------------------------------------
 
-    def _get_cache_dir(self) -> Path:
-        """Get path to the cache directory for the current view mode.
+    def _get_cache_paths(self) -> tuple[Path, Optional[Path], Path]:
+        """Get the cache directory and its cached table paths for the current view mode.
+
+        If a change secrets prefix is active, the directory is the per-change-set
+        cache so each set has its own copy of modified JSONs. Otherwise falls
+        back to the shared cache. Built once per (view mode, prefix).
 
-        If a change secrets prefix is active, returns the per-change-set
-        cache directory so each set has its own copy of modified JSONs.
-        Otherwise falls back to the shared cache.
+        Returns:
+            Tuple of (cache dir, recipes JSON or None, definitions JSON)
         """
         prefix = self.secrets_prefix_var.get() if hasattr(self, 'secrets_prefix_var') else ""
-        mode = self.view_mode or 'buildings'
-        if prefix:
-            return get_default_changesecrets_dir() / prefix / mode
-        return get_appdata_dir() / 'cache' / mode
+        key = (self.view_mode, prefix)
+        paths = self._cache_paths.get(key)
+        if paths is None:
+            mode = self.view_mode or 'buildings'
+            if prefix:
+                cache_dir = get_default_changesecrets_dir() / prefix / mode
+            else:
+                cache_dir = get_appdata_dir() / 'cache' / mode
+            recipes_file = _CACHE_RECIPES_FILES.get(self.view_mode)
+            paths = (
+                cache_dir,
+                cache_dir / recipes_file if recipes_file else None,
+                cache_dir / _CACHE_DEFS_FILES.get(self.view_mode, 'DT_Constructions.json'),
+            )
+            self._cache_paths[key] = paths
+        return paths
+
+    def _get_cache_dir(self) -> Path:
+        """Get path to the cache directory for the current view mode."""
+        return self._get_cache_paths()[0]
 
     def _get_cache_recipes_path(self) -> Path:
         """Get path to cached recipes JSON for the current view mode."""
-        if self.view_mode in ('weapons', 'armor', 'tools', 'items'):
-            return self._get_cache_dir() / 'DT_ItemRecipes.json'
-        if self.view_mode == 'buildings':
-            return self._get_cache_dir() / 'DT_ConstructionRecipes.json'
-        return None  # flora, loot have no recipes
+        return self._get_cache_paths()[1]
 
     def _get_cache_constructions_path(self) -> Path:
         """Get path to cached definitions JSON for the current view mode."""
-        defs_map = {
-            'buildings': 'DT_Constructions.json',
-            'weapons': 'DT_Weapons.json',
-            'armor': 'DT_Armor.json',
-            'tools': 'DT_Tools.json',
-            'items': 'DT_Items.json',
-            'flora': 'DT_Moria_Flora.json',
-            'loot': 'DT_Loot.json',
-        }
-        return self._get_cache_dir() / defs_map.get(self.view_mode, 'DT_Constructions.json')
+        return self._get_cache_paths()[2]
 
     def _ensure_cache_files(self):
         """Copy Secrets Source JSONs to cache if not already cached.
@@ -5292,21 +6169,19 @@ class BuildingsView(ctk.CTkFrame):
         Uses view_mode to determine the correct source files and cache directory.
         Only copies if cache files don't exist yet (use _refresh_cache to force).
         """
-        cache_dir = self._get_cache_dir()
+        cache_dir, cache_recipes, cache_defs = self._get_cache_paths()
         cache_dir.mkdir(parents=True, exist_ok=True)
 
         # Cache recipes (if this mode has them)
         src_recipes = self._get_secrets_recipes_path()
-        cache_recipes = self._get_cache_recipes_path()
         if src_recipes and cache_recipes and src_recipes.exists() and not cache_recipes.exists():
-            shutil.copy2(src_recipes, cache_recipes)
+            shutil.copyfile(src_recipes, cache_recipes)
             logger.info("Cached %s", cache_recipes.name)
 
         # Cache definitions
         src_defs = self._get_secrets_constructions_path()
-        cache_defs = self._get_cache_constructions_path()
         if src_defs.exists() and not cache_defs.exists():
-            shutil.copy2(src_defs, cache_defs)
+            shutil.copyfile(src_defs, cache_defs)
             logger.info("Cached %s", cache_defs.name)
 
     def _refresh_cache(self):
@@ -5318,9 +6193,13 @@ class BuildingsView(ctk.CTkFrame):
 
         # Delete non-INI files from cache directory to start fresh
         if cache_dir.exists():
-            for item in cache_dir.iterdir():
-                if item.is_file() and item.suffix.lower() != '.ini':
-                    item.unlink()
+            # DirEntry carries the file type from the directory read itself
+            with os.scandir(cache_dir) as it:
+                stale = [entry.path for entry in it
+                         if entry.is_file() and not entry.name.lower().endswith('.ini')]
+            for path in stale:
+                os.unlink(path)
+                _table_docs_cache.pop(Path(path), None)
             logger.info("Cleared cache directory (preserved .ini): %s", cache_dir)
 
         cache_dir.mkdir(parents=True, exist_ok=True)
@@ -5329,13 +6208,13 @@ class BuildingsView(ctk.CTkFrame):
         src_recipes = self._get_secrets_recipes_path()
         cache_recipes = self._get_cache_recipes_path()
         if src_recipes and cache_recipes and src_recipes.exists():
-            shutil.copy2(src_recipes, cache_recipes)
+            shutil.copyfile(src_recipes, cache_recipes)
             logger.info("Refreshed cache: %s", src_recipes.name)
 
         # Refresh definitions
         src_defs = self._get_secrets_constructions_path()
         if src_defs.exists():
-            shutil.copy2(src_defs, self._get_cache_constructions_path())
+            shutil.copyfile(src_defs, self._get_cache_constructions_path())
             logger.info("Refreshed cache: %s", src_defs.name)
 
     def _load_secrets_prefix(self):
@@ -5373,11 +6252,9 @@ class BuildingsView(ctk.CTkFrame):
         config = configparser.ConfigParser()
         config.optionxform = str  # Preserve case
 
-        checked_names = [
-            name for name, check_var in self.construction_check_vars.items()
-            if check_var.get()
-        ]
+        checked_names = [name for name, checked in self.secrets_checked.items() if checked]
         config['CheckedItems'] = {name: 'true' for name in checked_names}
+        self._has_checks[ini_path] = bool(checked_names)
 
         ini_path.parent.mkdir(parents=True, exist_ok=True)
         with open(ini_path, 'w', encoding='utf-8') as f:
@@ -5391,20 +6268,24 @@ class BuildingsView(ctk.CTkFrame):
         """
         ini_path = self._get_checked_ini_path()
         if not ini_path.exists():
+            self._has_checks[ini_path] = False
             return set()
 
         config = configparser.ConfigParser()
         config.optionxform = str  # Preserve case
 
+        checked = set()
         try:
             config.read(ini_path, encoding='utf-8')
             if 'CheckedItems' in config:
-                return {name for name, val in config['CheckedItems'].items()
-                        if val.lower() == 'true'}
+                checked = {name for name, val in config['CheckedItems'].items()
+                           if val.lower() == 'true'}
         except (OSError, configparser.Error) as e:
             logger.error("Error loading checked states: %s", e)
+            return checked
 
-        return set()
+        self._has_checks[ini_path] = bool(checked)
+        return checked
 
     def _get_secrets_recipes_path(self) -> Path | None:
         """Get path to recipes JSON in Secrets Source for the current view mode."""
@@ -5480,8 +6361,7 @@ class BuildingsView(ctk.CTkFrame):
 
         for st_path in st_files:
             try:
-                with open(st_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json_file(st_path)
 
                 # Handle array format [{"StringTable": {...}}]
                 if isinstance(data, list) and data:
@@ -5534,6 +6414,19 @@ class BuildingsView(ctk.CTkFrame):
             return entry["name"]
         return internal_name
 
+    def _list_label(self, internal_name: str) -> str:
+        """Get the list label "Display Name (internal_name)" for an item, memoized.
+
+        Falls back to just the internal name when no display name is known.
+        """
+        label_text = self._name_lookup_cache.get(internal_name)
+        if label_text is None:
+            display_name = self._lookup_game_name(internal_name)
+            label_text = (f"{display_name} ({internal_name})"
+                          if display_name != internal_name else internal_name)
+            self._name_lookup_cache[internal_name] = label_text
+        return label_text
+
     def _lookup_game_description(self, internal_name: str) -> str:
         """Look up the game description for an internal recipe name.
 
@@ -5591,8 +6484,7 @@ class BuildingsView(ctk.CTkFrame):
             return recipes
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(json_path)
 
             # Get the exports - typically there's one export with all the rows
             exports = data.get('Exports', [])
@@ -5672,8 +6564,7 @@ class BuildingsView(ctk.CTkFrame):
             return constructions
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(json_path)
 
             # Same structure as recipes
             exports = data.get('Exports', [])
@@ -5800,8 +6691,7 @@ class BuildingsView(ctk.CTkFrame):
             return names
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(json_path)
 
             exports = data.get('Exports', [])
             if exports:
@@ -5833,16 +6723,11 @@ class BuildingsView(ctk.CTkFrame):
             return {}
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            exports = data.get('Exports', [])
-            if exports:
-                table = exports[0].get('Table', {})
-                rows = table.get('Data', [])
-                for row in rows:
-                    if row.get('Name') == name:
-                        return row
+            data, row_index = _load_table_doc(json_path)
+            i = row_index.get(name)
+            if i is not None:
+                # Copied so form edits cannot reach the shared parsed document
+                return copy.deepcopy(_table_rows(data)[i])
 
         except (json.JSONDecodeError, OSError, KeyError) as e:
             logger.error("Error reading row %s from %s: %s", name, json_path, e)
@@ -5856,23 +6741,19 @@ class BuildingsView(ctk.CTkFrame):
             json_path: Path to the JSON file
 
         Returns:
-            Dict mapping row name to full row dict
+            Dict mapping row name to full row dict. The rows belong to the
+            shared parsed document and are only meant to be read.
         """
         rows_by_name = {}
         if not json_path or not json_path.exists():
             return rows_by_name
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            exports = data.get('Exports', [])
-            if exports:
-                table = exports[0].get('Table', {})
-                for row in table.get('Data', []):
-                    name = row.get('Name')
-                    if name:
-                        rows_by_name[name] = row
+            data, _ = _load_table_doc(json_path)
+            for row in _table_rows(data):
+                name = row.get('Name')
+                if name:
+                    rows_by_name[name] = row
 
         except (json.JSONDecodeError, OSError, KeyError) as e:
             logger.error("Error loading rows from %s: %s", json_path, e)
@@ -6019,8 +6900,7 @@ class BuildingsView(ctk.CTkFrame):
             return names
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(json_path)
 
             name_map = data.get('NameMap', [])
             for name in name_map:
@@ -6244,11 +7124,7 @@ class BuildingsView(ctk.CTkFrame):
             recipes: Dict mapping recipe names to their data
         """
         # Clear existing list
-        for widget in self.building_list.winfo_children():
-            widget.destroy()
-        self.building_list_items.clear()
-        self.construction_checkboxes.clear()
-        self.construction_check_vars.clear()
+        self._clear_building_list()
 
         # Update count
         self.count_label.configure(text=f"{len(recipes)} Secrets items")
@@ -6269,64 +7145,63 @@ class BuildingsView(ctk.CTkFrame):
         visibility_map = self._compute_visibility_map(sorted_names)
         visible_icon, hidden_icon, _ = self._get_eye_icons()
 
-        # Create entry for each recipe
-        for recipe_name in sorted_names:
-            row_frame = ctk.CTkFrame(self.building_list, fg_color="transparent")
+        # Checked states persisted in the INI
+        checked_names = self._load_checked_states_from_ini()
+
+        # Fill a pooled row for each recipe, creating rows only past the pool's end;
+        # reused widgets are only reconfigured where their content differs
+        pool = self._secrets_row_pool
+        for index, recipe_name in enumerate(sorted_names):
+            if index < len(pool):
+                row = pool[index]
+            else:
+                row = self._create_secrets_row()
+                pool.append(row)
+            row_frame, checkbox, file_label = row.frame, row.checkbox, row.label
             row_frame.pack(fill="x", pady=1)
 
-            # Checkbox for selection
-            check_var = ctk.BooleanVar(value=False)
-            checkbox = ctk.CTkCheckBox(
-                row_frame,
-                text="",
-                variable=check_var,
-                width=20,
-                command=lambda n=recipe_name: self._on_secrets_checkbox_toggle(n)
-            )
-            checkbox.pack(side="left")
+            # Checkbox for selection; state lives in secrets_checked, not a Tk variable
+            checkbox.configure(command=functools.partial(self._on_secrets_checkbox_toggle, recipe_name))
+            checked = recipe_name in checked_names
+            if bool(checkbox.get()) != checked:
+                if checked:
+                    checkbox.select()
+                else:
+                    checkbox.deselect()
 
             # Store checkbox references using recipe name as key
             self.construction_checkboxes[recipe_name] = checkbox
-            self.construction_check_vars[recipe_name] = check_var
+            self.secrets_checked[recipe_name] = checked
 
             # Display game name with internal name in parentheses
-            display_name = self._lookup_game_name(recipe_name)
-            label_text = (f"{display_name} ({recipe_name})"
-                          if display_name != recipe_name else recipe_name)
+            label_text = self._list_label(recipe_name)
+            if file_label.cget("text") != label_text:
+                file_label.configure(text=label_text)
 
-            file_label = ctk.CTkLabel(
-                row_frame,
-                text=label_text,
-                anchor="w",
-                cursor="hand2",
-                text_color=("gray10", "#E8E8E8")
-            )
-            file_label.pack(side="left", fill="x", expand=True, padx=5)
-            file_label.bind("<Button-1>", lambda e, n=recipe_name: self._load_secrets_recipe(n))
-            row_frame.bind("<Button-1>", lambda e, n=recipe_name: self._load_secrets_recipe(n))
+            # Drop any selection/hover styling left from the row's previous recipe
+            if row_frame.cget("fg_color") != "transparent":
+                row_frame.configure(fg_color="transparent")
+            if file_label.cget("text_color") != SECRETS_LABEL_COLOR:
+                file_label.configure(text_color=SECRETS_LABEL_COLOR)
+
+            # Clicks and hover are dispatched by class tag; the row is found via the owner
+            row_frame.secrets_row = file_label.secrets_row = (recipe_name, file_label)
 
             # Eye visibility icon (right-justified)
             is_visible = visibility_map.get(recipe_name, True)
             eye_icon = visible_icon if is_visible else hidden_icon
-            eye_label = ctk.CTkLabel(
-                row_frame, image=eye_icon, text="", width=20,
-            )
-            eye_label.pack(side="right", padx=(0, 5))
+            if row.eye.cget("image") is not eye_icon:
+                row.eye.configure(image=eye_icon)
 
             # Store reference for highlighting (using recipe_name as key)
-            # Also store label_text for filtering
-            self.building_list_items[recipe_name] = (row_frame, file_label, label_text)
-
-            # Hover effect
-            file_label.bind("<Enter>", lambda e, n=recipe_name, lbl=file_label: self._on_secrets_item_hover(n, lbl, True))
-            file_label.bind("<Leave>", lambda e, n=recipe_name, lbl=file_label: self._on_secrets_item_hover(n, lbl, False))
+            # plus the lowercase internal + display name blob the filter searches
+            self.building_list_items[recipe_name] = (
+                row_frame, file_label, label_text, f"{recipe_name.lower()} {label_text.lower()}")
 
-        # Restore checked states from INI
-        checked_names = self._load_checked_states_from_ini()
-        for name in checked_names:
-            check_var = self.construction_check_vars.get(name)
-            if check_var:
-                check_var.set(True)
+        # Keep at most twice the current row count pooled to bound memory
+        for row in pool[2 * len(sorted_names):]:
+            row.frame.destroy()
+        del pool[2 * len(sorted_names):]
 
         # Apply any active filter
         self._filter_secrets_list()
@@ -6334,6 +7209,33 @@ class BuildingsView(ctk.CTkFrame):
         # Update bulk eye icon based on visibility of all listed items
         self._update_bulk_eye_state()
 
+    def _create_secrets_row(self) -> _SecretsRowRefs:
+        """Create one (unpacked) Secrets list row; content is filled in by the caller."""
+        row_frame = ctk.CTkFrame(self.building_list, fg_color="transparent")
+
+        checkbox = ctk.CTkCheckBox(row_frame, text="", width=20)
+        checkbox.pack(side="left")
+
+        file_label = ctk.CTkLabel(
+            row_frame,
+            text="",
+            anchor="w",
+            cursor="hand2",
+            text_color=SECRETS_LABEL_COLOR
+        )
+        file_label.pack(side="left", fill="x", expand=True, padx=5)
+
+        # pylint: disable=protected-access
+        self._add_bind_tags(row_frame._canvas, SECRETS_ROW_TAG)
+        self._add_bind_tags(file_label._canvas, SECRETS_ROW_TAG, SECRETS_LABEL_TAG)
+        self._add_bind_tags(file_label._label, SECRETS_ROW_TAG, SECRETS_LABEL_TAG)
+        # pylint: enable=protected-access
+
+        eye_label = ctk.CTkLabel(row_frame, text="", width=20)
+        eye_label.pack(side="right", padx=(0, 5))
+
+        return _SecretsRowRefs(row_frame, checkbox, file_label, eye_label)
+
     def _filter_secrets_list(self):
         """Filter the secrets list based on search text."""
         if not self.def_search_var:
@@ -6342,17 +7244,8 @@ class BuildingsView(ctk.CTkFrame):
         filter_text = self.def_search_var.get().lower().strip()
 
         visible_count = 0
-        for name, item_data in self.building_list_items.items():
-            # Handle both old format (2-tuple) and new format (3-tuple with display name)
-            if len(item_data) == 3:
-                row_frame, _, display_name = item_data
-                # Search both internal name and display name
-                searchable = f"{str(name).lower()} {display_name.lower()}"
-            else:
-                row_frame, _ = item_data
-                searchable = str(name).lower() if not isinstance(name, Path) else name.stem.lower()
-
-            if not filter_text or filter_text in searchable:
+        for row_frame, _, _, search_blob in self.building_list_items.values():
+            if not filter_text or filter_text in search_blob:
                 row_frame.pack(fill="x", pady=1)
                 visible_count += 1
             else:
@@ -6366,6 +7259,28 @@ class BuildingsView(ctk.CTkFrame):
             mode_label = "Secrets items" if self.view_mode in ('buildings', 'weapons', 'armor') else "definitions"
             self.count_label.configure(text=f"{total} {mode_label}")
 
+    @staticmethod
+    def _add_bind_tags(widget, *tags: str):
+        """Put class bind tags in front of a widget's own tags."""
+        widget.bindtags(tags + widget.bindtags())
+
+    @staticmethod
+    def _secrets_row_for(event) -> Optional[tuple[str, ctk.CTkLabel]]:
+        """Resolve (recipe_name, label) for an event on a Secrets row's inner widget."""
+        return getattr(event.widget.master, 'secrets_row', None)
+
+    def _on_secrets_row_click(self, event):
+        """Load the recipe for whichever Secrets row was clicked."""
+        row = self._secrets_row_for(event)
+        if row:
+            self._load_secrets_recipe(row[0])
+
+    def _on_secrets_row_hover(self, event):
+        """Apply the hover effect for whichever Secrets row label was entered/left."""
+        row = self._secrets_row_for(event)
+        if row:
+            self._on_secrets_item_hover(row[0], row[1], event.type == EventType.Enter)
+
     def _on_secrets_item_hover(self, recipe_name: str, label: ctk.CTkLabel, entering: bool):
         """Handle hover effect on secrets list items."""
         if recipe_name == self.current_secrets_recipe_name:
@@ -6374,7 +7289,7 @@ class BuildingsView(ctk.CTkFrame):
         if entering:
             label.configure(text_color="#4CAF50")
         else:
-            label.configure(text_color=("gray10", "#E8E8E8"))
+            label.configure(text_color=SECRETS_LABEL_COLOR)
 
     def _load_secrets_recipe(self, recipe_name: str):
         """Load a secrets recipe and display it in the form.
@@ -6413,19 +7328,13 @@ class BuildingsView(ctk.CTkFrame):
 
     def _highlight_secrets_item(self, selected_name: str):
         """Highlight the selected item in the secrets list."""
-        for name, item_data in self.building_list_items.items():
-            # Handle both old format (2-tuple) and new format (3-tuple)
-            if len(item_data) == 3:
-                row_frame, file_label, _ = item_data
-            else:
-                row_frame, file_label = item_data
-
+        for name, (row_frame, file_label, _, _) in self.building_list_items.items():
             if name == selected_name:
                 row_frame.configure(fg_color=("#d0e8ff", "#1a4a6e"))
                 file_label.configure(text_color=("#0066cc", "#66b3ff"))
             else:
                 row_frame.configure(fg_color="transparent")
-                file_label.configure(text_color=("gray10", "#E8E8E8"))
+                file_label.configure(text_color=SECRETS_LABEL_COLOR)
 
     def _extract_secrets_recipe_fields(self, recipe_data: dict) -> dict:
         """Extract editable fields from secrets recipe data.
@@ -6521,13 +7430,12 @@ class BuildingsView(ctk.CTkFrame):
 
         # Hide placeholder and fixed header/footer (new form has its own)
         self.placeholder_label.pack_forget()
-        self.form_header.grid_remove()  # Hide fixed header for new building form
-        self.form_footer.grid_remove()  # Hide fixed footer for new building form
-        self.form_content.pack(fill="both", expand=True)
+        self._hide_form_header_footer()
+        self._ensure_form_content()
 
-        # Clear existing form content
-        for widget in self.form_content.winfo_children():
-            widget.destroy()
+        # Clear existing form content (unpacked until built, as in _show_form)
+        self.form_content.pack_forget()
+        self._clear_form_content()
 
         self.form_vars.clear()
         self.material_rows.clear()
@@ -6540,7 +7448,7 @@ class BuildingsView(ctk.CTkFrame):
         ctk.CTkLabel(
             header_frame,
             text="✨ Create New Building",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, weight="bold"),
             text_color="white"
         ).pack(anchor="w", padx=10, pady=10)
 
@@ -6589,8 +7497,7 @@ class BuildingsView(ctk.CTkFrame):
             text="+ Add Material",
             width=120,
             height=28,
-            fg_color="#4CAF50",
-            hover_color="#45a049",
+            **_FORM_GREEN_BTN,
             command=self._add_new_material_row
         )
         add_mat_btn.pack(anchor="w", pady=(0, 5))
@@ -6609,7 +7516,7 @@ class BuildingsView(ctk.CTkFrame):
 
         # Tags
         self._create_dropdown_field("Tags", "UI.Construction.Category.Advanced.Walls",
-                                    self._get_options("Tags", []))
+                                    self._get_options("Tags"))
 
         # === CREATE BUTTON ===
         sep = ctk.CTkFrame(self.form_content, height=2, fg_color="gray50")
@@ -6625,7 +7532,7 @@ class BuildingsView(ctk.CTkFrame):
             height=40,
             fg_color="#2196F3",
             hover_color="#1976D2",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, weight="bold"),
             command=self._create_new_building
         )
         create_btn.pack(side="left", padx=(0, 10))
@@ -6641,13 +7548,13 @@ class BuildingsView(ctk.CTkFrame):
         )
         cancel_btn.pack(side="left")
 
+        self.form_content.pack(fill="both", expand=True)
+
     def _cancel_new_building(self):
         """Cancel new building creation and show placeholder."""
-        for widget in self.form_content.winfo_children():
-            widget.destroy()
+        self._clear_form_content()
         self.form_content.pack_forget()
-        self.form_header.grid_remove()  # Hide fixed header
-        self.form_footer.grid_remove()  # Hide fixed footer
+        self._hide_form_header_footer()
         self.placeholder_label.pack(pady=50)
         self.form_vars.clear()
         self.material_rows.clear()
@@ -6656,9 +7563,9 @@ class BuildingsView(ctk.CTkFrame):
     def _create_new_building(self):
         """Create a new .def file from the form data."""
         # Validate required fields
-        building_name = self.form_vars.get("BuildingName", ctk.StringVar()).get().strip()
-        display_name = self.form_vars.get("DisplayName", ctk.StringVar()).get().strip()
-        actor_path = self.form_vars.get("Actor", ctk.StringVar()).get().strip()
+        building_name = self.form_vars["BuildingName"].get().strip()
+        display_name = self.form_vars["DisplayName"].get().strip()
+        actor_path = self.form_vars["Actor"].get().strip()
 
         if not building_name:
             self._set_status("Building Name is required", is_error=True)
@@ -6717,9 +7624,9 @@ class BuildingsView(ctk.CTkFrame):
         Returns:
             Complete XML string with recipe and construction JSON embedded
         """
-        title = self.form_vars.get("Title", ctk.StringVar()).get() or building_name
-        author = self.form_vars.get("Author", ctk.StringVar()).get() or "Moria MOD Creator"
-        description = self.form_vars.get("DefDescription", ctk.StringVar()).get() or ""
+        title = self.form_vars["Title"].get() or building_name
+        author = self.form_vars["Author"].get() or "Moria MOD Creator"
+        description = self.form_vars["DefDescription"].get() or ""
 
         # Build recipe JSON (DT_ConstructionRecipes entry)
         recipe_json = self._build_new_recipe_json(building_name)
@@ -6765,40 +7672,31 @@ class BuildingsView(ctk.CTkFrame):
             Complete recipe dict matching the game's expected format
         """
         # Collect materials from form rows (excluding removed entries)
-        materials = []
-        for row in self.material_rows:
-            if row.get("removed"):
-                continue
-            mat_name = row["material_var"].get()
-            try:
-                mat_amount = int(row["amount_var"].get())
-            except ValueError:
-                mat_amount = 1
-            materials.append(self._build_material_entry(mat_name, mat_amount))
+        materials = self._build_material_entries(self.material_rows, "DefaultRequiredMaterials")
 
         return {
             "Name": name,
             "Value": [
                 {"$type": ENUM_TYPE, "Name": "BuildProcess",
-                 "Value": self.form_vars.get("BuildProcess", ctk.StringVar()).get()},
+                 "Value": self.form_vars["BuildProcess"].get()},
                 {"$type": ENUM_TYPE, "Name": "LocationRequirement",
-                 "Value": self.form_vars.get("LocationRequirement", ctk.StringVar()).get()},
+                 "Value": self.form_vars["LocationRequirement"].get()},
                 {"$type": ENUM_TYPE, "Name": "PlacementType",
-                 "Value": self.form_vars.get("PlacementType", ctk.StringVar()).get()},
+                 "Value": self.form_vars["PlacementType"].get()},
                 {"$type": BOOL_TYPE, "Name": "bOnWall",
-                 "Value": self.form_vars.get("bOnWall", ctk.BooleanVar()).get()},
+                 "Value": self.form_vars["bOnWall"].get()},
                 {"$type": BOOL_TYPE, "Name": "bOnFloor",
-                 "Value": self.form_vars.get("bOnFloor", ctk.BooleanVar()).get()},
+                 "Value": self.form_vars["bOnFloor"].get()},
                 {"$type": BOOL_TYPE, "Name": "bPlaceOnWater",
-                 "Value": self.form_vars.get("bPlaceOnWater", ctk.BooleanVar()).get()},
+                 "Value": self.form_vars["bPlaceOnWater"].get()},
                 {"$type": ENUM_TYPE, "Name": "FoundationRule",
-                 "Value": self.form_vars.get("FoundationRule", ctk.StringVar()).get()},
+                 "Value": self.form_vars["FoundationRule"].get()},
                 {"$type": BOOL_TYPE, "Name": "bAutoFoundation",
-                 "Value": self.form_vars.get("bAutoFoundation", ctk.BooleanVar()).get()},
+                 "Value": self.form_vars["bAutoFoundation"].get()},
                 {"$type": BOOL_TYPE, "Name": "bAllowRefunds",
-                 "Value": self.form_vars.get("bAllowRefunds", ctk.BooleanVar()).get()},
+                 "Value": self.form_vars["bAllowRefunds"].get()},
                 {"$type": BOOL_TYPE, "Name": "bOnlyOnVoxel",
-                 "Value": self.form_vars.get("bOnlyOnVoxel", ctk.BooleanVar()).get()},
+                 "Value": self.form_vars["bOnlyOnVoxel"].get()},
                 {"$type": ENUM_TYPE, "Name": "EnabledState",
                  "Value": "ERowEnabledState::Live"},
                 {"$type": ARRAY_TYPE, "Name": "DefaultRequiredMaterials",
@@ -6819,10 +7717,10 @@ class BuildingsView(ctk.CTkFrame):
         Returns:
             Complete construction dict matching the game's expected format
         """
-        display_name = self.form_vars.get("DisplayName", ctk.StringVar()).get()
-        description = self.form_vars.get("Description", ctk.StringVar()).get()
-        actor_path = self.form_vars.get("Actor", ctk.StringVar()).get()
-        tag = self.form_vars.get("Tags", ctk.StringVar()).get()
+        display_name = self.form_vars["DisplayName"].get()
+        description = self.form_vars["Description"].get()
+        actor_path = self.form_vars["Actor"].get()
+        tag = self.form_vars["Tags"].get()
 
         return {
             "Name": name,
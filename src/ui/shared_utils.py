@@ -153,7 +153,7 @@ def update_buildings_ini_from_json() -> tuple[bool, str]:
             existing_values = set()
             if config.has_section(section):
                 existing_str = config.get(section, 'values', fallback='')
-                existing_values = {v.strip() for v in existing_str.split('|') if v.strip()}
+                existing_values = set(filter(None, map(str.strip, existing_str.split('|'))))
             else:
                 config.add_section(section)
 
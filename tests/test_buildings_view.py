@@ -1,17 +1,45 @@
 """Unit tests for the buildings view module."""
 
 import json
+import os
 import tempfile
 import shutil
+from collections import defaultdict
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.ui.buildings_view import (
+    BuildingsView,
     parse_def_file,
     extract_recipe_fields,
     extract_construction_fields,
     FIELD_DESCRIPTIONS,
+    CACHE_SIGNATURE_SECTION,
+    _load_cached_options,
+    _load_cache_signature,
+    _save_cached_options,
+    _options_source_signature,
+    _merge_sorted_unique,
+    _deep_eq,
+    _write_if_changed,
+    _load_json_file,
+    _load_table_doc,
+    _parse_json,
+    _parse_form_float,
+    _dump_json_compact,
+    _dump_json_indented,
+    _iter_combined_def,
+    _write_combined_def,
+    _iter_change_lines,
+    _collect_icon_imports,
+    _property_kind,
+    _property_class,
+    _escape_xml,
+    _split_comma_list,
+    _diff_nested,
+    _encode_lines,
 )
 
 
@@ -389,3 +417,570 @@ class TestFieldTooltip:
         """Test that FieldTooltip can be imported."""
         from src.ui.buildings_view import FieldTooltip
         assert FieldTooltip is not None
+
+
+class TestCachedOptions:
+    """Tests for the dropdown options INI cache and its source signature."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = Path(self.temp_dir) / "buildings_cache.ini"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_excludes_signature(self):
+        """Test that the signature section is not loaded as an option category."""
+        options = {"Materials": ["Item.Wood", "Item.Stone"], "Tags": ["Tag.A"]}
+        _save_cached_options(self.cache_path, options, "1:2:3")
+
+        loaded = _load_cached_options(self.cache_path)
+
+        assert CACHE_SIGNATURE_SECTION not in loaded
+        assert loaded == {"Materials": ["Item.Stone", "Item.Wood"], "Tags": ["Tag.A"]}
+        assert _load_cache_signature(self.cache_path) == "1:2:3"
+
+    def test_signature_missing(self):
+        """Test that a cache without a signature (or no cache) reads as empty."""
+        assert _load_cache_signature(self.cache_path) == ""
+
+        _save_cached_options(self.cache_path, {"Tags": ["Tag.A"]})
+        assert _load_cache_signature(self.cache_path) == ""
+
+    @patch('src.ui.buildings_view._game_construction_json_paths')
+    def test_source_signature_tracks_mtimes(self, mock_paths):
+        """Test that the signature changes with source mtimes and missing files."""
+        recipes = Path(self.temp_dir) / "DT_ConstructionRecipes.json"
+        mock_paths.return_value = [recipes]
+        buildings_dir = Path(self.temp_dir)
+        os.utime(buildings_dir, ns=(1_000, 1_000))
+
+        missing = _options_source_signature(buildings_dir)
+        assert missing == "1000:0"
+
+        recipes.write_text("{}")
+        os.utime(recipes, ns=(2_000, 2_000))
+        os.utime(buildings_dir, ns=(1_000, 1_000))
+        assert _options_source_signature(buildings_dir) == "1000:2000"
+
+        os.utime(buildings_dir, ns=(3_000, 3_000))
+        assert _options_source_signature(buildings_dir) == "3000:2000"
+
+    def test_merge_sorted_unique(self):
+        """Test merging sorted option lists drops duplicates and keeps order."""
+        merged = _merge_sorted_unique(["Item.A", "Item.C", "Item.D"], ["Item.B", "Item.C", "Item.E"])
+        assert merged == ["Item.A", "Item.B", "Item.C", "Item.D", "Item.E"]
+        assert _merge_sorted_unique([], ["Item.A"]) == ["Item.A"]
+        assert _merge_sorted_unique(["Item.A"], []) == ["Item.A"]
+
+
+class TestDeepEq:
+    """Tests for the _deep_eq diff helper."""
+
+    def test_key_order_independent(self):
+        """Test dicts with the same items compare equal regardless of key order."""
+        a = {"Name": "Amount", "Value": [1, {"x": 1, "y": 2}]}
+        b = {"Value": [1, {"y": 2, "x": 1}], "Name": "Amount"}
+        assert _deep_eq(a, b)
+
+    def test_value_change_detected(self):
+        """Test a changed nested value, list order or length is not equal."""
+        base = {"Name": "Amount", "Value": [1, 2]}
+        assert not _deep_eq(base, {"Name": "Amount", "Value": [1, 3]})
+        assert not _deep_eq(base, {"Name": "Amount", "Value": [2, 1]})
+        assert not _deep_eq(base, {"Name": "Amount", "Value": [1, 2, 3]})
+        assert not _deep_eq(base, {"Name": "Amount"})
+
+    def test_nan_values_compare_equal(self):
+        """Test parsed NaN values compare equal, as their JSON text does."""
+        a = _parse_json(b'{"Value": [NaN, 1.5]}')
+        b = _parse_json(b'{"Value": [NaN, 1.5]}')
+        assert _deep_eq(a, b)
+        assert not _deep_eq(a, {"Value": [1.0, 1.5]})
+
+    def test_json_types_stay_distinct(self):
+        """Test values json.dumps would serialize differently are not equal."""
+        assert not _deep_eq({"Value": 1}, {"Value": 1.0})
+        assert not _deep_eq({"Value": True}, {"Value": 1})
+
+
+class TestWriteIfChanged:
+    """Tests for the _write_if_changed .def output helper."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "MODIFY DT_Constructions.def"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_writes_new_and_changed_files(self):
+        """Test a missing or different file is written."""
+        assert _write_if_changed(self.path, b"<definition />")
+        assert self.path.read_bytes() == b"<definition />"
+        assert _write_if_changed(self.path, b"<definition></definition>")
+        assert self.path.read_bytes() == b"<definition></definition>"
+
+    def test_skips_identical_content(self):
+        """Test identical content leaves the file untouched."""
+        self.path.write_bytes(b"<definition />")
+        os.utime(self.path, ns=(1_000_000_000, 1_000_000_000))
+        assert not _write_if_changed(self.path, b"<definition />")
+        assert self.path.stat().st_mtime_ns == 1_000_000_000
+
+    def test_leaves_no_temp_file(self):
+        """Test the temp file used for the replace is gone after a write."""
+        assert _write_if_changed(self.path, b"<definition />")
+        assert os.listdir(self.temp_dir) == [self.path.name]
+
+    def test_retries_replace_while_file_is_open(self):
+        """Test a replace refused while another reader holds the file is retried."""
+        real_replace = os.replace
+        failures = [PermissionError(13, "in use")] * 2
+
+        def flaky_replace(src, dst):
+            if failures:
+                raise failures.pop()
+            real_replace(src, dst)
+
+        with patch('src.ui.buildings_view.os.replace', flaky_replace), \
+                patch('src.ui.buildings_view.time.sleep') as sleep:
+            assert _write_if_changed(self.path, b"<definition />")
+        assert sleep.call_count == 2
+        assert self.path.read_bytes() == b"<definition />"
+        assert os.listdir(self.temp_dir) == [self.path.name]
+
+    def test_gives_up_when_file_stays_open(self):
+        """Test a replace that keeps failing raises and removes the temp file."""
+        with patch('src.ui.buildings_view.os.replace', side_effect=PermissionError(13, "in use")), \
+                patch('src.ui.buildings_view.time.sleep'):
+            with pytest.raises(PermissionError):
+                _write_if_changed(self.path, b"<definition />")
+        assert os.listdir(self.temp_dir) == []
+
+
+class TestLoadJsonFile:
+    """Tests for the _load_json_file helper."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "DT_Constructions.json"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parses_table(self):
+        """Test a table file parses to plain dicts and lists."""
+        data = {"Exports": [{"Table": {"Data": [{"Name": "Wall", "Value": []}]}}]}
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+        assert _load_json_file(self.path) == data
+
+    def test_accepts_nan_literal(self):
+        """Test NaN literals still parse like the stdlib json module."""
+        self.path.write_text('{"Value": NaN}', encoding="utf-8")
+        assert _load_json_file(self.path)["Value"] != _load_json_file(self.path)["Value"]
+
+    def test_invalid_json_raises_json_error(self):
+        """Test invalid content raises json.JSONDecodeError."""
+        self.path.write_text('{"Value": ', encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            _load_json_file(self.path)
+
+    def test_round_trip_keeps_non_finite_floats(self):
+        """Test a load and indented save leaves NaN/Infinity tables unchanged."""
+        text = json.dumps({"Value": [float("nan"), float("-inf"), 1e-05]}, indent=2)
+        self.path.write_text(text, encoding="utf-8")
+        data = _load_json_file(self.path)
+        assert not _write_if_changed(self.path, _dump_json_indented(data))
+        assert self.path.read_text(encoding="utf-8") == text
+
+    def test_round_trip_keeps_crlf_tables(self):
+        """Test a CRLF table written by text-mode json.dump on Windows is left unchanged."""
+        for value in (1.5, float("nan")):
+            raw = json.dumps({"Value": [value, "Wall"]}, indent=2).replace('\n', '\r\n').encode('utf-8')
+            self.path.write_bytes(raw)
+            with patch('src.ui.buildings_view.os.linesep', '\r\n'):
+                data = _load_json_file(self.path)
+                assert not _write_if_changed(self.path, _dump_json_indented(data))
+            assert self.path.read_bytes() == raw
+
+
+class TestLoadTableDoc:
+    """Tests for the _load_table_doc helper."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "DT_Constructions.json"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_rows(self, *names, mtime_ns=1_000_000_000):
+        rows = [{"Name": name, "Value": []} for name in names]
+        data = {"Exports": [{"Table": {"Data": rows}}]}
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_indexes_first_row_per_name(self):
+        """Test the row index keeps the first row of a duplicated Name."""
+        self._write_rows("Wall", "Door", "Wall")
+        _, row_index = _load_table_doc(self.path)
+        assert row_index == {"Wall": 0, "Door": 1}
+
+    def test_reuses_parse_while_unchanged(self):
+        """Test an unchanged file returns the same parsed document."""
+        self._write_rows("Wall")
+        first, _ = _load_table_doc(self.path)
+        second, _ = _load_table_doc(self.path)
+        assert first is second
+
+    def test_bulk_toggle_survives_row_save(self):
+        """Test a row save after a bulk visibility toggle keeps the toggle.
+
+        The toggle leaves the file's size and (restored) mtime unchanged, so
+        only the kept document being updated by the writer protects it.
+        """
+        enum_type = "UAssetAPI.PropertyTypes.Objects.EnumPropertyData, UAssetAPI"
+
+        def row(name, state):
+            return {"Name": name, "Value": [{"$type": enum_type, "Name": "EnabledState", "Value": state}]}
+
+        data = {"Exports": [{"Table": {"Data": [
+            row("Wall", "ERowEnabledState::Unsorted"), row("Door", "ERowEnabledState::Live"),
+        ]}}]}
+        self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        stat = os.stat(self.path)
+        _load_table_doc(self.path)
+
+        view = object.__new__(BuildingsView)
+        view._get_cache_constructions_path = lambda: self.path
+        view._bulk_set_definition_visibility(["Wall"], make_hidden=True)
+        assert os.stat(self.path).st_size == stat.st_size
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        view._update_row_in_json(self.path, "Door", row("Door", "ERowEnabledState::Disabled"))
+        rows = json.loads(self.path.read_text(encoding="utf-8"))["Exports"][0]["Table"]["Data"]
+        assert [r["Value"][0]["Value"] for r in rows] == [
+            "ERowEnabledState::Disabled", "ERowEnabledState::Disabled",
+        ]
+
+    def test_reparses_after_change(self):
+        """Test a rewritten file is parsed again."""
+        self._write_rows("Wall")
+        _load_table_doc(self.path)
+        self._write_rows("Wall", "Door", mtime_ns=2_000_000_000)
+        _, row_index = _load_table_doc(self.path)
+        assert row_index == {"Wall": 0, "Door": 1}
+
+
+class TestDumpJsonCompact:
+    """Tests for the _dump_json_compact helper."""
+
+    def test_round_trips_imports(self):
+        """Test output parses back to the same import list."""
+        imports = [{"ObjectName": "T_Icon", "OuterIndex": -2, "bImportOptional": False}]
+        assert json.loads(_dump_json_compact(imports)) == imports
+
+    def test_output_is_compact(self):
+        """Test no whitespace separators are emitted."""
+        text = _dump_json_compact({"a": [1, 2], "b": "x"})
+        assert ", " not in text and ": " not in text
+
+
+class TestDumpJsonIndented:
+    """Tests for the _dump_json_indented helper."""
+
+    def test_matches_stdlib_indent_2(self):
+        """Test plain values serialize byte-identical to json.dumps(indent=2, ensure_ascii=False)."""
+        data = {"Exports": [{"Table": {"Data": [
+            {"Name": "Wall_é", "Value": [1, 2.5, None, True], "Empty": {}, "List": []},
+        ]}}]}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        assert _dump_json_indented(data) == expected
+
+    def test_matches_text_mode_line_endings(self):
+        """Test newlines follow os.linesep, as a text-mode json.dump writes them."""
+        data = {"Name": "Wall", "Value": ["a\nb", 1.5]}
+        expected = json.dumps(data, indent=2).replace('\n', '\r\n').encode('utf-8')
+        with patch('src.ui.buildings_view.os.linesep', '\r\n'):
+            assert _dump_json_indented(data) == expected
+            with patch('src.ui.buildings_view.HAS_ORJSON', False):
+                assert _dump_json_indented(data) == expected
+
+    def test_uses_orjson_when_installed(self):
+        """Test the orjson branch runs when orjson is available."""
+        orjson = pytest.importorskip("orjson")
+        data = {"Value": [1e-05, 0.1]}
+        assert _dump_json_indented(data) == orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def test_small_exponent_floats_keep_their_value(self):
+        """Test floats orjson spells differently still load back equal."""
+        data = {"Value": [1e-05, 1e+16, 2.5e-300]}
+        assert json.loads(_dump_json_indented(data)) == data
+
+    def test_keeps_non_finite_floats(self):
+        """Test parsed NaN and Infinity are written back as literals, not null."""
+        raw = b'{"Value": [NaN, Infinity, -Infinity, 1.5]}'
+        text = _dump_json_indented(_parse_json(raw)).decode('utf-8')
+        assert "null" not in text
+        assert json.loads(text, parse_constant=str)["Value"][:3] == ["NaN", "Infinity", "-Infinity"]
+
+    def test_keeps_non_finite_form_floats(self):
+        """Test NaN/Infinity entered in a form field are written as literals."""
+        text = _dump_json_indented({"Value": [_parse_form_float("inf"), _parse_form_float("nan")]})
+        assert b"null" not in text
+        assert b"Infinity" in text and b"NaN" in text
+
+    def test_stdlib_branch_keeps_non_finite_floats(self):
+        """Test the json branch writes the same literals without orjson."""
+        data = _parse_json(b'{"Value": [NaN, -Infinity]}')
+        with patch('src.ui.buildings_view.HAS_ORJSON', False):
+            text = _dump_json_indented(data)
+        assert text == json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class TestIterCombinedDef:
+    """Tests for the _iter_combined_def generator."""
+
+    def test_full_pack_layout(self):
+        """Test both mod sections, imports and escaping in the joined output."""
+        text = "".join(_iter_combined_def(
+            "Pack & Co",
+            [("Recipe_A", '{"Name":"Recipe_A"}')],
+            [("Wall", '{"Name":"Wall"}')],
+            [{"ObjectName": "T_Wall"}],
+        ))
+        assert text.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<definition>\n')
+        assert "<title>Pack &amp; Co</title>" in text
+        assert "with 1 recipes and 1 constructions" in text
+        assert '<add_imports><![CDATA[[{"ObjectName":"T_Wall"}]]]></add_imports>' in text
+        assert text.index("DT_ConstructionRecipes.json") < text.index("DT_Constructions.json")
+        assert text.endswith("    </add_row>\n\n  </mod>\n</definition>")
+
+    def test_empty_pack_has_no_mod_sections(self):
+        """Test a pack without rows or imports only writes the header."""
+        text = "".join(_iter_combined_def("Empty", [], [], []))
+        assert "<mod" not in text
+        assert text.endswith("</description>\n\n</definition>")
+
+
+class TestWriteCombinedDef:
+    """Tests for the _write_combined_def helper."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "Pack.def"
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_merges_duplicate_imports(self):
+        """Test imports repeated across constructions are written once."""
+        imports = [{"ObjectName": "T_Wall"}, {"ObjectName": "T_Wall"}, {"ObjectName": ""}]
+        _write_combined_def(self.path, "Pack", [], [("Wall", "{}")], imports)
+        text = self.path.read_text(encoding="utf-8")
+        assert '<add_imports><![CDATA[[{"ObjectName":"T_Wall"}]]]></add_imports>' in text
+        assert '<add_row name="Wall">' in text
+
+
+class TestIterChangeLines:
+    """Tests for the _iter_change_lines generator."""
+
+    def test_escapes_every_field(self):
+        """Test item, property and value are all XML-escaped."""
+        lines = list(_iter_change_lines([("A&B", "Tags<0>", '"x"'), ("A&B", "Cost", 5)]))
+        assert lines == [
+            '    <change item="A&amp;B" property="Tags&lt;0&gt;" value="&quot;x&quot;" />',
+            '    <change item="A&amp;B" property="Cost" value="5" />',
+        ]
+
+    def test_item_switch_is_escaped(self):
+        """Test a new item after a run of another item gets its own name."""
+        lines = list(_iter_change_lines([("A", "P", 1), ("B<", "P", 1), ("A", "P", 1)]))
+        assert [line.split('"')[1] for line in lines] == ["A", "B&lt;", "A"]
+
+
+class TestCollectIconImports:
+    """Tests for the _collect_icon_imports helper."""
+
+    IMPORTS = [
+        {"ObjectName": "/Game/UI/T_Wall"},
+        {"ObjectName": "T_Wall"},
+        {"ObjectName": "/Game/UI/T_Door"},
+        {"ObjectName": "T_Door"},
+    ]
+
+    @staticmethod
+    def _row(name, icon):
+        return {"Name": name, "Value": [{"Name": "Tags", "Value": []}, {"Name": "Icon", "Value": icon}]}
+
+    def test_collects_package_and_texture(self):
+        """Test an Icon of -2 pulls Imports[0] and Imports[1]."""
+        rows = [self._row("Wall", -2), self._row("Door", -4)]
+        assert _collect_icon_imports(rows, ["Wall"], self.IMPORTS) == self.IMPORTS[:2]
+
+    def test_dedups_shared_imports(self):
+        """Test imports shared by several rows appear once, in first-use order."""
+        rows = [self._row("Door", -4), self._row("Wall", -2), self._row("Door2", -4)]
+        result = _collect_icon_imports(rows, ["Wall", "Door", "Door2"], self.IMPORTS)
+        assert result == [self.IMPORTS[2], self.IMPORTS[3], self.IMPORTS[0], self.IMPORTS[1]]
+
+    def test_ignores_non_import_icons(self):
+        """Test positive, zero, non-int and out-of-range icons are skipped."""
+        rows = [self._row("A", 3), self._row("B", 0), self._row("C", "-2"), self._row("D", -9)]
+        assert _collect_icon_imports(rows, ["A", "B", "C", "D"], self.IMPORTS) == []
+
+    def test_row_without_icon(self):
+        """Test rows with no Icon property contribute nothing."""
+        rows = [{"Name": "Wall", "Value": [{"Name": "Tags", "Value": []}]}, {"Name": "Door"}]
+        assert _collect_icon_imports(rows, ["Wall", "Door"], self.IMPORTS) == []
+
+
+class TestPropertyKind:
+    """Tests for the _property_kind diff dispatch helper."""
+
+    def test_known_kinds(self):
+        """Test UAssetAPI $type strings map to their diff kind."""
+        assert _property_kind("UAssetAPI.PropertyTypes.Objects.BoolPropertyData, UAssetAPI") == "scalar"
+        assert _property_kind("UAssetAPI.PropertyTypes.Objects.EnumPropertyData, UAssetAPI") == "scalar"
+        assert _property_kind("UAssetAPI.PropertyTypes.Objects.TextPropertyData, UAssetAPI") == "text"
+        assert _property_kind("UAssetAPI.PropertyTypes.Objects.SoftObjectPropertyData, UAssetAPI") == "softobj"
+        assert _property_kind("UAssetAPI.PropertyTypes.Structs.StructPropertyData, UAssetAPI") == "struct"
+        assert _property_kind("UAssetAPI.PropertyTypes.Objects.ArrayPropertyData, UAssetAPI") == "array"
+
+    def test_unknown_kind(self):
+        """Test unrecognized or missing $type falls back to 'other'."""
+        assert _property_kind("UAssetAPI.PropertyTypes.Objects.ObjectPropertyData, UAssetAPI") == "other"
+        assert _property_kind("") == "other"
+
+
+class TestPropertyClass:
+    """Tests for the _property_class $type helper."""
+
+    def test_class_name(self):
+        """Test the namespace and assembly are stripped from a $type string."""
+        assert _property_class("UAssetAPI.PropertyTypes.Objects.BytePropertyData, UAssetAPI") == "BytePropertyData"
+
+    def test_bare_and_empty(self):
+        """Test a bare class name is returned as-is and an empty $type stays empty."""
+        assert _property_class("IntPropertyData") == "IntPropertyData"
+        assert _property_class("") == ""
+
+    def test_unqualified_type_names(self):
+        """Test bare or unusual $type strings still classify by token."""
+        assert _property_kind("IntPropertyData") == "scalar"
+        assert _property_kind("Custom.MyStructPropertyData, Game") == "struct"
+
+
+class TestEscapeXml:
+    """Tests for the _escape_xml helper."""
+
+    def test_escapes_special_characters(self):
+        """Test all five XML special characters are escaped, ampersand first."""
+        assert _escape_xml('<a href="x">Tom & Jerry\'s</a>') == (
+            "&lt;a href=&quot;x&quot;&gt;Tom &amp; Jerry&apos;s&lt;/a&gt;")
+
+    def test_plain_text_unchanged(self):
+        """Test text without special characters is returned as-is."""
+        assert _escape_xml("ResultConstructionHandle.RowName") == "ResultConstructionHandle.RowName"
+
+
+class TestSplitCommaList:
+    """Tests for the _split_comma_list helper."""
+
+    def test_strips_items_and_drops_empty(self):
+        """Test whitespace around items is removed and blank items are skipped."""
+        assert _split_comma_list(" Item.Wood, Item.Stone ,, \t,Item.Iron ") == [
+            "Item.Wood", "Item.Stone", "Item.Iron"]
+
+    def test_blank_text(self):
+        """Test blank text gives an empty list."""
+        assert _split_comma_list("  ") == []
+
+
+class TestDiffNested:
+    """Tests for the iterative _diff_nested struct/array diff."""
+
+    def test_nested_struct_changes_in_order(self):
+        """Test nested struct changes come out depth-first in property order."""
+        orig = [
+            {"Name": "Outer", "Value": [{"Name": "Inner", "Value": 1}, {"Name": "Other", "Value": 2}]},
+            {"Name": "Amount", "Value": 5},
+        ]
+        cache = [
+            {"Name": "Outer", "Value": [{"Name": "Inner", "Value": 3}, {"Name": "Other", "Value": 4}]},
+            {"Name": "Amount", "Value": 6},
+        ]
+        assert _diff_nested("Row", "Handle", orig, cache, "struct") == [
+            ("Row", "Handle.Outer.Inner", "3"),
+            ("Row", "Handle.Outer.Other", "4"),
+            ("Row", "Handle.Amount", "6"),
+        ]
+
+    def test_array_elements(self):
+        """Test array diffs index struct elements and plain values."""
+        orig = [{"Value": [{"Name": "Count", "Value": 1}]}, {"Value": "Item.A"}, "x"]
+        cache = [{"Value": [{"Name": "Count", "Value": 2}]}, {"Value": "Item.B"}, "y"]
+        assert _diff_nested("Row", "Materials", orig, cache, "array") == [
+            ("Row", "Materials[0].Count", "2"),
+            ("Row", "Materials[1]", "Item.B"),
+            ("Row", "Materials[2]", "y"),
+        ]
+
+
+class TestEncodeLines:
+    """Tests for the _encode_lines .def output helper."""
+
+    def test_matches_text_mode_write(self):
+        """Test the bytes equal what a text-mode UTF-8 write produces."""
+        lines = ['<definition>', '  <title>Déco "Wall"</title>', '  <![CDATA[{\n  "a": 1\n}]]>', '</definition>']
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = Path(temp_dir) / "text.def"
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines))
+            assert _encode_lines(lines) == path.read_bytes()
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class _FakeVar:
+    """Minimal stand-in for a Tk variable holding a fixed value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class TestBuildNewRecipeJson:
+    """Tests for BuildingsView._build_new_recipe_json materials."""
+
+    def test_material_row_name_is_internal_name(self):
+        """Test a "Display Name (InternalName)" combo value saves only the internal name."""
+        view = object.__new__(BuildingsView)
+        view.form_vars = defaultdict(lambda: _FakeVar(""))
+        view.material_rows = [
+            {"material_var": _FakeVar("Iron Ingot (Item.IronIngot)"), "amount_var": _FakeVar("3")},
+            {"material_var": _FakeVar("Stone (Item.Stone)"), "amount_var": _FakeVar("2"), "removed": True},
+            {"material_var": _FakeVar("Item.Wood"), "amount_var": _FakeVar("x")},
+        ]
+
+        recipe = view._build_new_recipe_json("Wall")
+
+        materials = next(p for p in recipe["Value"] if p["Name"] == "DefaultRequiredMaterials")["Value"]
+        entries = [
+            (m["Value"][0]["Value"][1]["Value"], m["Value"][1]["Value"]) for m in materials
+        ]
+        assert entries == [("Item.IronIngot", 3), ("Item.Wood", 1)]